@@ -18,20 +18,35 @@
 
 import os
 import sys
-import time
+import asyncio
 import argparse
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple, TYPE_CHECKING
 from datetime import datetime
-
-# 添加模块路径
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from pathlib import Path
 
 from modules.logger import get_logger, log_flight_process, log_system_info
 from modules.config_manager import get_config_manager
-from modules.input_handler import InputHandler, read_flight_data
-from modules.web_automation import WebAutomation, create_web_automation
-from modules.data_extractor import DataExtractor, extract_flight_segments
-from modules.output_handler import OutputHandler, save_flight_data, create_summary_report
+
+# 输入、浏览器、数据提取和输出模块依赖openpyxl、Selenium、OCR等重量级库，
+# 在首次使用的方法中再导入，--sample/--version/--help不需要加载它们
+if TYPE_CHECKING:
+    from modules.web_automation import WebAutomation
+
+
+# 结果和统计信息中的时间格式
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class FlightTask(NamedTuple):
+    """
+    航班查询任务
+    
+    读取输入后一次性从航班信息字典中解包，处理过程中直接按属性访问
+    """
+    index: int
+    flight_number: str
+    departure_date: str
 
 
 class FlightCrawler:
@@ -60,13 +75,23 @@ class FlightCrawler:
         self.output_config = self.config_manager.get_output_config()
         
         # 初始化各功能模块
+        from modules.input_handler import InputHandler
+        from modules.data_extractor import DataExtractor
+        from modules.output_handler import OutputHandler
+        
         self.input_handler = InputHandler()
-        self.web_automation = None
+        self.driver_pool = None
         self.data_extractor = DataExtractor()
         self.output_handler = OutputHandler()
+        self.output_writer = None
+        
+        # 按输入顺序写出结果：先完成的航班暂存，等前面的航班完成后再写入
+        self._pending_segments: Dict[int, List[Dict[str, Any]]] = {}
+        self._next_write_index = 1
         
         # 运行统计
         self.start_time = None
+        self._start_time_str = ''
         self.total_flights = 0
         self.successful_flights = 0
         self.total_segments = 0
@@ -87,86 +112,58 @@ class FlightCrawler:
             运行结果字典
         """
         self.start_time = datetime.now()
+        self._start_time_str = self.start_time.strftime(TIME_FORMAT)
         
         try:
             if self.logger:
                 log_system_info(f"开始运行航班数据爬取，输入文件: {input_file}")
             
-            # 步骤1: 读取输入数据
-            flight_list = self._load_input_data(input_file)
-            if not flight_list:
-                return self._create_result(False, "输入数据为空或读取失败")
-            
-            self.total_flights = len(flight_list)
-            
-            # 步骤2: 初始化浏览器
-            if not self._initialize_browser():
-                return self._create_result(False, "浏览器初始化失败")
-            
-            # 步骤3: 处理每个航班查询
-            all_segments = []
+            # 步骤1-2: 启动浏览器实例池的同时读取输入数据，浏览器启动耗时被Excel解析掩盖
+            with ThreadPoolExecutor(max_workers=1) as startup_executor:
+                browser_future = startup_executor.submit(self._initialize_browser)
+                flight_list = self._load_input_data(input_file)
+                browser_ready = browser_future.result()
             
             try:
-                for index, flight_info in enumerate(flight_list, 1):
-                    if self.logger:
-                        log_flight_process(
-                            flight_info.get('flight_number', ''),
-                            "航班处理",
-                            "开始",
-                            f"进度: {index}/{self.total_flights}"
-                        )
-                    
-                    # 处理单个航班
-                    segments = self._process_single_flight(flight_info, index)
-                    
-                    if segments:
-                        all_segments.extend(segments)
-                        self.successful_flights += 1
-                        self.successful_segments += len(segments)
-                        
-                        if self.logger:
-                            log_flight_process(
-                                flight_info.get('flight_number', ''),
-                                "航班处理",
-                                "成功",
-                                f"提取到 {len(segments)} 个航段"
-                            )
-                    else:
-                        if self.logger:
-                            log_flight_process(
-                                flight_info.get('flight_number', ''),
-                                "航班处理",
-                                "失败",
-                                "未提取到有效数据"
-                            )
-                    
-                    self.total_segments += len(segments) if segments else 0
-                    
-                    # 航班间延迟
-                    if index < len(flight_list):
-                        delay = self.retry_config.get('flight_delay', 2)
-                        if delay > 0:
-                            time.sleep(delay)
+                if not flight_list:
+                    return self._create_result(False, "输入数据为空或读取失败")
+                
+                self.total_flights = len(flight_list)
+                
+                if not browser_ready:
+                    return self._create_result(False, "浏览器初始化失败")
+                
+                # 航班数少于实例数时关闭多余的浏览器
+                self.driver_pool.shrink(self.total_flights)
+                
+                # 打开输出文件，航段在每个航班完成后立即写入
+                from modules.output_handler import FlightDataWriter
+                self.output_writer = FlightDataWriter(self.output_handler, output_file)
+                if not self.output_writer.open():
+                    return self._create_result(False, "创建输出文件失败")
+                
+                # 步骤3: 并发处理每个航班查询
+                asyncio.run(self._process_flights_async(flight_list))
             
             finally:
                 # 步骤4: 关闭浏览器
                 self._cleanup_browser()
             
-            # 步骤5: 保存结果
-            if all_segments:
-                save_result = self._save_results(all_segments, output_file)
-                if not save_result['success']:
-                    return self._create_result(False, f"保存结果失败: {save_result['message']}")
-                
-                # 生成统计报告
-                self._generate_summary_report(save_result.get('statistics', {}))
-                
-                return self._create_result(True, "爬取完成", {
-                    'output_file': save_result['file_path'],
-                    'statistics': save_result['statistics']
-                })
-            else:
+            # 步骤5: 完成结果文件
+            save_result = self._save_results()
+            if self.successful_segments == 0:
                 return self._create_result(False, "未提取到任何有效数据")
+            
+            if not save_result['success']:
+                return self._create_result(False, f"保存结果失败: {save_result['message']}")
+            
+            # 生成统计报告
+            self._generate_summary_report(save_result.get('statistics', {}))
+            
+            return self._create_result(True, "爬取完成", {
+                'output_file': save_result['file_path'],
+                'statistics': save_result['statistics']
+            })
                 
         except Exception as e:
             error_msg = f"运行过程中发生异常: {str(e)}"
@@ -175,6 +172,13 @@ class FlightCrawler:
             return self._create_result(False, error_msg)
         
         finally:
+            # 异常退出时也关闭输出文件，保留已写入的航段
+            if self.output_writer and not self.output_writer.closed:
+                self._save_results()
+            
+            # 配置了ocr.result_cache_file时保存时间识别结果，供下次运行使用
+            self.data_extractor.ocr_processor.save_result_cache()
+            
             # 记录运行统计
             self._log_final_statistics()
     
@@ -194,6 +198,7 @@ class FlightCrawler:
                     self.logger.error(f"输入文件不存在: {input_file}")
                 return []
             
+            from modules.input_handler import read_flight_data
             flight_list = read_flight_data(input_file)
             
             if self.logger:
@@ -208,21 +213,27 @@ class FlightCrawler:
     
     def _initialize_browser(self) -> bool:
         """
-        初始化浏览器
+        初始化浏览器实例池
+        
+        与输入读取并行执行，此时航班总数未知，按配置的pool_size启动，
+        读取完成后再由run()缩减到航班总数
         
         Returns:
             是否成功
         """
         try:
-            self.web_automation = create_web_automation()
+            pool_size = max(1, self.browser_config.get('pool_size', 2))
+            
+            from modules.web_automation import DriverPool
+            self.driver_pool = DriverPool(pool_size)
             
-            if not self.web_automation.start_browser():
+            if self.driver_pool.start() == 0:
                 if self.logger:
                     self.logger.error("浏览器启动失败")
                 return False
             
             if self.logger:
-                log_system_info("浏览器初始化成功")
+                log_system_info(f"浏览器初始化成功，实例数: {len(self.driver_pool.workers)}")
             
             return True
             
@@ -231,84 +242,162 @@ class FlightCrawler:
                 self.logger.error(f"浏览器初始化异常: {str(e)}")
             return False
     
-    def _process_single_flight(self, flight_info: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+    async def _process_flights_async(self, flight_list: List[Dict[str, Any]]) -> None:
         """
-        处理单个航班查询
+        使用浏览器实例池并发处理所有航班，结果按输入顺序写入输出文件
+        
+        Args:
+            flight_list: 航班信息列表
+        """
+        worker_count = len(self.driver_pool.workers)
+        self.driver_pool.bind_queue()
+        semaphore = asyncio.BoundedSemaphore(worker_count)
+        
+        # 延迟配置和日志开关在循环前读取一次
+        delays = (self.config_manager.retry.flight_delay, self.config_manager.retry.result_timeout)
+        log_enabled = self.logger is not None
+        
+        self._pending_segments = {}
+        self._next_write_index = 1
+        
+        tasks = [
+            FlightTask(index, flight_info.get('flight_number', ''), flight_info.get('departure_date', ''))
+            for index, flight_info in enumerate(flight_list, 1)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            await asyncio.gather(*[
+                self._process_single_flight_async(task, semaphore, executor, delays, log_enabled)
+                for task in tasks
+            ])
+    
+    def _write_segments_in_order(self, index: int, segments: List[Dict[str, Any]]) -> None:
+        """
+        按航班输入顺序把航段写入输出文件
         
         Args:
-            flight_info: 航班信息
             index: 航班索引
-            
-        Returns:
-            航段数据列表
+            segments: 该航班的航段数据列表
         """
-        flight_number = flight_info.get('flight_number', '')
-        departure_date = flight_info.get('departure_date', '')
+        self._pending_segments[index] = segments
         
-        try:
-            # 导航到查询页面
-            if not self.web_automation.navigate_to_query_page():
-                if self.logger:
-                    log_flight_process(flight_number, "页面导航", "失败")
-                return []
-            
-            # 填写查询表单
-            if not self.web_automation.fill_query_form(flight_number, departure_date):
-                if self.logger:
-                    log_flight_process(flight_number, "表单填写", "失败")
-                return []
-            
-            # 处理验证码并提交查询
-            if not self.web_automation.handle_captcha_and_submit(flight_number):
-                if self.logger:
-                    log_flight_process(flight_number, "验证码处理", "失败")
-                return []
-            
-            # 等待结果页面加载
-            time.sleep(self.retry_config.get('page_load_delay', 3))
+        while self._next_write_index in self._pending_segments:
+            self.output_writer.write_segments(self._pending_segments.pop(self._next_write_index))
+            self._next_write_index += 1
+    
+    async def _process_single_flight_async(self, task: FlightTask,
+                                           semaphore: asyncio.BoundedSemaphore,
+                                           executor: ThreadPoolExecutor,
+                                           delays: Tuple[float, float],
+                                           log_enabled: bool = True) -> None:
+        """
+        借用一个浏览器实例处理单个航班
+        
+        Selenium调用是同步的，放到线程池中执行；航班间延迟只作用于当前浏览器实例。
+        处理结果直接写入输出文件
+        
+        Args:
+            task: 航班查询任务
+            semaphore: 限制并发数量的信号量
+            executor: 执行Selenium调用的线程池
+            delays: (航班间延迟, 结果页面加载超时)，单位秒
+            log_enabled: 是否记录航班处理日志
+        """
+        index, flight_number = task.index, task.flight_number
+        flight_delay, result_timeout = delays
+        
+        async with semaphore:
+            web_automation = await self.driver_pool.acquire()
             
-            # 提取航段数据
-            segments = extract_flight_segments(
-                self.web_automation.driver, flight_number, departure_date
-            )
+            try:
+                if log_enabled:
+                    log_flight_process(
+                        flight_number,
+                        "航班处理",
+                        "开始",
+                        f"进度: {index}/{self.total_flights}"
+                    )
+                
+                loop = asyncio.get_running_loop()
+                segments = await loop.run_in_executor(
+                    executor, self._process_single_flight, web_automation, task, result_timeout
+                )
+                
+                if segments:
+                    self.successful_flights += 1
+                    self.successful_segments += len(segments)
+                    
+                    if log_enabled:
+                        log_flight_process(
+                            flight_number,
+                            "航班处理",
+                            "成功",
+                            f"提取到 {len(segments)} 个航段"
+                        )
+                else:
+                    if log_enabled:
+                        log_flight_process(
+                            flight_number,
+                            "航班处理",
+                            "失败",
+                            "未提取到有效数据"
+                        )
+                
+                self.total_segments += len(segments) if segments else 0
+                self._write_segments_in_order(index, segments or [])
+                
+                # 同一浏览器实例的航班间延迟，期间在线程池中为下一个航班准备查询表单
+                if index < self.total_flights and flight_delay > 0:
+                    await asyncio.gather(
+                        asyncio.sleep(flight_delay),
+                        loop.run_in_executor(executor, web_automation.prepare_query_page)
+                    )
             
-            return segments
+            finally:
+                self.driver_pool.release(web_automation)
+    
+    def _process_single_flight(self, web_automation: 'WebAutomation', task: FlightTask,
+                               result_timeout: float = 10) -> List[Dict[str, Any]]:
+        """
+        处理单个航班查询
+        
+        Args:
+            web_automation: 本次查询使用的浏览器实例
+            task: 航班查询任务
+            result_timeout: 提交查询后等待结果列表出现的最长时间（秒）
             
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"处理航班 {flight_number} 时发生异常: {str(e)}")
-            return []
+        Returns:
+            航段数据列表
+        """
+        from modules.data_extractor import query_flight_segments
+        return query_flight_segments(web_automation, task.flight_number, task.departure_date, result_timeout)
     
     def _cleanup_browser(self):
         """
         清理浏览器资源
         """
         try:
-            if self.web_automation:
-                self.web_automation.close_browser()
+            if self.driver_pool:
+                self.driver_pool.close()
                 if self.logger:
                     log_system_info("浏览器已关闭")
         except Exception as e:
             if self.logger:
                 self.logger.error(f"关闭浏览器时发生异常: {str(e)}")
     
-    def _save_results(self, segments: List[Dict[str, Any]], output_file: Optional[str] = None) -> Dict[str, Any]:
+    def _save_results(self) -> Dict[str, Any]:
         """
-        保存结果数据
+        关闭流式输出文件，完成结果保存
         
-        Args:
-            segments: 航段数据列表
-            output_file: 输出文件名
-            
         Returns:
             保存结果
         """
         try:
-            result = save_flight_data(segments, output_file)
+            result = self.output_writer.close()
             
             if result['success'] and self.logger:
                 self.logger.info(f"结果保存成功: {result['file_path']}")
-                self.logger.info(f"共保存 {len(segments)} 条航段数据")
+                self.logger.info(f"共保存 {result['row_count']} 条航段数据")
             
             return result
             
@@ -331,6 +420,7 @@ class FlightCrawler:
         """
         try:
             if self.output_config.get('generate_summary', True):
+                from modules.output_handler import create_summary_report
                 result = create_summary_report(statistics)
                 
                 if result['success'] and self.logger:
@@ -357,8 +447,8 @@ class FlightCrawler:
         result = {
             'success': success,
             'message': message,
-            'start_time': self.start_time.strftime('%Y-%m-%d %H:%M:%S') if self.start_time else '',
-            'end_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'start_time': self._start_time_str,
+            'end_time': datetime.now().strftime(TIME_FORMAT),
             'total_flights': self.total_flights,
             'successful_flights': self.successful_flights,
             'total_segments': self.total_segments,
@@ -380,18 +470,24 @@ class FlightCrawler:
         end_time = datetime.now()
         duration = end_time - self.start_time
         
-        self.logger.info("=" * 50)
-        self.logger.info("航班数据爬取完成 - 最终统计")
-        self.logger.info(f"开始时间: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info(f"结束时间: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info(f"总耗时: {duration}")
-        self.logger.info(f"总航班数: {self.total_flights}")
-        self.logger.info(f"成功航班数: {self.successful_flights}")
-        self.logger.info(f"航班成功率: {(self.successful_flights/self.total_flights*100):.2f}%" if self.total_flights > 0 else "航班成功率: 0%")
-        self.logger.info(f"总航段数: {self.total_segments}")
-        self.logger.info(f"成功航段数: {self.successful_segments}")
-        self.logger.info(f"航段成功率: {(self.successful_segments/self.total_segments*100):.2f}%" if self.total_segments > 0 else "航段成功率: 0%")
-        self.logger.info("=" * 50)
+        flight_rate = self.successful_flights / self.total_flights * 100 if self.total_flights else 0
+        segment_rate = self.successful_segments / self.total_segments * 100 if self.total_segments else 0
+        
+        # 合并为一条日志输出，避免逐行写入文件
+        self.logger.info("\n".join([
+            "=" * 50,
+            "航班数据爬取完成 - 最终统计",
+            f"开始时间: {self._start_time_str}",
+            f"结束时间: {end_time.strftime(TIME_FORMAT)}",
+            f"总耗时: {duration}",
+            f"总航班数: {self.total_flights}",
+            f"成功航班数: {self.successful_flights}",
+            f"航班成功率: {flight_rate:.2f}%",
+            f"总航段数: {self.total_segments}",
+            f"成功航段数: {self.successful_segments}",
+            f"航段成功率: {segment_rate:.2f}%",
+            "=" * 50,
+        ]))
 
 
 def create_sample_input():
@@ -401,10 +497,10 @@ def create_sample_input():
     try:
         from modules.input_handler import create_sample_input_file
         
-        input_dir = 'input'
-        os.makedirs(input_dir, exist_ok=True)
+        input_dir = Path('input')
+        input_dir.mkdir(parents=True, exist_ok=True)
         
-        sample_file = os.path.join(input_dir, 'sample_flights.xlsx')
+        sample_file = str(input_dir / 'sample_flights.xlsx')
         
         if create_sample_input_file(sample_file):
             print(f"示例输入文件创建成功: {sample_file}")
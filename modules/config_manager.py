@@ -9,11 +9,82 @@
 - 配置更新和保存
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, Optional
+from types import SimpleNamespace
+from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# 以属性方式暴露的配置分组
+_SECTION_NAMES = ('browser', 'ocr', 'retry', 'output', 'logging', 'website', 'xpath')
+
+# 预先格式化XPath的最大航段索引（与数据提取模块的航段检测上限一致）
+MAX_SEGMENTS = 10
+
+
+def _loads(data: bytes) -> Any:
+    """
+    解析JSON字节串，orjson可用时优先使用
+    
+    Args:
+        data: JSON字节串
+        
+    Returns:
+        解析结果
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    序列化为带2空格缩进的UTF-8 JSON字节串，orjson可用时优先使用
+    
+    Args:
+        obj: 待序列化对象
+        
+    Returns:
+        JSON字节串
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _merge_layers(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    把用户配置叠加到默认配置上，生成一份独立的普通字典
+    
+    嵌套字典逐层合并并复制，之后修改结果不会影响两个配置层
+    
+    Args:
+        default: 默认配置
+        user: 用户配置
+        
+    Returns:
+        合并后的配置字典
+    """
+    merged = {key: _merge_layers(value, {}) if isinstance(value, dict) else value
+              for key, value in default.items()}
+    
+    for key, value in user.items():
+        if isinstance(value, dict):
+            base = merged.get(key)
+            merged[key] = _merge_layers(base if isinstance(base, dict) else {}, value)
+        else:
+            merged[key] = value
+    
+    return merged
+
 
 class ConfigManager:
     """
@@ -30,8 +101,11 @@ class ConfigManager:
             config_path: 配置文件路径
         """
         self.config_path = config_path
-        self.config = {}
+        self._user_config: Dict[str, Any] = {}
+        self._static_xpaths: Dict[str, str] = {}
+        self._xpath_cache: Dict[str, List[str]] = {}
         self._default_config = self._get_default_config()
+        self.config: Dict[str, Any] = _merge_layers(self._default_config, self._user_config)
         self.load_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
@@ -48,19 +122,29 @@ class ConfigManager:
                 "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "timeout": 30,
                 "implicit_wait": 10,
-                "page_load_timeout": 60
+                "page_load_timeout": 60,
+                "pool_size": 2,
+                "keep_alive": True
             },
             "ocr": {
                 "engine": "tesseract",
                 "language": "eng",
                 "config": "--psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ",
-                "time_image_config": "--psm 8 -c tessedit_char_whitelist=0123456789:"
+                "time_image_config": "--psm 8 -c tessedit_char_whitelist=0123456789:",
+                "resize_interpolation": "cubic",
+                "result_cache_size": 10000,
+                "result_cache_file": "",
+                "save_time_images": True,
+                "limit_library_threads": True
             },
             "retry": {
                 "captcha_max_attempts": 6,
                 "time_image_max_attempts": 3,
                 "delay_seconds": 2,
-                "captcha_delay_seconds": 1
+                "captcha_delay_seconds": 1,
+                "result_timeout": 10,
+                "flight_delay": 2,
+                "ocr_workers": 4
             },
             "output": {
                 "file_prefix": "flight_data_",
@@ -75,7 +159,7 @@ class ConfigManager:
                 "file_prefix": "flight_crawler_",
                 "max_file_size": "10MB",
                 "backup_count": 30,
-                "format": "%(asctime)s - %(name)s - %(levelname)s - [%(module)s.%(funcName)s:%(lineno)d] - %(message)s",
+                "include_source": False,
                 "date_format": "%Y-%m-%d %H:%M:%S",
                 "console_output": True,
                 "file_rotation": "daily"
@@ -112,11 +196,14 @@ class ConfigManager:
         """
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    loaded_config = _loads(f.read())
+                
+                if not isinstance(loaded_config, dict):
+                    raise ValueError("配置文件顶层必须是对象")
                 
-                # 合并默认配置和加载的配置
-                self.config = self._merge_config(self._default_config, loaded_config)
+                # 用户配置叠加在默认配置之上，合并为普通字典供查找
+                self._set_user_config(loaded_config)
                 
                 # 验证配置
                 self._validate_config()
@@ -124,38 +211,46 @@ class ConfigManager:
                 print(f"配置文件加载成功: {self.config_path}")
             else:
                 print(f"配置文件不存在，使用默认配置: {self.config_path}")
-                self.config = self._default_config.copy()
+                self._set_user_config(copy.deepcopy(self._default_config))
                 self.save_config()
                 
         except json.JSONDecodeError as e:
             print(f"配置文件格式错误: {e}")
             print("使用默认配置")
-            self.config = self._default_config.copy()
+            self._set_user_config({})
         except Exception as e:
             print(f"加载配置文件时发生错误: {e}")
             print("使用默认配置")
-            self.config = self._default_config.copy()
+            self._set_user_config({})
+        
+        self._build_sections()
     
-    def _merge_config(self, default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_sections(self) -> None:
         """
-        合并默认配置和加载的配置
+        根据当前配置生成属性访问对象，并重建XPath缓存
         
-        Args:
-            default: 默认配置
-            loaded: 加载的配置
-            
-        Returns:
-            合并后的配置
+        生成后可以用 config_manager.retry.flight_delay 代替
+        config_manager.get('retry.flight_delay')，省去键拆分和逐级字典查找
         """
-        merged = default.copy()
+        for section in _SECTION_NAMES:
+            setattr(self, section, SimpleNamespace(**self.config.get(section, {})))
         
-        for key, value in loaded.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_config(merged[key], value)
-            else:
-                merged[key] = value
+        # 不含占位符的XPath直接建表，含占位符的在首次访问时按航段展开
+        self._static_xpaths = {
+            name: xpath for name, xpath in self.get_xpath_config().items()
+            if isinstance(xpath, str) and '{}' not in xpath
+        }
+        self._xpath_cache = {}
+    
+    def _set_user_config(self, user_config: Dict[str, Any]) -> None:
+        """
+        替换用户配置层，并重新合并出完整配置
         
-        return merged
+        Args:
+            user_config: 用户配置字典
+        """
+        self._user_config = user_config
+        self.config = _merge_layers(self._default_config, self._user_config)
     
     def _validate_config(self) -> None:
         """
@@ -196,17 +291,22 @@ class ConfigManager:
         ]
         
         for directory in directories:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+            try:
+                Path(directory).mkdir(parents=True)
                 print(f"创建目录: {directory}")
+            except FileExistsError:
+                pass
     
     def save_config(self) -> None:
         """
         保存配置到文件
+        
+        只写入用户配置层，未覆盖的项在加载时由默认配置补齐；
+        新建配置文件或重置时用户配置层就是完整的默认配置
         """
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with open(self.config_path, 'wb') as f:
+                f.write(_dumps(self._user_config))
             print(f"配置文件保存成功: {self.config_path}")
         except Exception as e:
             print(f"保存配置文件时发生错误: {e}")
@@ -241,16 +341,19 @@ class ConfigManager:
             value: 配置值
         """
         keys = key.split('.')
-        config = self.config
+        config = self._user_config
         
-        # 导航到最后一级的父级
+        # 在用户配置层中导航到最后一级的父级
         for k in keys[:-1]:
-            if k not in config:
+            if not isinstance(config.get(k), dict):
                 config[k] = {}
             config = config[k]
         
         # 设置值
         config[keys[-1]] = value
+        
+        self.config = _merge_layers(self._default_config, self._user_config)
+        self._build_sections()
     
     def get_browser_config(self) -> Dict[str, Any]:
         """
@@ -319,6 +422,9 @@ class ConfigManager:
         """
         获取指定元素的XPath
         
+        含占位符的XPath在首次访问时一次性格式化出1..MAX_SEGMENTS的结果，
+        之后按航段索引直接取列表元素
+        
         Args:
             element_name: 元素名称
             segment_index: 航段索引（用于动态XPath）
@@ -326,14 +432,24 @@ class ConfigManager:
         Returns:
             XPath字符串
         """
-        xpath_config = self.get_xpath_config()
-        xpath = xpath_config.get(element_name, "")
+        xpath = self._static_xpaths.get(element_name)
+        if xpath is not None:
+            return xpath
+        
+        xpath = self.get_xpath_config().get(element_name, "")
         
         # 如果XPath包含占位符且提供了航段索引，则格式化
-        if segment_index is not None and '{}' in xpath:
-            xpath = xpath.format(segment_index)
+        if segment_index is None or not xpath:
+            return xpath
+        
+        if 0 <= segment_index <= MAX_SEGMENTS:
+            formatted = self._xpath_cache.get(element_name)
+            if formatted is None:
+                formatted = [xpath.format(i) for i in range(MAX_SEGMENTS + 1)]
+                self._xpath_cache[element_name] = formatted
+            return formatted[segment_index]
         
-        return xpath
+        return xpath.format(segment_index)
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """
@@ -352,7 +468,8 @@ class ConfigManager:
         """
         重置为默认配置
         """
-        self.config = self._default_config.copy()
+        self._set_user_config(copy.deepcopy(self._default_config))
+        self._build_sections()
         self.save_config()
         print("配置已重置为默认值")
     
@@ -361,9 +478,9 @@ class ConfigManager:
         获取所有配置
         
         Returns:
-            完整的配置字典
+            完整配置的副本（修改请通过set）
         """
-        return self.config.copy()
+        return copy.deepcopy(self.config)
     
     def print_config(self) -> None:
         """
@@ -10,16 +10,178 @@
 - 图片保存功能
 """
 
+import asyncio
 import time
-from typing import List, Dict, Any, Optional
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple, Union, TYPE_CHECKING
 from datetime import datetime
+import cv2
+import numpy as np
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 
 from .logger import get_logger, log_exception, log_flight_process
-from .config_manager import get_config_manager
-from .ocr_processor import OCRProcessor, get_image_as_base64
+from .config_manager import get_config_manager, MAX_SEGMENTS
+from .ocr_processor import get_ocr_processor
+
+if TYPE_CHECKING:
+    from .web_automation import WebAutomation
+
+
+# 需要OCR识别的时间图片字段及其描述
+_TIME_IMAGE_FIELDS = (
+    ('actual_departure_img', '实际起飞时间'),
+    ('actual_arrival_img', '实际到达时间'),
+)
+
+# 航段必需字段（全部非空才视为有效航段）
+_REQUIRED_FIELDS = ('flight_number', 'departure_date', 'departure_airport', 'arrival_airport')
+
+# 航段可选字段（缺失或识别失败时生成警告）
+_OPTIONAL_FIELDS = ('scheduled_departure', 'scheduled_arrival', 'actual_departure',
+                    'actual_arrival', 'flight_status')
+
+# 校验可选字段时视为识别失败的字段值
+_INVALID_OPTIONAL_VALUES = frozenset(['识别失败', '元素未找到', '提取异常'])
+
+# 参与校验的全部字段
+_VALIDATION_FIELDS = _REQUIRED_FIELDS + _OPTIONAL_FIELDS
+
+# 参与成功率统计的字段
+_STATISTICS_FIELDS = ('departure_airport', 'arrival_airport', 'scheduled_departure',
+                      'scheduled_arrival', 'actual_departure', 'actual_arrival', 'flight_status')
+
+# 统计时视为提取失败的字段值
+_FAILED_VALUES = frozenset(['识别失败', '元素未找到', '提取异常', '图片保存失败'])
+
+# 列式航段数据包含的字段
+_COLUMNAR_FIELDS = tuple(dict.fromkeys(_REQUIRED_FIELDS + _STATISTICS_FIELDS))
+
+
+def _segments_to_soa(segments: List[Dict[str, Any]],
+                     fields: Tuple[str, ...] = _COLUMNAR_FIELDS) -> Dict[str, np.ndarray]:
+    """
+    将航段数据列表转换为列式结构（每个字段一个数组）
+    
+    Args:
+        segments: 航段数据列表
+        fields: 需要转换的字段
+        
+    Returns:
+        {字段名称: 字段值数组} 字典
+    """
+    return {field: np.array([segment.get(field, '') for segment in segments], dtype=object)
+            for field in fields}
+
+
+class _Validation(NamedTuple):
+    """航段数据校验结果（不可变，便于缓存）"""
+    is_valid: bool
+    missing_fields: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+
+
+@lru_cache(maxsize=8192)
+def _validate_cached(values: Tuple[Any, ...]) -> _Validation:
+    """
+    按字段值校验航段数据（带缓存）
+    
+    Args:
+        values: 按_VALIDATION_FIELDS顺序排列的字段值
+        
+    Returns:
+        校验结果
+    """
+    required_values = values[:len(_REQUIRED_FIELDS)]
+    optional_values = values[len(_REQUIRED_FIELDS):]
+    
+    missing_fields = tuple(field for field, value in zip(_REQUIRED_FIELDS, required_values) if not value)
+    warnings = tuple(f"{field}字段缺失或识别失败"
+                     for field, value in zip(_OPTIONAL_FIELDS, optional_values)
+                     if not value or value in _INVALID_OPTIONAL_VALUES)
+    
+    return _Validation(not missing_fields, missing_fields, warnings)
+
+
+def _flatten_png(image_data: bytes) -> bytes:
+    """
+    把canvas导出的PNG合成到白色背景上，去掉透明通道
+    
+    canvas导出的PNG总是带透明通道，而元素截图是RGB图片；ddddocr转灰度时忽略透明通道，
+    透明像素会变成黑色。合成后的像素与元素截图一致
+    
+    Args:
+        image_data: PNG图片数据
+        
+    Returns:
+        RGB的PNG图片数据，没有透明通道或无法解码时原样返回
+    """
+    image = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if image is None or image.ndim != 3 or image.shape[2] != 4:
+        return image_data
+    
+    alpha = image[:, :, 3:].astype(np.uint16)
+    color = (image[:, :, :3] * alpha + 255 * (255 - alpha) + 127) // 255
+    success, encoded = cv2.imencode('.png', color.astype(np.uint8))
+    return encoded.tobytes() if success else image_data
+
+
+# 在浏览器中统计航段数量的脚本：按顺序检查各航段容器，遇到不存在或无文本的容器即停止
+_SEGMENT_COUNT_SCRIPT = """
+var xpaths = arguments[0];
+for (var i = 0; i < xpaths.length; i++) {
+    var node = document.evaluate(xpaths[i], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!node || !(node.innerText || '').trim()) {
+        return i;
+    }
+}
+return xpaths.length;
+"""
+
+# 需要提取的文本字段
+_TEXT_FIELDS = ('departure_airport', 'arrival_airport', 'scheduled_departure',
+                'scheduled_arrival', 'flight_status')
+
+# 一次性读取所有航段字段的脚本。参数为 [航段索引, 字段名称, XPath, 是否图片] 列表，按顺序返回：
+# 文本字段返回innerText，未找到元素时为null；图片字段按页面上的显示尺寸（乘以设备像素比，
+# 与元素截图一致）绘制到白色背景的canvas后导出PNG数据URL，
+# 未找到图片时为false，图片未加载完成、未显示或canvas被跨域污染时为null
+_BULK_SCRAPE_SCRIPT = """
+return arguments[0].map(function (item) {
+    var node = document.evaluate(item[2], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!item[3]) {
+        return node ? (node.innerText || '').trim() : null;
+    }
+    if (!node) {
+        return false;
+    }
+    try {
+        var rect = node.getBoundingClientRect();
+        var scale = window.devicePixelRatio || 1;
+        var width = Math.round(rect.width * scale);
+        var height = Math.round(rect.height * scale);
+        if (node.complete && node.naturalWidth > 0 && width > 0 && height > 0) {
+            var canvas = document.createElement('canvas');
+            canvas.width = width;
+            canvas.height = height;
+            var context = canvas.getContext('2d');
+            context.fillStyle = '#ffffff';
+            context.fillRect(0, 0, width, height);
+            context.drawImage(node, 0, 0, width, height);
+            return canvas.toDataURL('image/png');
+        }
+    } catch (e) {
+        // canvas被跨域污染，无法导出
+    }
+    return null;
+});
+"""
 
 
 class DataExtractor:
@@ -29,6 +191,10 @@ class DataExtractor:
     负责从查询结果页面提取航班数据
     """
     
+    __slots__ = ('logger', 'xpath_config', 'retry_config', 'output_config', 'ocr_processor',
+                 'max_time_image_retries', 'ocr_workers', 'image_format',
+                 '_has_placeholder', '_xpath_cache')
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         初始化数据提取器
@@ -48,8 +214,36 @@ class DataExtractor:
             self.retry_config = config.get('retry', {})
             self.output_config = config.get('output', {})
         
-        self.ocr_processor = OCRProcessor()
+        self.ocr_processor = get_ocr_processor()
         self.max_time_image_retries = self.retry_config.get('time_image_max_attempts', 3)
+        self.ocr_workers = max(1, self.retry_config.get('ocr_workers', 4))
+        self.image_format = self.output_config.get('image_format', 'base64')
+        
+        # XPath模板是否包含航段索引占位符，以及按(字段, 航段索引)缓存的格式化结果
+        self._has_placeholder = {name: '{}' in (template or '')
+                                 for name, template in self.xpath_config.items()}
+        self._xpath_cache: Dict[Tuple[str, int], str] = {}
+    
+    def _xp(self, field_name: str, segment_index: int) -> str:
+        """
+        获取指定航段的XPath（带缓存）
+        
+        Args:
+            field_name: XPath配置项名称
+            segment_index: 航段索引
+            
+        Returns:
+            XPath字符串，未配置时返回空字符串
+        """
+        key = (field_name, segment_index)
+        xpath = self._xpath_cache.get(key)
+        if xpath is not None:
+            return xpath
+        
+        template = self.xpath_config.get(field_name) or ''
+        xpath = template.format(segment_index) if self._has_placeholder.get(field_name) else template
+        self._xpath_cache[key] = xpath
+        return xpath
     
     def extract_flight_segments(self, driver: WebDriver, flight_number: str, departure_date: str) -> List[Dict[str, Any]]:
         """
@@ -66,51 +260,147 @@ class DataExtractor:
         try:
             log_flight_process(flight_number, "数据提取", "开始")
             
-            # 检查是否有结果数据
-            result_list_xpath = self.xpath_config.get('result_list')
-            if not result_list_xpath:
-                raise ValueError("未配置结果列表XPath")
-            
-            try:
-                result_list = driver.find_element(By.XPATH, result_list_xpath)
-            except NoSuchElementException:
-                log_flight_process(flight_number, "数据提取", "失败", "未找到结果列表")
+            segment_count, text_values, time_images = self._scrape_segments(driver, flight_number)
+            if segment_count == 0:
                 return []
             
-            # 检测航段数量
-            segment_count = self._detect_segment_count(driver)
+            time_results = self._recognize_time_images(time_images, flight_number)
+            
+            return self._build_segments(driver, flight_number, departure_date, segment_count,
+                                        time_results, text_values)
             
+        except Exception as e:
+            self._log_extraction_error(e, flight_number, departure_date)
+            return []
+    
+    async def extract_flight_segments_async(self, driver: WebDriver, flight_number: str, departure_date: str,
+                                            executor: Optional[ThreadPoolExecutor] = None) -> List[Dict[str, Any]]:
+        """
+        异步提取页面中的所有航段数据
+        
+        WebDriver调用在executor中执行，时间图片识别在事件循环的默认线程池中执行，
+        等待期间事件循环可以调度其他航班的任务
+        
+        Args:
+            driver: Selenium WebDriver实例
+            flight_number: 航班号
+            departure_date: 出发日期
+            executor: 执行WebDriver调用的线程池（为None时使用默认线程池）
+            
+        Returns:
+            航段信息列表
+        """
+        loop = asyncio.get_running_loop()
+        
+        try:
+            log_flight_process(flight_number, "数据提取", "开始")
+            
+            segment_count, text_values, time_images = await loop.run_in_executor(
+                executor, self._scrape_segments, driver, flight_number
+            )
             if segment_count == 0:
-                log_flight_process(flight_number, "数据提取", "失败", "未找到航段数据")
                 return []
             
-            log_flight_process(flight_number, "数据提取", "进行中", f"发现 {segment_count} 个航段")
-            
-            # 循环提取每个航段的数据
-            segments = []
-            for segment_index in range(1, segment_count + 1):
-                segment_data = self._extract_single_segment(
-                    driver, flight_number, departure_date, segment_index, segment_count
-                )
-                
-                if segment_data:
-                    segments.append(segment_data)
-                    log_flight_process(flight_number, "航段提取", "成功", 
-                                     f"航段 {segment_index}: {segment_data.get('departure_airport', '')} -> {segment_data.get('arrival_airport', '')}")
-                else:
-                    log_flight_process(flight_number, "航段提取", "失败", f"航段 {segment_index}")
+            time_results = await loop.run_in_executor(
+                None, self._recognize_time_images, time_images, flight_number
+            )
             
-            log_flight_process(flight_number, "数据提取", "完成", f"成功提取 {len(segments)} 个航段")
-            return segments
+            # 批量读取缺失的字段会回退到逐个元素读取，仍需在executor中执行
+            return await loop.run_in_executor(
+                executor, self._build_segments, driver, flight_number, departure_date,
+                segment_count, time_results, text_values
+            )
             
         except Exception as e:
-            log_flight_process(flight_number, "数据提取", "异常", str(e))
+            self._log_extraction_error(e, flight_number, departure_date)
+            return []
+    
+    def _scrape_segments(self, driver: WebDriver, flight_number: str
+                         ) -> Tuple[int, Optional[Dict[Tuple[int, str], Optional[str]]],
+                                    Optional[Dict[Tuple[int, str], Optional[bytes]]]]:
+        """
+        检测航段数量并批量读取页面上的航段字段
+        
+        Args:
+            driver: Selenium WebDriver实例
+            flight_number: 航班号
             
-            if self.logger:
-                log_exception('data_extractor', 'extract_flight_segments', e, 
-                            {'flight_number': flight_number, 'departure_date': departure_date})
+        Returns:
+            (航段数量, 文本字段, 时间图片) 元组，没有航段时航段数量为0
+        """
+        # 检查是否有结果数据
+        result_list_xpath = self.xpath_config.get('result_list')
+        if not result_list_xpath:
+            raise ValueError("未配置结果列表XPath")
+        
+        if not driver.find_elements(By.XPATH, result_list_xpath):
+            log_flight_process(flight_number, "数据提取", "失败", "未找到结果列表")
+            return 0, None, None
+        
+        # 检测航段数量
+        segment_count = self._detect_segment_count(driver)
+        
+        if segment_count == 0:
+            log_flight_process(flight_number, "数据提取", "失败", "未找到航段数据")
+            return 0, None, None
+        
+        log_flight_process(flight_number, "数据提取", "进行中", f"发现 {segment_count} 个航段")
+        
+        # 一次脚本调用读取所有航段的文本字段和时间图片，代替逐个元素查找和截图，再并行识别
+        text_values, time_images = self._bulk_scrape(driver, segment_count)
+        return segment_count, text_values, time_images
+    
+    def _build_segments(self, driver: WebDriver, flight_number: str, departure_date: str,
+                        segment_count: int,
+                        time_results: Optional[Dict[Tuple[int, str], Optional[str]]],
+                        text_values: Optional[Dict[Tuple[int, str], Optional[str]]]) -> List[Dict[str, Any]]:
+        """
+        根据批量读取和识别的结果组装所有航段数据
+        
+        Args:
+            driver: Selenium WebDriver实例（批量结果缺失时逐个元素读取）
+            flight_number: 航班号
+            departure_date: 出发日期
+            segment_count: 航段数量
+            time_results: _recognize_time_images的识别结果
+            text_values: _bulk_scrape读取的文本字段
             
-            return []
+        Returns:
+            航段信息列表
+        """
+        # 循环提取每个航段的数据（同一次提取的航段共用创建时间）
+        created_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        segments = []
+        for segment_index in range(1, segment_count + 1):
+            segment_data = self._extract_single_segment(
+                driver, flight_number, departure_date, segment_index, segment_count,
+                time_results, text_values, created_time
+            )
+            
+            if segment_data:
+                segments.append(segment_data)
+                log_flight_process(flight_number, "航段提取", "成功", 
+                                 f"航段 {segment_index}: {segment_data.get('departure_airport', '')} -> {segment_data.get('arrival_airport', '')}")
+            else:
+                log_flight_process(flight_number, "航段提取", "失败", f"航段 {segment_index}")
+        
+        log_flight_process(flight_number, "数据提取", "完成", f"成功提取 {len(segments)} 个航段")
+        return segments
+    
+    def _log_extraction_error(self, error: Exception, flight_number: str, departure_date: str) -> None:
+        """
+        记录航段提取异常
+        
+        Args:
+            error: 异常对象
+            flight_number: 航班号
+            departure_date: 出发日期
+        """
+        log_flight_process(flight_number, "数据提取", "异常", str(error))
+        
+        if self.logger:
+            log_exception('data_extractor', 'extract_flight_segments', error, 
+                        {'flight_number': flight_number, 'departure_date': departure_date})
     
     def _detect_segment_count(self, driver: WebDriver) -> int:
         """
@@ -133,20 +423,24 @@ class DataExtractor:
                 segment_divs = result_list.find_elements(By.XPATH, './div')
                 return len([div for div in segment_divs if div.text.strip()])
             
-            # 使用动态XPath检测
+            # 使用动态XPath检测，优先在浏览器中一次完成
+            xpaths = [self._xp('segment_base', i) for i in range(1, MAX_SEGMENTS + 1)]
+            try:
+                count = driver.execute_script(_SEGMENT_COUNT_SCRIPT, xpaths)
+                if isinstance(count, int):
+                    return count
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"脚本检测航段数量失败，改为逐个检测: {str(e)}")
+            
             count = 0
-            max_check = 10  # 最多检查10个航段
+            max_check = MAX_SEGMENTS  # 最多检查10个航段
             
             for i in range(1, max_check + 1):
-                xpath = segment_base_xpath.format(i)
-                try:
-                    element = driver.find_element(By.XPATH, xpath)
-                    if element and element.text.strip():
-                        count = i
-                    else:
-                        break
-                except NoSuchElementException:
+                elements = driver.find_elements(By.XPATH, self._xp('segment_base', i))
+                if not elements or not elements[0].text.strip():
                     break
+                count = i
             
             return count
             
@@ -155,8 +449,117 @@ class DataExtractor:
                 log_exception('data_extractor', '_detect_segment_count', e)
             return 0
     
+    def _bulk_scrape(self, driver: WebDriver, segment_count: int
+                     ) -> Tuple[Optional[Dict[Tuple[int, str], Optional[str]]],
+                                Optional[Dict[Tuple[int, str], Optional[bytes]]]]:
+        """
+        通过一次execute_script读取所有航段的文本字段和时间图片
+        
+        Args:
+            driver: WebDriver实例
+            segment_count: 航段数量
+            
+        Returns:
+            (文本字段, 时间图片) 元组：
+            文本字段为 {(航段索引, 字段名称): 文本} 字典，未找到的元素值为None；
+            时间图片为 {(航段索引, 字段名称): PNG数据} 字典，页面上不存在的图片不在字典中，
+            无法导出的图片值为None；脚本执行失败时均为None
+        """
+        items = []
+        for segment_index in range(1, segment_count + 1):
+            for field_name in _TEXT_FIELDS:
+                xpath = self._text_field_xpath(field_name, segment_index, segment_count)
+                if xpath:
+                    items.append([segment_index, field_name, xpath, False])
+            for field_name, _ in _TIME_IMAGE_FIELDS:
+                xpath = self._xp(field_name, segment_index)
+                if xpath:
+                    items.append([segment_index, field_name, xpath, True])
+        
+        if not items:
+            return None, None
+        
+        try:
+            values = driver.execute_script(_BULK_SCRAPE_SCRIPT, items)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"批量读取航段字段失败，改为逐个读取: {str(e)}")
+            return None, None
+        
+        if not isinstance(values, list) or len(values) != len(items):
+            return None, None
+        
+        text_values = {}
+        time_images = {}
+        for (segment_index, field_name, _, is_image), value in zip(items, values):
+            key = (segment_index, field_name)
+            if not is_image:
+                text_values[key] = value
+            elif value is not False:
+                image_data = None
+                if value and ',' in value:
+                    image_data = _flatten_png(base64.b64decode(value.split(',', 1)[1]))
+                time_images[key] = image_data
+        
+        if self.logger:
+            image_count = sum(1 for item in items if item[3])
+            self.logger.info(f"批量获取时间图片: {sum(1 for v in time_images.values() if v)}/{image_count}")
+        
+        return text_values, time_images
+    
+    def _recognize_time_images(self, time_images: Optional[Dict[Tuple[int, str], Optional[bytes]]],
+                               flight_number: str) -> Optional[Dict[Tuple[int, str], Optional[str]]]:
+        """
+        用线程池并行识别批量收集到的时间图片
+        
+        只做OCR，不调用WebDriver（WebDriver不是线程安全的）
+        
+        Args:
+            time_images: _bulk_scrape返回的时间图片
+            flight_number: 航班号
+            
+        Returns:
+            {(航段索引, 字段名称): 识别结果} 字典；没有图片数据的项值为None，
+            需要回退到逐个元素获取；time_images为None时返回None
+        """
+        if time_images is None:
+            return None
+        
+        descriptions = dict(_TIME_IMAGE_FIELDS)
+        time_results = {key: None for key in time_images}
+        
+        # 同一航班的多个航段（如共享航班）常渲染出完全相同的图片，相同图片只识别一次
+        keys_by_image: Dict[bytes, List[Tuple[int, str]]] = {}
+        for key, image_data in time_images.items():
+            if image_data:
+                keys_by_image.setdefault(image_data, []).append(key)
+        
+        tasks = [(keys[0], image_data) for image_data, keys in keys_by_image.items()]
+        if not tasks:
+            return time_results
+        
+        def recognize(task):
+            (segment_index, field_name), image_data = task
+            time_type = "departure" if "departure" in field_name else "arrival"
+            return self._recognize_time_data(image_data, descriptions[field_name], segment_index,
+                                             flight_number, time_type)
+        
+        with ThreadPoolExecutor(max_workers=min(self.ocr_workers, len(tasks))) as executor:
+            for (_, image_data), result in zip(tasks, executor.map(recognize, tasks)):
+                for key in keys_by_image[image_data]:
+                    time_results[key] = result
+        
+        image_count = sum(len(keys) for keys in keys_by_image.values())
+        if self.logger and len(tasks) < image_count:
+            self.logger.info(f"时间图片去重: {image_count} 张图片中 {len(tasks)} 张不同")
+        
+        return time_results
+    
     def _extract_single_segment(self, driver: WebDriver, flight_number: str, 
-                               departure_date: str, segment_index: int, total_segments: int = 1) -> Optional[Dict[str, Any]]:
+                               departure_date: str, segment_index: int, total_segments: int = 1,
+                               time_results: Optional[Dict[Tuple[int, str], Optional[str]]] = None,
+                               text_values: Optional[Dict[Tuple[int, str], Optional[str]]] = None,
+                               created_time: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         提取单个航段的数据
         
@@ -166,6 +569,9 @@ class DataExtractor:
             departure_date: 出发日期
             segment_index: 航段索引（从1开始）
             total_segments: 总航段数
+            time_results: _recognize_time_images的识别结果
+            text_values: _bulk_scrape读取的文本字段
+            created_time: 创建时间（为None时使用当前时间）
             
         Returns:
             航段数据字典
@@ -182,53 +588,55 @@ class DataExtractor:
                 'actual_departure': '',
                 'actual_arrival': '',
                 'flight_status': '',
-                'created_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'created_time': created_time or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
             
             # 提取出发机场
-            departure_airport = self._extract_text_field(
-                driver, 'departure_airport', segment_index, total_segments
+            departure_airport = self._get_text_value(
+                driver, 'departure_airport', segment_index, total_segments, text_values
             )
             if departure_airport:
                 segment_data['departure_airport'] = departure_airport
             
             # 提取到达机场
-            arrival_airport = self._extract_text_field(
-                driver, 'arrival_airport', segment_index, total_segments
+            arrival_airport = self._get_text_value(
+                driver, 'arrival_airport', segment_index, total_segments, text_values
             )
             if arrival_airport:
                 segment_data['arrival_airport'] = arrival_airport
             
             # 提取计划起飞时间
-            scheduled_departure = self._extract_text_field(
-                driver, 'scheduled_departure', segment_index, total_segments
+            scheduled_departure = self._get_text_value(
+                driver, 'scheduled_departure', segment_index, total_segments, text_values
             )
             if scheduled_departure:
                 segment_data['scheduled_departure'] = scheduled_departure
             
             # 提取计划到达时间
-            scheduled_arrival = self._extract_text_field(
-                driver, 'scheduled_arrival', segment_index, total_segments
+            scheduled_arrival = self._get_text_value(
+                driver, 'scheduled_arrival', segment_index, total_segments, text_values
             )
             if scheduled_arrival:
                 segment_data['scheduled_arrival'] = scheduled_arrival
             
             # 提取航班状态
-            flight_status = self._extract_text_field(
-                driver, 'flight_status', segment_index, total_segments
+            flight_status = self._get_text_value(
+                driver, 'flight_status', segment_index, total_segments, text_values
             )
             if flight_status:
                 segment_data['flight_status'] = flight_status
             
             # 提取实际起飞时间（图片识别）
             actual_departure = self._extract_time_image(
-                driver, 'actual_departure_img', segment_index, '实际起飞时间', flight_number
+                driver, 'actual_departure_img', segment_index, '实际起飞时间', flight_number,
+                time_results
             )
             segment_data['actual_departure'] = actual_departure
             
             # 提取实际到达时间（图片识别）
             actual_arrival = self._extract_time_image(
-                driver, 'actual_arrival_img', segment_index, '实际到达时间', flight_number
+                driver, 'actual_arrival_img', segment_index, '实际到达时间', flight_number,
+                time_results
             )
             segment_data['actual_arrival'] = actual_arrival
             
@@ -240,6 +648,62 @@ class DataExtractor:
                             {'flight_number': flight_number, 'segment_index': segment_index})
             return None
     
+    def _get_text_value(self, driver: WebDriver, field_name: str, segment_index: int,
+                        total_segments: int = 1,
+                        text_values: Optional[Dict[Tuple[int, str], Optional[str]]] = None) -> str:
+        """
+        获取文本字段的值，优先使用批量读取的结果
+        
+        Args:
+            driver: WebDriver实例
+            field_name: 字段名称
+            segment_index: 航段索引
+            total_segments: 总航段数
+            text_values: _bulk_scrape读取的文本字段
+            
+        Returns:
+            文本内容
+        """
+        if text_values is None:
+            return self._extract_text_field(driver, field_name, segment_index, total_segments)
+        
+        if not self.xpath_config.get(field_name):
+            return ''
+        
+        value = text_values.get((segment_index, field_name))
+        if value is None:
+            if self.logger:
+                self.logger.warning(f"未找到字段 {field_name} 的元素，航段 {segment_index}")
+            return ''
+        
+        return value
+    
+    def _text_field_xpath(self, field_name: str, segment_index: int, total_segments: int = 1) -> str:
+        """
+        生成文本字段的XPath
+        
+        Args:
+            field_name: 字段名称
+            segment_index: 航段索引
+            total_segments: 总航段数
+            
+        Returns:
+            XPath字符串，未配置时返回空字符串
+        """
+        xpath = self._xp(field_name, segment_index)
+        if not xpath:
+            return ''
+        
+        # 特殊处理航班状态字段的XPath
+        if field_name == 'flight_status':
+            if total_segments == 1:
+                # 单条记录时，使用不带索引的XPath
+                return "/html/body/div[1]/div[2]/div[1]/div/div[2]/div[3]/div/div[10]/span"
+            # 多条记录时，使用带索引的XPath
+            return f"/html/body/div[1]/div[2]/div[1]/div/div[2]/div[3]/div[{segment_index}]/div[10]/span"
+        
+        return xpath
+    
     def _extract_text_field(self, driver: WebDriver, field_name: str, segment_index: int, total_segments: int = 1) -> str:
         """
         提取文本字段
@@ -254,34 +718,18 @@ class DataExtractor:
             提取的文本内容
         """
         try:
-            xpath_template = self.xpath_config.get(field_name, '')
-            if not xpath_template:
+            xpath = self._text_field_xpath(field_name, segment_index, total_segments)
+            if not xpath:
                 return ''
             
-            # 特殊处理航班状态字段的XPath
-            if field_name == 'flight_status':
-                if total_segments == 1:
-                    # 单条记录时，使用不带索引的XPath
-                    xpath = "/html/body/div[1]/div[2]/div[1]/div/div[2]/div[3]/div/div[10]/span"
-                else:
-                    # 多条记录时，使用带索引的XPath
-                    xpath = f"/html/body/div[1]/div[2]/div[1]/div/div[2]/div[3]/div[{segment_index}]/div[10]/span"
-            else:
-                # 其他字段按原逻辑处理
-                if '{}' in xpath_template:
-                    xpath = xpath_template.format(segment_index)
-                else:
-                    xpath = xpath_template
-            
-            element = driver.find_element(By.XPATH, xpath)
-            text = element.text.strip() if element else ''
+            elements = driver.find_elements(By.XPATH, xpath)
+            if not elements:
+                if self.logger:
+                    self.logger.warning(f"未找到字段 {field_name} 的元素，航段 {segment_index}")
+                return ''
             
-            return text
+            return elements[0].text.strip()
             
-        except NoSuchElementException:
-            if self.logger:
-                self.logger.warning(f"未找到字段 {field_name} 的元素，航段 {segment_index}")
-            return ''
         except Exception as e:
             if self.logger:
                 log_exception('data_extractor', '_extract_text_field', e, 
@@ -289,44 +737,62 @@ class DataExtractor:
             return ''
     
     def _extract_time_image(self, driver: WebDriver, field_name: str, 
-                           segment_index: int, field_description: str, flight_number: str = "") -> str:
+                           segment_index: int, field_description: str, flight_number: str = "",
+                           time_results: Optional[Dict[Tuple[int, str], Optional[str]]] = None) -> str:
         """
         提取时间图片并进行OCR识别（带重试机制）
         
+        已有批量识别结果时直接使用，否则查找元素并截图识别
+        
         Args:
             driver: WebDriver实例
             field_name: 字段名称
             segment_index: 航段索引
             field_description: 字段描述（用于日志）
             flight_number: 航班号
+            time_results: _recognize_time_images的识别结果
             
         Returns:
             识别的时间字符串或图片base64编码
         """
+        time_type = "departure" if "departure" in field_name else "arrival"
+        
+        if time_results is not None and self.xpath_config.get(field_name):
+            key = (segment_index, field_name)
+            if key not in time_results:
+                if self.logger:
+                    self.logger.warning(f"未找到{field_description}图片元素，航段 {segment_index}")
+                return '未找到图片'
+            
+            if time_results[key] is not None:
+                return time_results[key]
+        
         try:
-            xpath_template = self.xpath_config.get(field_name, '')
-            if not xpath_template:
+            xpath = self._xp(field_name, segment_index)
+            if not xpath:
                 return '识别失败'
             
-            # 格式化XPath
-            if '{}' in xpath_template:
-                xpath = xpath_template.format(segment_index)
-            else:
-                xpath = xpath_template
-            
             if self.logger:
                 self.logger.info(f"{field_description}图片XPath: {xpath}")
             
             # 查找图片元素
-            img_element = driver.find_element(By.XPATH, xpath)
+            img_elements = driver.find_elements(By.XPATH, xpath)
+            if not img_elements:
+                if self.logger:
+                    self.logger.warning(f"未找到{field_description}图片元素，航段 {segment_index}")
+                return '未找到图片'
+            img_element = img_elements[0]
             
-            # 确定时间类型
-            time_type = "departure" if "departure" in field_name else "arrival"
+            # 截图一次，识别、缓存和失败时的图片保存都使用同一份数据
+            image_data = self.ocr_processor._get_image_data(img_element)
+            if image_data:
+                return self._recognize_time_data(image_data, field_description, segment_index,
+                                                 flight_number, time_type)
             
-            # 使用OCR识别时间图片
+            # 截图失败时由OCR模块逐次重新截图识别
             time_result = self.ocr_processor.recognize_time_image(
                 img_element, 
-                max_attempts=self.retry_config.get('time_image_max_attempts', 3),
+                max_attempts=self.max_time_image_retries,
                 flight_number=flight_number,
                 segment_index=segment_index,
                 time_type=time_type
@@ -338,22 +804,61 @@ class DataExtractor:
                 return time_result
             else:
                 if self.logger:
-                    self.logger.warning(f"{field_description}识别失败，尝试 {self.retry_config.get('time_image_max_attempts', 3)}/{self.retry_config.get('time_image_max_attempts', 3)}，航段 {segment_index}")
+                    self.logger.warning(f"{field_description}识别失败，尝试 {self.max_time_image_retries}/{self.max_time_image_retries}，航段 {segment_index}")
                 
                 # 保存失败的图片
                 base64_image = self._save_failed_image(img_element, field_description, segment_index)
                 return base64_image
                 
-        except NoSuchElementException:
-            if self.logger:
-                self.logger.warning(f"未找到{field_description}图片元素，航段 {segment_index}")
-            return '未找到图片'
         except Exception as e:
             if self.logger:
                 log_exception('data_extractor', '_extract_time_image', e, 
                             {'field_name': field_name, 'segment_index': segment_index})
             return '识别异常'
     
+    def _recognize_time_data(self, image_data: bytes, field_description: str, segment_index: int,
+                             flight_number: str, time_type: str) -> str:
+        """
+        识别已获取的时间图片数据
+        
+        Args:
+            image_data: PNG图片数据
+            field_description: 字段描述（用于日志）
+            segment_index: 航段索引
+            flight_number: 航班号
+            time_type: 时间类型 (departure/arrival)
+            
+        Returns:
+            识别的时间字符串或图片base64编码
+        """
+        try:
+            time_result = self.ocr_processor.recognize_time_image(
+                None,
+                max_attempts=self.max_time_image_retries,
+                flight_number=flight_number,
+                segment_index=segment_index,
+                time_type=time_type,
+                image_data=image_data
+            )
+            
+            if time_result:
+                if self.logger:
+                    self.logger.info(f"{field_description}识别成功: {time_result}，航段 {segment_index}")
+                return time_result
+            
+            if self.logger:
+                self.logger.warning(f"{field_description}识别失败，航段 {segment_index}")
+            
+            if self.image_format == 'base64':
+                return f"data:image/png;base64,{base64.b64encode(image_data).decode('utf-8')}"
+            return '图片文件保存功能待实现'
+            
+        except Exception as e:
+            if self.logger:
+                log_exception('data_extractor', '_recognize_time_data', e, 
+                            {'field_description': field_description, 'segment_index': segment_index})
+            return '识别异常'
+    
     def _save_failed_image(self, img_element, field_description: str, segment_index: int) -> str:
         """
         保存识别失败的图片
@@ -367,11 +872,9 @@ class DataExtractor:
             图片的base64编码或错误信息
         """
         try:
-            image_format = self.output_config.get('image_format', 'base64')
-            
-            if image_format == 'base64':
+            if self.image_format == 'base64':
                 # 保存为base64编码
-                base64_data = get_image_as_base64(img_element)
+                base64_data = self.ocr_processor.get_image_as_base64(img_element)
                 if base64_data:
                     if self.logger:
                         self.logger.info(f"{field_description}图片已保存为base64，航段 {segment_index}")
@@ -398,38 +901,48 @@ class DataExtractor:
         Returns:
             验证结果字典
         """
-        validation_result = {
-            'is_valid': True,
-            'missing_fields': [],
-            'warnings': []
-        }
+        # 必需字段缺失时无效，可选字段缺失或识别失败时生成警告；相同字段值的校验结果会被缓存
+        validation = _validate_cached(tuple(segment_data.get(field, '') for field in _VALIDATION_FIELDS))
         
-        # 必需字段检查
-        required_fields = ['flight_number', 'departure_date', 'departure_airport', 'arrival_airport']
-        for field in required_fields:
-            if not segment_data.get(field):
-                validation_result['missing_fields'].append(field)
-                validation_result['is_valid'] = False
+        return {
+            'is_valid': validation.is_valid,
+            'missing_fields': list(validation.missing_fields),
+            'warnings': list(validation.warnings)
+        }
+    
+    def extract_flight_segments_columnar(self, driver: WebDriver, flight_number: str,
+                                         departure_date: str) -> Dict[str, np.ndarray]:
+        """
+        提取页面中的所有航段数据，以列式结构返回
         
-        # 可选字段检查（生成警告）
-        optional_fields = ['scheduled_departure', 'scheduled_arrival', 'actual_departure', 'actual_arrival', 'flight_status']
-        for field in optional_fields:
-            if not segment_data.get(field) or segment_data.get(field) in ['识别失败', '元素未找到', '提取异常']:
-                validation_result['warnings'].append(f"{field}字段缺失或识别失败")
+        返回值可直接传给get_extraction_statistics，统计时无需再逐个航段转换
         
-        return validation_result
+        Args:
+            driver: Selenium WebDriver实例
+            flight_number: 航班号
+            departure_date: 出发日期
+            
+        Returns:
+            {字段名称: 字段值数组} 字典
+        """
+        return _segments_to_soa(self.extract_flight_segments(driver, flight_number, departure_date))
     
-    def get_extraction_statistics(self, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_extraction_statistics(self, segments: Union[List[Dict[str, Any]], Dict[str, np.ndarray]]) -> Dict[str, Any]:
         """
         获取数据提取统计信息
         
+        大批量统计时传入列式数据（extract_flight_segments_columnar的返回值）更快
+        
         Args:
-            segments: 航段数据列表
+            segments: 航段数据列表，或 {字段名称: 字段值数组} 列式数据
             
         Returns:
             统计信息字典
         """
-        if not segments:
+        columns = segments if isinstance(segments, dict) else _segments_to_soa(segments)
+        total_segments = len(columns[_REQUIRED_FIELDS[0]]) if columns else 0
+        
+        if total_segments == 0:
             return {
                 'total_segments': 0,
                 'valid_segments': 0,
@@ -437,41 +950,27 @@ class DataExtractor:
                 'field_success_rates': {}
             }
         
-        total_segments = len(segments)
-        valid_segments = 0
-        field_counts = {}
-        field_success_counts = {}
+        # 必需字段全部非空的航段为有效航段
+        valid_mask = np.ones(total_segments, dtype=bool)
+        for field in _REQUIRED_FIELDS:
+            valid_mask &= columns[field].astype(bool)
+        valid_segments = int(valid_mask.sum())
         
-        # 统计字段
-        fields_to_check = ['departure_airport', 'arrival_airport', 'scheduled_departure', 
-                          'scheduled_arrival', 'actual_departure', 'actual_arrival', 'flight_status']
-        
-        for field in fields_to_check:
-            field_counts[field] = 0
-            field_success_counts[field] = 0
-        
-        # 遍历所有航段
-        for segment in segments:
-            validation = self.validate_segment_data(segment)
-            if validation['is_valid']:
-                valid_segments += 1
-            
-            # 统计各字段成功率
-            for field in fields_to_check:
-                field_counts[field] += 1
-                value = segment.get(field, '')
-                if value and value not in ['识别失败', '元素未找到', '提取异常', '图片保存失败']:
-                    field_success_counts[field] += 1
+        # 各字段非空且不是失败标记的数量
+        field_success_counts = []
+        for field in _STATISTICS_FIELDS:
+            column = columns[field]
+            succeeded = column.astype(bool)
+            for failed_value in _FAILED_VALUES:
+                succeeded &= column != failed_value
+            field_success_counts.append(succeeded.sum())
         
         # 计算成功率
-        success_rate = (valid_segments / total_segments * 100) if total_segments > 0 else 0
-        
-        field_success_rates = {}
-        for field in fields_to_check:
-            if field_counts[field] > 0:
-                field_success_rates[field] = field_success_counts[field] / field_counts[field] * 100
-            else:
-                field_success_rates[field] = 0
+        success_rate = valid_segments / total_segments * 100
+        field_success_rates = {
+            field: float(count) / total_segments * 100
+            for field, count in zip(_STATISTICS_FIELDS, field_success_counts)
+        }
         
         return {
             'total_segments': total_segments,
@@ -481,6 +980,93 @@ class DataExtractor:
         }
 
 
+# 批量提取时当前工作进程持有的浏览器实例，以及航班间延迟和结果等待时间
+_batch_web_automation = None
+_batch_delays = (0.0, 10.0)
+
+# 工作进程上一个航班处理完成的时间（time.monotonic），用于航班间延迟
+_batch_last_finished = None
+
+
+def _init_batch_worker(config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    批量提取工作进程的初始化函数：启动本进程专用的浏览器，进程退出时关闭
+    
+    工作进程只读取持久化的时间识别结果（ocr.result_cache_file），不写回，
+    避免多个进程同时覆盖同一个文件
+    
+    Args:
+        config: 配置字典（传给create_web_automation），为None时使用全局配置；
+            查询间隔和结果等待时间与浏览器一样取自其中的retry配置
+    """
+    global _batch_web_automation, _batch_delays
+    from multiprocessing.util import Finalize
+    from .web_automation import create_web_automation
+    
+    if config is None:
+        retry_config = get_config_manager().get_retry_config()
+    else:
+        retry_config = config.get('retry', {})
+    _batch_delays = (retry_config.get('flight_delay', 2), retry_config.get('result_timeout', 10))
+    
+    web_automation = create_web_automation(config)
+    if web_automation.start_browser():
+        _batch_web_automation = web_automation
+        Finalize(web_automation, web_automation.close_browser, exitpriority=10)
+
+
+def _run_batch_job(job: Tuple[str, str]) -> List[Dict[str, Any]]:
+    """
+    在工作进程中查询单个航班并提取航段数据
+    
+    与FlightCrawler一样，同一浏览器的两次查询之间至少间隔retry.flight_delay秒，
+    等待期间先准备好下一次查询的表单
+    
+    Args:
+        job: (航班号, 出发日期)
+        
+    Returns:
+        航段数据列表，失败时为空列表
+    """
+    global _batch_last_finished
+    flight_number, departure_date = job
+    web_automation = _batch_web_automation
+    if web_automation is None:
+        log_flight_process(flight_number, "批量提取", "失败", "浏览器未启动")
+        return []
+    
+    flight_delay, result_timeout = _batch_delays
+    if _batch_last_finished is not None and flight_delay > 0:
+        web_automation.prepare_query_page()
+        remaining = flight_delay - (time.monotonic() - _batch_last_finished)
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    try:
+        return query_flight_segments(web_automation, flight_number, departure_date, result_timeout)
+    finally:
+        _batch_last_finished = time.monotonic()
+
+
+# 便捷函数使用的默认数据提取器
+_default_extractor = None
+_default_extractor_lock = threading.Lock()
+
+
+def _get_default_extractor() -> DataExtractor:
+    """
+    获取便捷函数使用的默认数据提取器
+    
+    Returns:
+        数据提取器实例
+    """
+    global _default_extractor
+    with _default_extractor_lock:
+        if _default_extractor is None:
+            _default_extractor = DataExtractor()
+    return _default_extractor
+
+
 # 便捷函数
 def extract_flight_segments(driver: WebDriver, flight_number: str, departure_date: str) -> List[Dict[str, Any]]:
     """
@@ -494,10 +1080,83 @@ def extract_flight_segments(driver: WebDriver, flight_number: str, departure_dat
     Returns:
         航段数据列表
     """
-    extractor = DataExtractor()
+    extractor = _get_default_extractor()
     return extractor.extract_flight_segments(driver, flight_number, departure_date)
 
 
+def query_flight_segments(web_automation: 'WebAutomation', flight_number: str, departure_date: str,
+                          result_timeout: float = 10) -> List[Dict[str, Any]]:
+    """
+    在浏览器实例上查询单个航班并提取航段数据
+    
+    FlightCrawler和批量提取的工作进程共用这一流程：准备查询页面、填写表单、
+    处理验证码并提交、等待结果列表、提取航段
+    
+    Args:
+        web_automation: 浏览器实例
+        flight_number: 航班号
+        departure_date: 出发日期
+        result_timeout: 提交查询后等待结果列表出现的最长时间（秒）
+        
+    Returns:
+        航段数据列表，失败时为空列表
+    """
+    logger = get_logger()
+    
+    try:
+        # 表单已在上一个航班的延迟期间准备好时直接填写，否则现在重置或导航
+        if not (web_automation.query_page_ready and web_automation.query_form_clean):
+            if not web_automation.prepare_query_page():
+                if logger:
+                    log_flight_process(flight_number, "页面导航", "失败")
+                return []
+        
+        # 填写查询表单
+        if not web_automation.fill_query_form(flight_number, departure_date):
+            if logger:
+                log_flight_process(flight_number, "表单填写", "失败")
+            return []
+        
+        # 处理验证码并提交查询
+        if not web_automation.handle_captcha_and_submit(flight_number):
+            if logger:
+                log_flight_process(flight_number, "验证码处理", "失败")
+            return []
+        
+        # 等待结果列表出现，超时后仍尝试提取（由数据提取模块判断是否有航段）
+        if not web_automation.wait_for_results(result_timeout):
+            if logger:
+                log_flight_process(flight_number, "结果加载", "超时", f"{result_timeout}秒内未出现结果列表")
+        
+        # 提取航段数据
+        return extract_flight_segments(web_automation.driver, flight_number, departure_date)
+        
+    except Exception as e:
+        # 页面状态未知，下一个航班重新导航
+        web_automation.query_page_ready = False
+        if logger:
+            logger.error(f"处理航班 {flight_number} 时发生异常: {str(e)}")
+        return []
+
+
+async def extract_flight_segments_async(driver: WebDriver, flight_number: str, departure_date: str,
+                                        executor: Optional[ThreadPoolExecutor] = None) -> List[Dict[str, Any]]:
+    """
+    异步提取航段数据的便捷函数
+    
+    Args:
+        driver: WebDriver实例
+        flight_number: 航班号
+        departure_date: 出发日期
+        executor: 执行WebDriver调用的线程池
+        
+    Returns:
+        航段数据列表
+    """
+    extractor = _get_default_extractor()
+    return await extractor.extract_flight_segments_async(driver, flight_number, departure_date, executor)
+
+
 def validate_segment_data(segment_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     验证航段数据的便捷函数
@@ -508,5 +1167,33 @@ def validate_segment_data(segment_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         验证结果
     """
-    extractor = DataExtractor()
-    return extractor.validate_segment_data(segment_data)
\ No newline at end of file
+    extractor = _get_default_extractor()
+    return extractor.validate_segment_data(segment_data)
+
+
+def extract_flight_segments_batch(jobs: List[Tuple[str, str]], n_workers: Optional[int] = None,
+                                  config: Optional[Dict[str, Any]] = None) -> List[List[Dict[str, Any]]]:
+    """
+    用进程池批量查询航班并提取航段数据
+    
+    每个工作进程启动一个浏览器，并在分配给它的所有航班之间复用
+    
+    Args:
+        jobs: (航班号, 出发日期) 列表
+        n_workers: 工作进程数量（为None时使用browser.pool_size）
+        config: 配置字典（传给create_web_automation）
+        
+    Returns:
+        与jobs顺序一致的航段数据列表
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    
+    if n_workers is None:
+        n_workers = get_config_manager().get_browser_config().get('pool_size', 2)
+    n_workers = max(1, min(int(n_workers), len(jobs)))
+    
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_batch_worker,
+                             initargs=(config,)) as executor:
+        return list(executor.map(_run_batch_job, jobs))
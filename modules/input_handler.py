@@ -10,15 +10,211 @@
 """
 
 import os
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+import sys
+import threading
+import zipfile
+from itertools import islice
+from xml.etree import ElementTree
+from typing import List, Dict, Any, Optional, Tuple, Set, NamedTuple
+from datetime import datetime, date, timedelta
+import numpy as np
 import openpyxl
 from openpyxl import Workbook
 import re
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+    pd = None
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+    CalamineWorkbook = None
+
 from .logger import get_logger, log_exception
 
 
+# 航班号格式：前2位必须是字母或数字，后面3-4位必须是数字
+# 但不能是纯数字（如12345）或只有1位前缀（如M5100）
+# 例如：MU5100, G54381, 3U8888, CA1234等
+_FLIGHT_NUMBER_RE = re.compile(r'[A-Z0-9]{2}\d{3,4}\Z')
+
+# 标题行关键词：第一列包含航班相关词，或第二列包含日期相关词
+_FLIGHT_HEADER_RE = re.compile(r'航班|flight|班次', re.IGNORECASE)
+_DATE_HEADER_RE = re.compile(r'日期|date|时间', re.IGNORECASE)
+
+# ASCII小写字母转大写的字节转换表
+_ASCII_UPPER_TABLE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# 数据行数达到该值时使用pandas批量校验
+_VECTORIZE_MIN_ROWS = 1000
+
+# xlsx文件的XML命名空间
+_XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Excel内置的日期时间数字格式编号
+_BUILTIN_DATE_FORMAT_IDS = frozenset(list(range(14, 23)) + [45, 46, 47])
+
+# 判断自定义数字格式是否为日期：去掉引号文本、方括号和转义字符后包含日期时间占位符
+_FORMAT_LITERAL_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+_DATE_FORMAT_CHARS_RE = re.compile(r'[dmyhs]')
+
+
+class _RawFlightColumns(NamedTuple):
+    """原始航班数据（按列存储，三个列表按位置一一对应）"""
+    row_indices: List[int]
+    flight_numbers: List[Any]
+    departure_dates: List[Any]
+
+
+def _flight_number_mask(flight_strs: List[str]) -> np.ndarray:
+    """
+    按字符编码批量检查航班号格式（2位字母或数字 + 3-4位数字，仅ASCII）
+    
+    把航班号打包成每行6字节的uint8矩阵，用数组比较代替逐个正则匹配；
+    结果与_FLIGHT_NUMBER_RE加字符检查一致（大小写均可）
+    
+    Args:
+        flight_strs: 已去除空白的航班号字符串
+        
+    Returns:
+        布尔数组，格式正确的位置为True
+    """
+    count = len(flight_strs)
+    eligible = np.fromiter((5 <= len(value) <= 6 and value.isascii() for value in flight_strs),
+                           dtype=bool, count=count)
+    lengths = np.fromiter((len(value) for value in flight_strs), dtype=np.int64, count=count)
+    
+    packed = b''.join(
+        value.encode('ascii').ljust(6) if is_eligible else b' ' * 6
+        for value, is_eligible in zip(flight_strs, eligible)
+    )
+    codes = np.frombuffer(packed, dtype=np.uint8).reshape(count, 6)
+    
+    digits = (codes >= ord('0')) & (codes <= ord('9'))
+    letters = (((codes >= ord('A')) & (codes <= ord('Z')))
+               | ((codes >= ord('a')) & (codes <= ord('z'))))
+    
+    prefix_valid = (digits[:, :2] | letters[:, :2]).all(axis=1)
+    number_valid = digits[:, 2:5].all(axis=1) & (digits[:, 5] | (lengths == 5))
+    
+    return eligible & prefix_valid & number_valid
+
+
+def _upper_ascii(values: List[str]) -> List[str]:
+    """
+    批量将纯ASCII字符串转换为大写
+    
+    拼接成一个bytes后用bytes.translate一次完成转换再拆分，代替逐个调用str.upper()
+    
+    Args:
+        values: 不含换行符的纯ASCII字符串列表
+        
+    Returns:
+        转换为大写后的字符串列表
+    """
+    if not values:
+        return []
+    return '\n'.join(values).encode('ascii').translate(_ASCII_UPPER_TABLE).decode('ascii').split('\n')
+
+
+def _parse_compact_date(date_str: str) -> Optional[datetime]:
+    """
+    按位置切片解析补零的YYYY-MM-DD、YYYY/MM/DD和YYYYMMDD日期
+    
+    输入中最常见的日期写法，跳过strptime的格式匹配；结果与strptime一致
+    
+    Args:
+        date_str: 日期字符串
+        
+    Returns:
+        解析出的日期，不是这几种写法或日期无效时返回None
+    """
+    length = len(date_str)
+    if length == 10 and date_str[4] == date_str[7] and date_str[4] in '-/':
+        year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+    elif length == 8:
+        year, month, day = date_str[0:4], date_str[4:6], date_str[6:8]
+    else:
+        return None
+    
+    if not (date_str.isascii() and (year + month + day).isdigit()):
+        return None
+    
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _format_date(value: date) -> str:
+    """
+    将日期格式化为YYYY-MM-DD
+    
+    格式固定，直接拼接年月日整数，不经过strftime的格式串解析
+    
+    Args:
+        value: date或datetime对象
+        
+    Returns:
+        YYYY-MM-DD格式的日期字符串
+    """
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
+def _date_ordinal_range(now: Optional[datetime] = None) -> Tuple[int, int]:
+    """
+    计算出发日期允许范围（前后一年）对应的日序号区间
+    
+    对零点时刻的日期，判断 min <= toordinal() <= max 与
+    -365 <= (日期 - now).days <= 365 的结果一致
+    
+    Args:
+        now: 当前时间，为None时取datetime.now()
+        
+    Returns:
+        (最小日序号, 最大日序号)，两端均包含
+    """
+    if now is None:
+        now = datetime.now()
+    
+    lower = now - timedelta(days=365)
+    upper = now + timedelta(days=366)
+    min_ordinal = lower.toordinal() + (lower != datetime(lower.year, lower.month, lower.day))
+    max_ordinal = upper.toordinal() - (upper == datetime(upper.year, upper.month, upper.day))
+    return min_ordinal, max_ordinal
+
+
+def _excel_serial_to_datetime(serial: float, epoch: datetime) -> Any:
+    """
+    把日期格式单元格的序列号转换为日期时间（与openpyxl的from_excel一致）
+    
+    时间部分四舍五入到毫秒；1900日期系统中小于60的序列号按Excel的1900年闰日错误前移一天；
+    小于1的序列号只有时间部分，返回time
+    
+    Args:
+        serial: 单元格中的日期序列号
+        epoch: 日期序列号的基准日期
+        
+    Returns:
+        datetime，序列号小于1时返回time
+    """
+    day, fraction = divmod(serial, 1)
+    time_part = timedelta(milliseconds=round(fraction * 86400000))
+    if 0 <= serial < 1 and time_part.days == 0:
+        return (datetime.min + time_part).time()
+    if 0 < serial < 60 and epoch == datetime(1899, 12, 30):
+        day += 1
+    return epoch + timedelta(days=day) + time_part
+
+
 class InputHandler:
     """
     Excel输入处理器
@@ -32,10 +228,7 @@ class InputHandler:
         """
         self.logger = get_logger()
         self.supported_extensions = ['.xlsx', '.xls']
-        # 航班号格式：前2位必须是字母或数字，后面3-4位必须是数字
-        # 但不能是纯数字（如12345）或只有1位前缀（如M5100）
-        # 例如：MU5100, G54381, 3U8888, CA1234等
-        self.flight_number_pattern = re.compile(r'^[A-Z0-9]{2}\d{3,4}$')
+        self.flight_number_pattern = _FLIGHT_NUMBER_RE
         self.date_formats = [
             '%Y-%m-%d',
             '%Y/%m/%d',
@@ -66,11 +259,10 @@ class InputHandler:
                 self.logger.info(f"开始读取Excel文件: {file_path}")
             
             # 读取Excel文件
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
-            worksheet = workbook.active
+            _, rows = self._load_sheet(file_path)
             
             # 提取航班数据
-            flight_data = self._extract_flight_data(worksheet)
+            flight_data = self._extract_flight_data(rows)
             
             # 验证和清理数据
             validated_data = self._validate_and_clean_data(flight_data)
@@ -78,7 +270,6 @@ class InputHandler:
             if self.logger:
                 self.logger.info(f"成功读取 {len(validated_data)} 条航班信息")
             
-            workbook.close()
             return validated_data
             
         except Exception as e:
@@ -87,106 +278,349 @@ class InputHandler:
                             {'file_path': file_path})
             raise
     
-    def _validate_file(self, file_path: str) -> None:
+    def _validate_file(self, file_path: str) -> os.stat_result:
         """
         验证文件的存在性和格式
         
         Args:
             file_path: 文件路径
             
+        Returns:
+            文件的stat结果，供调用方复用，避免重复stat
+            
         Raises:
             FileNotFoundError: 文件不存在
             ValueError: 文件格式不支持
         """
-        if not os.path.exists(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
             raise FileNotFoundError(f"文件不存在: {file_path}")
         
         file_ext = os.path.splitext(file_path)[1].lower()
         if file_ext not in self.supported_extensions:
             raise ValueError(f"不支持的文件格式: {file_ext}，支持的格式: {self.supported_extensions}")
         
-        # 检查文件是否可读
-        try:
-            with open(file_path, 'rb') as f:
-                f.read(1)
-        except PermissionError:
+        # 检查文件是否可读（只做权限检查，不打开文件）
+        if not os.access(file_path, os.R_OK):
             raise PermissionError(f"没有权限读取文件: {file_path}")
+        
+        return file_stat
+    
+    def _load_sheet(self, file_path: str) -> Tuple[str, List[Tuple[Any, Any]]]:
+        """
+        读取第一个工作表的A列（航班号）和B列（出发日期）
+        
+        优先使用python-calamine（Rust实现，不为每个单元格构造Python对象，
+        同时支持.xls），不可用或读取失败时，.xlsx文件直接流式解析XML，
+        最后回退到openpyxl
+        
+        Args:
+            file_path: Excel文件路径
+            
+        Returns:
+            (工作表名称, 行数据列表)，行数据为(A列值, B列值)元组，第1行对应列表下标0
+        """
+        if CALAMINE_AVAILABLE:
+            try:
+                workbook = CalamineWorkbook.from_path(file_path)
+                sheet_name = workbook.sheet_names[0]
+                sheet_rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+                return sheet_name, [self._first_two_columns(row) for row in sheet_rows]
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"calamine读取Excel失败，回退到openpyxl: {str(e)}")
+        
+        if file_path.lower().endswith('.xlsx'):
+            try:
+                return self._load_xlsx_sheet(file_path)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"流式读取xlsx失败，回退到openpyxl: {str(e)}")
+        
+        workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+        try:
+            worksheet = workbook.active
+            rows = [tuple(row) for row in worksheet.iter_rows(min_col=1, max_col=2, values_only=True)]
+            return worksheet.title, rows
+        finally:
+            workbook.close()
     
-    def _extract_flight_data(self, worksheet) -> List[Dict[str, Any]]:
+    def _load_xlsx_sheet(self, file_path: str) -> Tuple[str, List[Tuple[Any, Any]]]:
         """
-        从工作表中提取航班数据
+        直接解析xlsx压缩包，流式读取第一个工作表的A列和B列
+        
+        边解压边解析工作表XML，只转换A、B两列的单元格，不构造openpyxl的单元格对象
         
         Args:
-            worksheet: openpyxl工作表对象
+            file_path: xlsx文件路径
             
         Returns:
-            原始航班数据列表
+            (工作表名称, 行数据列表)，格式与_load_sheet相同
+        """
+        cell_tag = _XLSX_NS + 'c'
+        row_tag = _XLSX_NS + 'row'
+        
+        with zipfile.ZipFile(file_path) as archive:
+            sheet_name, sheet_path, epoch = self._read_xlsx_workbook(archive)
+            shared_strings = self._read_xlsx_shared_strings(archive)
+            date_styles = self._read_xlsx_date_styles(archive)
+            
+            rows: List[List[Any]] = []
+            with archive.open(sheet_path) as sheet:
+                for _, element in ElementTree.iterparse(sheet):
+                    if element.tag == cell_tag:
+                        reference = element.get('r')
+                        if not reference:
+                            raise ValueError("单元格缺少位置信息")
+                        
+                        column = reference.rstrip('0123456789')
+                        if column != 'A' and column != 'B':
+                            continue
+                        
+                        row_number = int(reference[len(column):])
+                        while len(rows) < row_number:
+                            rows.append([None, None])
+                        rows[row_number - 1][0 if column == 'A' else 1] = self._xlsx_cell_value(
+                            element, shared_strings, date_styles, epoch
+                        )
+                    elif element.tag == row_tag:
+                        # 只有其他列有值的行同样保留为空行，行数与openpyxl一致
+                        row_number = int(element.get('r', len(rows) + 1))
+                        while len(rows) < row_number:
+                            rows.append([None, None])
+                        element.clear()
+        
+        return sheet_name, [(cell_a, cell_b) for cell_a, cell_b in rows]
+    
+    @staticmethod
+    def _read_xlsx_workbook(archive: zipfile.ZipFile) -> Tuple[str, str, datetime]:
         """
-        flight_data = []
+        读取第一个工作表的名称、压缩包内路径和日期基准
+        
+        Args:
+            archive: xlsx压缩包
+            
+        Returns:
+            (工作表名称, 工作表XML路径, 日期序列号的基准日期)
+        """
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        
+        workbook_pr = workbook.find(_XLSX_NS + 'workbookPr')
+        date1904 = workbook_pr is not None and workbook_pr.get('date1904') in ('1', 'true')
+        epoch = datetime(1904, 1, 1) if date1904 else datetime(1899, 12, 30)
+        
+        sheet = workbook.find(f'{_XLSX_NS}sheets/{_XLSX_NS}sheet')
+        if sheet is None:
+            raise ValueError("工作簿中没有工作表")
+        
+        relationships = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        for relationship in relationships.iter(_PACKAGE_REL_NS + 'Relationship'):
+            if relationship.get('Id') == sheet.get(_XLSX_REL_ID):
+                target = relationship.get('Target', '')
+                sheet_path = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+                return sheet.get('name', ''), sheet_path, epoch
+        
+        raise ValueError("找不到工作表文件")
+    
+    @staticmethod
+    def _read_xlsx_shared_strings(archive: zipfile.ZipFile) -> List[str]:
+        """
+        读取共享字符串表
+        
+        Args:
+            archive: xlsx压缩包
+            
+        Returns:
+            共享字符串列表（按索引排列）
+        """
+        if 'xl/sharedStrings.xml' not in archive.namelist():
+            return []
+        
+        text_tag = _XLSX_NS + 't'
+        run_text_path = f'{_XLSX_NS}r/{_XLSX_NS}t'
+        shared_strings = []
+        
+        with archive.open('xl/sharedStrings.xml') as strings_file:
+            for _, element in ElementTree.iterparse(strings_file):
+                if element.tag == _XLSX_NS + 'si':
+                    # 普通文本只有一个t元素，富文本由多个r/t组成（不包含注音rPh）
+                    texts = element.findall(text_tag) or element.findall(run_text_path)
+                    shared_strings.append(''.join(text.text or '' for text in texts))
+                    element.clear()
+        
+        return shared_strings
+    
+    @staticmethod
+    def _read_xlsx_date_styles(archive: zipfile.ZipFile) -> Set[int]:
+        """
+        找出使用日期格式的单元格样式
+        
+        Args:
+            archive: xlsx压缩包
+            
+        Returns:
+            日期格式的单元格样式索引集合
+        """
+        if 'xl/styles.xml' not in archive.namelist():
+            return set()
+        
+        styles = ElementTree.fromstring(archive.read('xl/styles.xml'))
+        
+        date_format_ids = set(_BUILTIN_DATE_FORMAT_IDS)
+        for number_format in styles.iter(_XLSX_NS + 'numFmt'):
+            format_code = _FORMAT_LITERAL_RE.sub('', number_format.get('formatCode', '')).lower()
+            if _DATE_FORMAT_CHARS_RE.search(format_code):
+                date_format_ids.add(int(number_format.get('numFmtId', -1)))
+        
+        cell_formats = styles.find(_XLSX_NS + 'cellXfs')
+        if cell_formats is None:
+            return set()
+        
+        return {
+            index for index, cell_format in enumerate(cell_formats.iter(_XLSX_NS + 'xf'))
+            if int(cell_format.get('numFmtId', 0)) in date_format_ids
+        }
+    
+    @staticmethod
+    def _xlsx_cell_value(element: ElementTree.Element, shared_strings: List[str],
+                         date_styles: Set[int], epoch: datetime) -> Any:
+        """
+        把单元格XML转换为Python值（与openpyxl的data_only结果一致）
+        
+        Args:
+            element: 单元格元素
+            shared_strings: 共享字符串列表
+            date_styles: 日期格式的单元格样式索引集合
+            epoch: 日期序列号的基准日期
+            
+        Returns:
+            单元格值，空单元格返回None
+        """
+        cell_type = element.get('t', 'n')
+        
+        if cell_type == 'inlineStr':
+            return ''.join(text.text or '' for text in element.iter(_XLSX_NS + 't')) or None
+        
+        value = element.findtext(_XLSX_NS + 'v')
+        if value is None or value == '':
+            return None
+        
+        if cell_type == 's':
+            return shared_strings[int(value)]
+        if cell_type == 'b':
+            return value == '1'
+        if cell_type != 'n':
+            # str（公式结果）、e（错误值）等按文本返回
+            return value
+        
+        if int(element.get('s', 0)) in date_styles:
+            return _excel_serial_to_datetime(float(value), epoch)
+        
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    
+    @staticmethod
+    def _first_two_columns(row: List[Any]) -> Tuple[Any, Any]:
+        """
+        取一行的前两列，空单元格统一为None，整数值的浮点数还原为int（与openpyxl一致）
+        
+        calamine把所有数字单元格都返回为float，不还原的话20261020会变成"20261020.0"，
+        无法再按%Y%m%d解析
+        
+        Args:
+            row: calamine返回的行数据
+            
+        Returns:
+            (A列值, B列值)
+        """
+        cell_a = row[0] if len(row) > 0 else None
+        cell_b = row[1] if len(row) > 1 else None
+        return (InputHandler._normalize_calamine_value(cell_a),
+                InputHandler._normalize_calamine_value(cell_b))
+    
+    @staticmethod
+    def _normalize_calamine_value(value: Any) -> Any:
+        """
+        把calamine的单元格值转换为openpyxl的表示
+        
+        Args:
+            value: calamine返回的单元格值
+            
+        Returns:
+            空字符串返回None，整数值的float返回int，其他值原样返回
+        """
+        if value == '':
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+    
+    def _extract_flight_data(self, rows: List[Tuple[Any, Any]]) -> _RawFlightColumns:
+        """
+        从工作表行数据中提取航班数据
+        
+        Args:
+            rows: _load_sheet返回的行数据
+            
+        Returns:
+            按列存储的原始航班数据
+        """
+        flight_data = _RawFlightColumns([], [], [])
         
         # 检测数据开始行（跳过标题行）
-        start_row = self._detect_data_start_row(worksheet)
+        start_row = self._detect_data_start_row(rows)
         
         if self.logger:
             self.logger.info(f"数据开始行: {start_row}")
         
-        # 读取数据行
-        for row_num in range(start_row, worksheet.max_row + 1):
-            # 读取A列（航班号）和B列（出发日期）
-            flight_number_cell = worksheet.cell(row=row_num, column=1)
-            departure_date_cell = worksheet.cell(row=row_num, column=2)
-            
-            flight_number = flight_number_cell.value
-            departure_date = departure_date_cell.value
-            
+        row_indices, flight_numbers, departure_dates = flight_data
+        
+        # 读取数据行：A列（航班号）和B列（出发日期），直接遍历行数据而不按行号下标访问
+        for row_num, (flight_number, departure_date) in enumerate(islice(rows, start_row - 1, None), start_row):
             # 跳过空行
             if not flight_number and not departure_date:
                 continue
             
-            flight_data.append({
-                'flight_number': flight_number,
-                'departure_date': departure_date,
-                'row_index': row_num,
-                'original_flight_number': flight_number,
-                'original_departure_date': departure_date
-            })
+            row_indices.append(row_num)
+            flight_numbers.append(flight_number)
+            departure_dates.append(departure_date)
         
         return flight_data
     
-    def _detect_data_start_row(self, worksheet) -> int:
+    def _detect_data_start_row(self, rows: List[Tuple[Any, Any]]) -> int:
         """
         检测数据开始行（自动跳过标题行）
         
         Args:
-            worksheet: openpyxl工作表对象
+            rows: _load_sheet返回的行数据
             
         Returns:
             数据开始行号（1-based）
         """
         # 检查前几行，寻找可能的标题行
-        for row_num in range(1, min(6, worksheet.max_row + 1)):
-            cell_a = worksheet.cell(row=row_num, column=1).value
-            cell_b = worksheet.cell(row=row_num, column=2).value
+        for row_num in range(1, min(6, len(rows) + 1)):
+            cell_a, cell_b = rows[row_num - 1]
             
             # 如果第一列包含"航班"或"flight"等关键词，认为是标题行
-            if cell_a and isinstance(cell_a, str):
-                if any(keyword in cell_a.lower() for keyword in ['航班', 'flight', '班次']):
-                    return row_num + 1
+            if cell_a and isinstance(cell_a, str) and _FLIGHT_HEADER_RE.search(cell_a):
+                return row_num + 1
             
             # 如果第二列包含"日期"或"date"等关键词，认为是标题行
-            if cell_b and isinstance(cell_b, str):
-                if any(keyword in cell_b.lower() for keyword in ['日期', 'date', '时间']):
-                    return row_num + 1
+            if cell_b and isinstance(cell_b, str) and _DATE_HEADER_RE.search(cell_b):
+                return row_num + 1
         
         # 默认从第2行开始（假设第1行是标题）
         return 2
     
-    def _validate_and_clean_data(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    def _validate_and_clean_data(self, raw_data: _RawFlightColumns) -> List[Dict[str, str]]:
         """
         验证和清理航班数据
         
         Args:
-            raw_data: 原始数据列表
+            raw_data: _extract_flight_data返回的原始航班数据
             
         Returns:
             验证和清理后的数据列表
@@ -194,34 +628,47 @@ class InputHandler:
         validated_data = []
         errors = []
         
-        for i, item in enumerate(raw_data):
+        # 行数较多时先批量校验，批量校验未通过的行再逐行校验以得到具体的错误信息
+        total_rows = len(raw_data.row_indices)
+        date_range = _date_ordinal_range()
+        batch_results = None
+        if PANDAS_AVAILABLE and total_rows >= _VECTORIZE_MIN_ROWS:
+            batch_results = self._batch_validate(raw_data.flight_numbers, raw_data.departure_dates,
+                                                 date_range)
+        
+        for i, (row_index, raw_flight_number, raw_departure_date) in enumerate(zip(*raw_data)):
+            if batch_results is not None and batch_results[i] is not None:
+                flight_number, departure_date = batch_results[i]
+                validated_data.append({
+                    'flight_number': flight_number,
+                    'departure_date': departure_date,
+                    'row_index': row_index
+                })
+                continue
+            
             try:
                 # 清理和验证航班号
-                flight_number = self._clean_and_validate_flight_number(
-                    item['flight_number'], item['row_index']
-                )
+                flight_number = self._clean_and_validate_flight_number(raw_flight_number, row_index)
                 
                 # 清理和验证出发日期
-                departure_date = self._clean_and_validate_date(
-                    item['departure_date'], item['row_index']
-                )
+                departure_date = self._clean_and_validate_date(raw_departure_date, row_index, date_range)
                 
                 if flight_number and departure_date:
                     validated_data.append({
                         'flight_number': flight_number,
                         'departure_date': departure_date,
-                        'row_index': item['row_index']
+                        'row_index': row_index
                     })
                 
             except Exception as e:
-                error_msg = f"第{item['row_index']}行数据验证失败: {str(e)}"
+                error_msg = f"第{row_index}行数据验证失败: {str(e)}"
                 errors.append(error_msg)
                 if self.logger:
                     self.logger.warning(error_msg)
         
         # 记录验证结果
         if self.logger:
-            self.logger.info(f"数据验证完成: 总行数={len(raw_data)}, 有效数据={len(validated_data)}, 错误数据={len(errors)}")
+            self.logger.info(f"数据验证完成: 总行数={total_rows}, 有效数据={len(validated_data)}, 错误数据={len(errors)}")
             
             if errors:
                 self.logger.warning(f"发现 {len(errors)} 个数据错误:")
@@ -235,6 +682,57 @@ class InputHandler:
         
         return validated_data
     
+    def _batch_validate(self, flight_numbers: List[Any], departure_dates: List[Any],
+                        date_range: Tuple[int, int]) -> List[Optional[Tuple[str, str]]]:
+        """
+        用pandas批量校验航班号和出发日期
+        
+        结果与逐行校验一致：每种日期格式对所有未解析的行做一次向量化解析，
+        超出日期范围的行继续尝试后续格式
+        
+        Args:
+            flight_numbers: 原始航班号列表
+            departure_dates: 原始出发日期列表
+            date_range: _date_ordinal_range返回的日期范围
+            
+        Returns:
+            与输入一一对应的列表，校验通过的行为(航班号, 出发日期)，
+            未通过或需要逐行处理的行为None
+        """
+        flights = pd.Series(flight_numbers, dtype=object)
+        dates = pd.Series(departure_dates, dtype=object)
+        
+        # 航班号：去除空白后检查格式，格式正确的（均为ASCII字母数字）再批量转换为大写
+        flight_strs = flights.map(str).str.strip()
+        flight_valid = flights.notna() & _flight_number_mask(flight_strs.tolist())
+        flight_strs.loc[flight_valid] = _upper_ascii(flight_strs[flight_valid].tolist())
+        
+        # 日期：date/datetime对象直接格式化，其他值按格式顺序解析
+        formatted_dates = pd.Series([None] * len(flights), dtype=object)
+        is_date = dates.map(lambda value: isinstance(value, date))
+        formatted_dates[is_date] = dates[is_date].map(_format_date)
+        
+        date_strs = dates.map(str).str.strip()
+        pending = flight_valid & dates.notna() & ~is_date & (date_strs != '')
+        min_date = pd.Timestamp(datetime.fromordinal(date_range[0]))
+        max_date = pd.Timestamp(datetime.fromordinal(date_range[1]))
+        
+        for date_format in self.date_formats:
+            if not pending.any():
+                break
+            
+            parsed = pd.to_datetime(date_strs.where(pending), format=date_format, errors='coerce')
+            accepted = pending & parsed.notna() & (parsed >= min_date) & (parsed <= max_date)
+            
+            formatted_dates[accepted] = parsed[accepted].dt.strftime('%Y-%m-%d')
+            pending &= ~accepted
+        
+        valid = flight_valid & formatted_dates.notna()
+        return [
+            (sys.intern(flight), departure_date) if is_valid else None
+            for flight, departure_date, is_valid in zip(flight_strs, formatted_dates, valid)
+        ]
+    
     def _clean_and_validate_flight_number(self, flight_number: Any, row_index: int) -> Optional[str]:
         """
         清理和验证航班号
@@ -257,25 +755,29 @@ class InputHandler:
             return None
         
         # 检查是否包含不允许的字符（允许字母、数字，大小写均可）
-        if not re.match(r'^[A-Za-z0-9]+$', flight_str):
+        if not (flight_str.isascii() and flight_str.isalnum()):
             raise ValueError(f"航班号格式不正确: {flight_number} (包含无效字符，只允许字母和数字)")
         
         # 转换为大写进行后续验证
         flight_str = flight_str.upper()
         
         # 验证航班号格式：2位字母或数字 + 3-4位数字
-        if not self.flight_number_pattern.match(flight_str):
+        if not _FLIGHT_NUMBER_RE.match(flight_str):
             raise ValueError(f"航班号格式不正确: {flight_number} (应为2位字母或数字+3-4个数字，如MU5100、G54381、3U8888)")
         
-        return flight_str
+        # 同一航班号通常出现在多行中，驻留后各行共用同一个字符串对象
+        return sys.intern(flight_str)
     
-    def _clean_and_validate_date(self, departure_date: Any, row_index: int) -> Optional[str]:
+    def _clean_and_validate_date(self, departure_date: Any, row_index: int,
+                                 date_range: Optional[Tuple[int, int]] = None) -> Optional[str]:
         """
         清理和验证出发日期
         
         Args:
             departure_date: 原始出发日期
             row_index: 行索引
+            date_range: _date_ordinal_range返回的日期范围，批量校验时由调用方计算一次；
+                为None时按当前时间计算
             
         Returns:
             格式化后的日期字符串（YYYY-MM-DD），如果无效则返回None
@@ -283,28 +785,36 @@ class InputHandler:
         if not departure_date:
             return None
         
-        # 如果是datetime对象，直接格式化
-        if isinstance(departure_date, datetime):
-            return departure_date.strftime('%Y-%m-%d')
+        # 如果是datetime/date对象，直接格式化
+        if isinstance(departure_date, date):
+            return _format_date(departure_date)
         
         # 转换为字符串并清理
         date_str = str(departure_date).strip()
         
+        if date_range is None:
+            date_range = _date_ordinal_range()
+        min_ordinal, max_ordinal = date_range
+        
+        # 常见写法直接按位置解析
+        parsed_date = _parse_compact_date(date_str)
+        if parsed_date is not None and min_ordinal <= parsed_date.toordinal() <= max_ordinal:
+            return _format_date(parsed_date)
+        
         # 尝试解析不同的日期格式
         for date_format in self.date_formats:
             try:
                 parsed_date = datetime.strptime(date_str, date_format)
                 
                 # 验证日期合理性（不能是过去太久或未来太远的日期）
-                current_date = datetime.now()
-                days_diff = (parsed_date - current_date).days
+                ordinal = parsed_date.toordinal()
                 
-                if days_diff < -365:  # 不能是一年前的日期
+                if ordinal < min_ordinal:  # 不能是一年前的日期
                     raise ValueError(f"日期过于久远: {date_str}")
-                if days_diff > 365:  # 不能是一年后的日期
+                if ordinal > max_ordinal:  # 不能是一年后的日期
                     raise ValueError(f"日期过于遥远: {date_str}")
                 
-                return parsed_date.strftime('%Y-%m-%d')
+                return _format_date(parsed_date)
                 
             except ValueError:
                 continue
@@ -373,21 +883,17 @@ class InputHandler:
             self._validate_file(file_path)
             
             # 读取文件并检查格式
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
-            worksheet = workbook.active
+            _, rows = self._load_sheet(file_path)
             
             # 检查是否有数据
-            if worksheet.max_row < 2:
+            if len(rows) < 2:
                 errors.append("文件中没有数据行")
             
             # 检查前几行数据格式
-            start_row = self._detect_data_start_row(worksheet)
-            sample_rows = min(5, worksheet.max_row - start_row + 1)
+            start_row = self._detect_data_start_row(rows)
+            sample = islice(rows, start_row - 1, start_row + 4)
             
-            for row_num in range(start_row, start_row + sample_rows):
-                flight_number = worksheet.cell(row=row_num, column=1).value
-                departure_date = worksheet.cell(row=row_num, column=2).value
-                
+            for row_num, (flight_number, departure_date) in enumerate(sample, start_row):
                 if not flight_number and not departure_date:
                     continue
                 
@@ -403,8 +909,6 @@ class InputHandler:
                 except Exception as e:
                     errors.append(f"第{row_num}行日期格式错误: {str(e)}")
             
-            workbook.close()
-            
         except Exception as e:
             errors.append(f"文件读取错误: {str(e)}")
         
@@ -421,25 +925,23 @@ class InputHandler:
             文件信息字典
         """
         try:
-            file_stat = os.stat(file_path)
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
-            worksheet = workbook.active
+            file_stat = self._validate_file(file_path)
+            sheet_name, rows = self._load_sheet(file_path)
             
-            start_row = self._detect_data_start_row(worksheet)
-            data_rows = max(0, worksheet.max_row - start_row + 1)
+            start_row = self._detect_data_start_row(rows)
+            data_rows = max(0, len(rows) - start_row + 1)
             
             info = {
                 'file_path': file_path,
                 'file_size': file_stat.st_size,
                 'file_size_mb': round(file_stat.st_size / 1024 / 1024, 2),
                 'modified_time': datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'total_rows': worksheet.max_row,
+                'total_rows': len(rows),
                 'data_rows': data_rows,
                 'start_row': start_row,
-                'worksheet_name': worksheet.title
+                'worksheet_name': sheet_name
             }
             
-            workbook.close()
             return info
             
         except Exception as e:
@@ -448,6 +950,25 @@ class InputHandler:
             return {'error': str(e)}
 
 
+# 便捷函数使用的默认输入处理器
+_default_handler = None
+_default_handler_lock = threading.Lock()
+
+
+def _get_default_handler() -> InputHandler:
+    """
+    获取便捷函数使用的默认输入处理器
+    
+    Returns:
+        输入处理器实例
+    """
+    global _default_handler
+    with _default_handler_lock:
+        if _default_handler is None:
+            _default_handler = InputHandler()
+    return _default_handler
+
+
 # 便捷函数
 def read_flight_data(file_path: str) -> List[Dict[str, str]]:
     """
@@ -459,7 +980,7 @@ def read_flight_data(file_path: str) -> List[Dict[str, str]]:
     Returns:
         航班信息列表
     """
-    handler = InputHandler()
+    handler = _get_default_handler()
     return handler.read_flight_data(file_path)
 
 
@@ -470,7 +991,7 @@ def create_sample_input_file(file_path: str) -> None:
     Args:
         file_path: 输出文件路径
     """
-    handler = InputHandler()
+    handler = _get_default_handler()
     handler.create_sample_input_file(file_path)
 
 
@@ -484,5 +1005,5 @@ def validate_input_file(file_path: str) -> Tuple[bool, List[str]]:
     Returns:
         (是否有效, 错误信息列表)
     """
-    handler = InputHandler()
+    handler = _get_default_handler()
     return handler.validate_input_file_format(file_path)
\ No newline at end of file
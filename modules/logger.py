@@ -8,15 +8,49 @@
 - 异常信息详细记录
 - 航班处理过程跟踪
 - 系统状态统计
+- 后台线程写日志，记录调用只入队不阻塞
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
-import traceback
+
+
+# 日志记录不使用进程/线程信息，关闭后创建LogRecord时不再获取这些属性
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# 默认日志格式；include_source为True时额外输出代码位置（模块.函数:行号）
+_DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_SOURCE_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(module)s.%(funcName)s:%(lineno)d] - %(message)s'
+
+# 航班处理过程中按错误/警告级别记录的状态
+_ERROR_STATUSES = frozenset(['失败', '异常', '错误'])
+_WARNING_STATUSES = frozenset(['警告', '重试'])
+
+
+class _ExceptionContext:
+    """
+    异常上下文的延迟格式化包装
+    
+    作为日志参数传入，只有处理器真正输出该条日志时才拼接上下文字符串
+    """
+    
+    __slots__ = ('context',)
+    
+    def __init__(self, context: Optional[Dict[str, Any]]):
+        self.context = context
+    
+    def __str__(self) -> str:
+        if not self.context:
+            return ''
+        return ' | 上下文: ' + ', '.join(f"{k}={v}" for k, v in self.context.items())
 
 
 class FlightCrawlerLogger:
@@ -35,13 +69,17 @@ class FlightCrawlerLogger:
         """
         self.config = config
         self.logger = None
+        self._listener = None
         self._setup_logger()
+        atexit.register(self.close)
     
     def _setup_logger(self) -> None:
         """
         设置日志系统配置
         
-        配置文件日志和控制台日志，支持按天轮转
+        配置文件日志和控制台日志，支持按天轮转。
+        文件和控制台处理器由QueueListener在后台线程中调用，
+        logger本身只挂QueueHandler，记录日志时仅将LogRecord放入队列
         """
         # 创建日志目录
         log_dir = self.config.get('log_dir', 'logs')
@@ -55,10 +93,12 @@ class FlightCrawlerLogger:
         # 清除已有的处理器
         self.logger.handlers.clear()
         
+        handlers = []
+        
         # 创建格式化器
+        default_format = _SOURCE_FORMAT if self.config.get('include_source', False) else _DEFAULT_FORMAT
         formatter = logging.Formatter(
-            fmt=self.config.get('format', 
-                '%(asctime)s - %(name)s - %(levelname)s - [%(module)s.%(funcName)s:%(lineno)d] - %(message)s'),
+            fmt=self.config.get('format') or default_format,
             datefmt=self.config.get('date_format', '%Y-%m-%d %H:%M:%S')
         )
         
@@ -90,13 +130,34 @@ class FlightCrawlerLogger:
             )
         
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        handlers.append(file_handler)
         
         # 设置控制台处理器
         if self.config.get('console_output', True):
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
+        
+        # 通过队列将实际的写文件/输出交给后台线程
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._listener.start()
+    
+    def close(self) -> None:
+        """
+        停止后台日志线程并关闭处理器
+        
+        停止前会先写完队列中剩余的日志记录，重复调用无副作用
+        """
+        listener = self._listener
+        if listener is None:
+            return
+        
+        self._listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
     
     def _parse_size(self, size_str: str) -> int:
         """
@@ -118,55 +179,72 @@ class FlightCrawlerLogger:
         else:
             return int(size_str)
     
-    def debug(self, message: str) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        判断指定级别的日志是否会被记录（用于跳过只在调试时需要的计算）
+        
+        Args:
+            level: 日志级别，如logging.DEBUG
+            
+        Returns:
+            该级别是否启用
+        """
+        return bool(self.logger) and self.logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args: Any) -> None:
         """
         记录调试信息
         
         Args:
-            message: 调试消息
+            message: 调试消息（可包含%格式占位符）
+            args: 占位符参数，仅在该级别启用时才格式化
         """
         if self.logger:
-            self.logger.debug(message)
+            self.logger.debug(message, *args, stacklevel=2)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """
         记录一般信息
         
         Args:
-            message: 信息消息
+            message: 信息消息（可包含%格式占位符）
+            args: 占位符参数，仅在该级别启用时才格式化
         """
         if self.logger:
-            self.logger.info(message)
+            self.logger.info(message, *args, stacklevel=2)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """
         记录警告信息
         
         Args:
-            message: 警告消息
+            message: 警告消息（可包含%格式占位符）
+            args: 占位符参数，仅在该级别启用时才格式化
         """
         if self.logger:
-            self.logger.warning(message)
+            self.logger.warning(message, *args, stacklevel=2)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """
         记录错误信息
         
         Args:
-            message: 错误消息
+            message: 错误消息（可包含%格式占位符）
+            args: 占位符参数，仅在该级别启用时才格式化
         """
         if self.logger:
-            self.logger.error(message)
+            self.logger.error(message, *args, stacklevel=2)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """
         记录严重错误信息
         
         Args:
-            message: 严重错误消息
+            message: 严重错误消息（可包含%格式占位符）
+            args: 占位符参数，仅在该级别启用时才格式化
         """
         if self.logger:
-            self.logger.critical(message)
+            self.logger.critical(message, *args, stacklevel=2)
     
     def log_flight_process(self, flight_number: str, operation: str, status: str, details: str = "") -> None:
         """
@@ -178,18 +256,21 @@ class FlightCrawlerLogger:
             status: 操作状态，如"开始", "成功", "失败", "重试"
             details: 详细信息或错误描述
         """
-        message = f"航班 {flight_number} - {operation} - {status}"
-        if details:
-            message += f" - {details}"
-        
-        if status in ["成功", "开始"]:
-            self.info(message)
-        elif status == "重试":
-            self.warning(message)
+        if status == "重试":
+            level = logging.WARNING
         elif status == "失败":
-            self.error(message)
+            level = logging.ERROR
+        else:
+            level = logging.INFO
+        
+        # 级别未启用时不格式化消息
+        if not self.logger or not self.logger.isEnabledFor(level):
+            return
+        
+        if details:
+            self.logger.log(level, "航班 %s - %s - %s - %s", flight_number, operation, status, details, stacklevel=2)
         else:
-            self.info(message)
+            self.logger.log(level, "航班 %s - %s - %s", flight_number, operation, status, stacklevel=2)
     
     def log_exception(self, module_name: str, function_name: str, exception: Exception, 
                      context: Optional[Dict[str, Any]] = None) -> None:
@@ -202,18 +283,14 @@ class FlightCrawlerLogger:
             exception: 异常对象
             context: 异常发生时的上下文信息
         """
-        error_msg = f"异常发生在 {module_name}.{function_name}: {type(exception).__name__}: {str(exception)}"
+        if not self.logger or not self.logger.isEnabledFor(logging.ERROR):
+            return
         
-        if context:
-            context_str = ", ".join([f"{k}={v}" for k, v in context.items()])
-            error_msg += f" | 上下文: {context_str}"
-        
-        # 记录异常信息
-        self.error(error_msg)
-        
-        # 记录堆栈跟踪
-        stack_trace = traceback.format_exc()
-        self.error(f"堆栈跟踪:\n{stack_trace}")
+        # 异常信息和堆栈跟踪记录为同一条日志，消息、上下文和堆栈都由logging在输出时才格式化，
+        # 堆栈只格式化一次并供所有处理器共用
+        self.logger.error("异常发生在 %s.%s: %s: %s%s", module_name, function_name,
+                          type(exception).__name__, exception, _ExceptionContext(context),
+                          exc_info=exception)
     
     def log_system_status(self, total_flights: int, processed: int, success: int, failed: int) -> None:
         """
@@ -225,10 +302,12 @@ class FlightCrawlerLogger:
             success: 成功数量
             failed: 失败数量
         """
+        if not self.logger or not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         success_rate = (success / processed * 100) if processed > 0 else 0
-        message = (f"系统状态统计 - 总数: {total_flights}, 已处理: {processed}, "
-                  f"成功: {success}, 失败: {failed}, 成功率: {success_rate:.1f}%")
-        self.info(message)
+        self.logger.info("系统状态统计 - 总数: %d, 已处理: %d, 成功: %d, 失败: %d, 成功率: %.1f%%",
+                         total_flights, processed, success, failed, success_rate)
     
     def log_retry_attempt(self, operation: str, attempt: int, max_attempts: int, 
                          reason: str = "") -> None:
@@ -310,6 +389,9 @@ def setup_logger(config: Dict[str, Any]) -> FlightCrawlerLogger:
         配置好的Logger实例
     """
     global _logger_instance
+    if _logger_instance is not None:
+        # 先停止旧实例的后台线程，保证其队列中的日志写完
+        _logger_instance.close()
     _logger_instance = FlightCrawlerLogger(config)
     return _logger_instance
 
@@ -347,17 +429,24 @@ def log_flight_process(flight_number: str, process: str, status: str, details: s
         details: 详细信息
     """
     logger = get_logger()
-    if logger:
-        message = f"[{flight_number}] {process} - {status}"
-        if details:
-            message += f" | {details}"
-        
-        if status in ['失败', '异常', '错误']:
-            logger.error(message)
-        elif status in ['警告', '重试']:
-            logger.warning(message)
-        else:
-            logger.info(message)
+    if not logger or not logger.logger:
+        return
+    
+    if status in _ERROR_STATUSES:
+        level = logging.ERROR
+    elif status in _WARNING_STATUSES:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+    
+    # 级别未启用时不格式化消息
+    if not logger.logger.isEnabledFor(level):
+        return
+    
+    if details:
+        logger.logger.log(level, "[%s] %s - %s | %s", flight_number, process, status, details, stacklevel=2)
+    else:
+        logger.logger.log(level, "[%s] %s - %s", flight_number, process, status, stacklevel=2)
 
 
 def log_system_info(message: str):
@@ -10,12 +10,23 @@
 - 多OCR引擎支持（Tesseract、PaddleOCR、ddddocr）
 """
 
-import base64
+import hashlib
+import importlib.util
 import io
+import json
+import logging
+import os
 import re
 import time
-from typing import Optional, Tuple, Dict, Any, List
-from PIL import Image, ImageEnhance, ImageFilter
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Tuple, Dict, Any, List, Union
+
+from PIL import Image
 import cv2
 import numpy as np
 from selenium.webdriver.remote.webelement import WebElement
@@ -27,6 +38,9 @@ except ImportError:
     TESSERACT_AVAILABLE = False
     pytesseract = None
 
+# tesserocr在首次创建识别接口时才导入：加载libtesseract之前需要先设置好OMP_THREAD_LIMIT
+TESSEROCR_AVAILABLE = importlib.util.find_spec('tesserocr') is not None
+
 try:
     from paddleocr import PaddleOCR
     PADDLEOCR_AVAILABLE = True
@@ -45,6 +59,218 @@ from .logger import get_logger, log_exception
 from .config_manager import get_config_manager
 
 
+# 验证码格式：4位小写字母
+_CAPTCHA_RE = re.compile(r'^[a-z]{4}$')
+
+# 时间格式：HH:MM
+_TIME_RE = re.compile(r'^\d{1,2}:\d{2}$')
+
+# 清理时间识别结果：在文本中查找HH:MM或H:MM，或整体为4位数字HHMM
+_TIME_SEARCH_RE = re.compile(r'(\d{1,2}):(\d{2})')
+_FOUR_DIGIT_TIME_RE = re.compile(r'^(\d{4})$')
+
+# 出现异常后重试前的等待时间：每次递增0.05秒，最多0.2秒
+_RETRY_DELAY_STEP = 0.05
+_RETRY_DELAY_MAX = 0.2
+
+# 识别结果缓存的默认最大条目数（ocr.result_cache_size配置项）：
+# 每条只有16字节摘要和几个字符的结果，一万条约占2MB
+_RESULT_CACHE_SIZE = 10000
+
+# Tesseract可识别的字符（按图片类型）
+_TESSERACT_WHITELISTS = {
+    'captcha': 'abcdefghijklmnopqrstuvwxyz',
+    'time': '0123456789:'
+}
+
+# pytesseract识别参数（按图片类型）：单词模式，限定可识别的字符
+_TESSERACT_CONFIGS = {
+    image_type: f'--psm 8 --oem 3 -c tessedit_char_whitelist={whitelist}'
+    for image_type, whitelist in _TESSERACT_WHITELISTS.items()
+}
+
+# 图片放大使用的插值方法（ocr.resize_interpolation配置项）
+_RESIZE_INTERPOLATIONS = {
+    'cubic': cv2.INTER_CUBIC,
+    'lanczos': cv2.INTER_LANCZOS4
+}
+
+# ddddocr字符范围（按图片类型），其他类型使用_DDDD_DEFAULT_RANGES
+_DDDD_RANGES = {
+    # 验证码使用小写英文a-z + 大写英文A-Z + 整数0-9
+    'captcha': 3,
+    # 时间识别使用数字+冒号
+    'time': 5
+}
+# 默认使用小写英文a-z + 大写英文A-Z + 整数0-9
+_DDDD_DEFAULT_RANGES = 6
+
+# PIL ImageFilter.SHARPEN的卷积核（缩放系数16）
+_SHARPEN_KERNEL = np.array([[-2, -2, -2],
+                            [-2, 32, -2],
+                            [-2, -2, -2]], dtype=np.float32)
+
+# 验证码预处理方法1的CLAHE对象和形态学核：只创建一次，
+# CLAHE对象内部有工作缓冲区，不能被多个线程同时使用
+_CLAHE = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
+_CLAHE_LOCK = threading.Lock()
+_MORPH_KERNEL = np.ones((2, 2), np.uint8)
+
+
+def _limit_library_threads() -> None:
+    """
+    让Tesseract和OpenCV只使用单线程
+    
+    识别已经按图片在线程池中并行，Tesseract内部再开OpenMP线程只会相互争抢CPU；
+    预处理的图片都很小，OpenCV内部并行的开销大于收益。
+    OMP_THREAD_LIMIT需要在加载libtesseract（导入tesserocr）之前设置，
+    pytesseract启动的子进程继承该环境变量；启动前已设置的值不覆盖
+    """
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    cv2.setNumThreads(1)
+
+
+def _image_digest(image_data: bytes) -> bytes:
+    """
+    计算图片数据的摘要，用于识别结果缓存和判断图片是否变化
+    
+    Args:
+        image_data: 图片二进制数据
+        
+    Returns:
+        16字节的BLAKE2b摘要
+    """
+    return hashlib.blake2b(image_data, digest_size=16).digest()
+
+
+def _decode_gray(image_data: Union[bytes, np.ndarray]) -> np.ndarray:
+    """
+    将图片二进制数据直接解码为灰度图数组
+    
+    优先使用OpenCV解码，OpenCV不支持的图片格式再使用PIL解码
+    
+    Args:
+        image_data: 图片二进制数据（已解码的灰度图数组原样返回）
+        
+    Returns:
+        uint8灰度图数组
+    """
+    if isinstance(image_data, np.ndarray):
+        return image_data
+    gray = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        gray = np.asarray(Image.open(io.BytesIO(image_data)).convert('L'))
+    return gray
+
+
+def _position_maxima(probabilities: List) -> Tuple[List[int], List[int], List[float]]:
+    """
+    找出ddddocr概率结果中每个位置置信度最高的字符
+    
+    概率矩阵规整时用NumPy整体计算；各位置长度不一致（或有空位置）时逐行单次遍历
+    
+    Args:
+        probabilities: 概率列表（每个位置一行，每行对应字符集中的各字符）
+        
+    Returns:
+        (位置列表, 字符集索引列表, 置信度列表)，跳过空位置
+    """
+    try:
+        probs = np.asarray(probabilities, dtype=np.float64)
+    except ValueError:
+        probs = None
+    
+    if probs is not None and probs.ndim == 2 and probs.shape[1] > 0:
+        return list(range(probs.shape[0])), probs.argmax(axis=1).tolist(), probs.max(axis=1).tolist()
+    
+    positions, indices, maxima = [], [], []
+    for position, prob_list in enumerate(probabilities):
+        if prob_list:
+            max_idx, max_prob = max(enumerate(prob_list), key=itemgetter(1))
+            positions.append(position)
+            indices.append(max_idx)
+            maxima.append(max_prob)
+    return positions, indices, maxima
+
+
+def _open_image(image_data: Union[bytes, np.ndarray]) -> Image.Image:
+    """
+    预处理失败时返回的原始图片
+    
+    Args:
+        image_data: 图片二进制数据或已解码的灰度图数组
+        
+    Returns:
+        PIL图片对象
+    """
+    if isinstance(image_data, np.ndarray):
+        return Image.fromarray(image_data)
+    return Image.open(io.BytesIO(image_data))
+
+
+def _contrast_lut(gray: np.ndarray, factor: float) -> np.ndarray:
+    """
+    生成与ImageEnhance.Contrast(factor)等效的查找表
+    
+    Args:
+        gray: 灰度图数组（uint8）
+        factor: 对比度增强系数
+        
+    Returns:
+        256项的uint8查找表，配合cv2.LUT使用
+    """
+    # 以平均灰度为中心拉伸（cv2.mean不需要先把整张图转换为float64）
+    return _contrast_lut_for_mean(int(cv2.mean(gray)[0] + 0.5), factor)
+
+
+@lru_cache(maxsize=512)
+def _contrast_lut_for_mean(mean: int, factor: float) -> np.ndarray:
+    """
+    生成以mean为中心、按factor拉伸的查找表（平均灰度只有256种，查找表生成一次后重复使用）
+    
+    Args:
+        mean: 取整后的平均灰度
+        factor: 对比度增强系数
+        
+    Returns:
+        256项的只读uint8查找表
+    """
+    levels = np.arange(256, dtype=np.float64)
+    lut = np.clip(mean + factor * (levels - mean), 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def _contrast_sharpen_threshold(gray: np.ndarray, factor: float = 2.0, threshold: int = 127) -> np.ndarray:
+    """
+    对比度增强、锐化和二值化合并为一次查表、一次卷积和一次比较
+    
+    结果与依次执行ImageEnhance.Contrast(factor)、ImageFilter.SHARPEN和
+    cv2.threshold(threshold, THRESH_BINARY)完全一致：
+    PIL锐化结果按floor(x/16 + 0.5)取整，"大于threshold"等价于卷积值 >= 16*threshold + 8，
+    无需生成中间的锐化图片；PIL锐化不处理最外一圈像素，这些像素直接按对比度增强后的值二值化。
+    各步骤都在OpenCV的C++代码中执行，执行期间释放GIL，可在多个识别线程中并行
+    
+    Args:
+        gray: 灰度图数组（uint8）
+        factor: 对比度增强系数
+        threshold: 二值化阈值
+        
+    Returns:
+        二值化后的数组（0或255）
+    """
+    enhanced = cv2.LUT(gray, _contrast_lut(gray, factor))
+    
+    # 锐化和二值化：卷积值为整数，float32可精确表示；cv2.compare直接输出0/255
+    sharpened = cv2.filter2D(enhanced, cv2.CV_32F, _SHARPEN_KERNEL)
+    binary = cv2.compare(sharpened, 16 * threshold + 8, cv2.CMP_GE)
+    
+    for edge in (np.s_[0, :], np.s_[-1, :], np.s_[:, 0], np.s_[:, -1]):
+        binary[edge] = np.where(enhanced[edge] > threshold, 255, 0)
+    
+    return binary
+
+
 class OCRProcessor:
     """
     OCR识别处理器
@@ -52,6 +278,19 @@ class OCRProcessor:
     提供验证码和时间图片的OCR识别功能
     """
     
+    # PaddleOCR模型按(语言, 是否启用方向分类)缓存，多个处理器实例共享同一份模型权重
+    _paddle_models: Dict[Tuple[str, bool], Any] = {}
+    _paddle_models_lock = threading.Lock()
+    
+    # ddddocr模型按字符范围各加载一份，加载时设置好范围，之后不再切换；多个处理器实例共享。
+    # 每份模型的识别不是线程安全的，各自加锁，验证码和时间图片可以同时识别
+    _dddd_models: Dict[int, Tuple[Any, threading.Lock]] = {}
+    _dddd_models_lock = threading.Lock()
+    
+    # 验证码和时间格式（各实例共享）
+    captcha_pattern = _CAPTCHA_RE
+    time_pattern = _TIME_RE
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         初始化OCR处理器
@@ -68,20 +307,51 @@ class OCRProcessor:
         self.config = config
         self.engine = config.get('engine', 'ddddocr')  # 默认使用ddddocr
         
-        # 初始化OCR引擎
-        self._init_ocr_engines()
+        # 限制Tesseract和OpenCV的内部线程（ocr.limit_library_threads配置项）
+        if config.get('limit_library_threads', True):
+            _limit_library_threads()
         
-        # 验证码识别配置
-        self.captcha_pattern = re.compile(r'^[a-z]{4}$')  # 4位小写字母
+        # 整数倍放大小图时三次插值与Lanczos的识别效果相当，计算量约为一半
+        self.resize_interpolation = _RESIZE_INTERPOLATIONS.get(
+            config.get('resize_interpolation', 'cubic'), cv2.INTER_CUBIC
+        )
         
-        # 时间识别配置
-        self.time_pattern = re.compile(r'^\d{1,2}:\d{2}$')  # HH:MM格式
+        # 各验证码预处理方法的识别次数和成功次数，按成功率决定ddddocr识别的先后顺序
+        self._captcha_method_attempts = [0, 0, 0]
+        self._captcha_method_successes = [0, 0, 0]
+        self._captcha_method_stats_lock = threading.Lock()
+        
+        # 识别结果缓存（LRU）：键为(图片类型, 图片摘要)，相同图片不再重复预处理和识别
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self.result_cache_size = config.get('result_cache_size', _RESULT_CACHE_SIZE)
+        
+        # 时间图片识别结果的持久化文件（ocr.result_cache_file配置项），为空时不持久化
+        self.result_cache_file = config.get('result_cache_file', '')
+        self._result_cache_dirty = False
+        if self.result_cache_file:
+            self._load_result_cache()
+        
+        # 识别的时间图片保存到output/timeimage（ocr.save_time_images配置项），目录只在初始化时创建一次
+        self.save_time_images = config.get('save_time_images', True)
+        self._time_image_dir = os.path.join("output", "timeimage")
+        if self.save_time_images:
+            os.makedirs(self._time_image_dir, exist_ok=True)
+        
+        # 初始化OCR引擎
+        self._init_ocr_engines()
     
     def _init_ocr_engines(self) -> None:
         """
         初始化OCR引擎
         """
-        self.tesseract_available = TESSERACT_AVAILABLE
+        self.tesseract_available = TESSERACT_AVAILABLE or TESSEROCR_AVAILABLE
+        
+        # tesserocr的识别接口不是线程安全的，每个线程使用各自的实例，创建后重复使用
+        self._tesserocr_local = threading.local()
+        
+        # 时间图片预处理的中间结果缓冲区（每个线程一组），同一尺寸的图片重复使用
+        self._time_buffers = threading.local()
         self.paddleocr_available = False
         self.ddddocr_available = False
         self.paddle_ocr = None
@@ -90,7 +360,7 @@ class OCRProcessor:
         # 初始化ddddocr引擎
         if DDDDOCR_AVAILABLE:
             try:
-                self.dddd_ocr = ddddocr.DdddOcr(show_ad=False)
+                self.dddd_ocr = self._get_dddd_model(_DDDD_RANGES['captcha'])[0]
                 self.ddddocr_available = True
                 if self.logger:
                     self.logger.info("ddddocr引擎初始化成功")
@@ -107,14 +377,7 @@ class OCRProcessor:
         # 初始化PaddleOCR引擎
         if self.engine == 'paddleocr' and PADDLEOCR_AVAILABLE:
             try:
-                self.paddle_ocr = PaddleOCR(
-                    use_angle_cls=True, 
-                    lang='en',
-                    show_log=False,
-                    use_gpu=False
-                )
-                test_image = np.ones((30, 100, 3), dtype=np.uint8) * 255
-                result = self.paddle_ocr.ocr(test_image, cls=True)
+                self.paddle_ocr = self._get_paddle_model('en', True)
                 self.paddleocr_available = True
                 if self.logger:
                     self.logger.info("PaddleOCR引擎初始化成功")
@@ -125,9 +388,9 @@ class OCRProcessor:
                     self.logger.warning(f"PaddleOCR初始化失败，将使用Tesseract: {e}")
                 self.engine = 'tesseract'
         
-        if self.engine == 'tesseract' and not TESSERACT_AVAILABLE:
+        if self.engine == 'tesseract' and not self.tesseract_available:
             if self.logger:
-                self.logger.error("Tesseract不可用，请安装pytesseract")
+                self.logger.error("Tesseract不可用，请安装tesserocr或pytesseract")
             raise RuntimeError("OCR引擎不可用")
         
         if self.logger:
@@ -136,6 +399,56 @@ class OCRProcessor:
             self.logger.info(f"PaddleOCR可用: {self.paddleocr_available}")
             self.logger.info(f"Tesseract可用: {self.tesseract_available}")
 
+    @classmethod
+    def _get_dddd_model(cls, ranges: int) -> Tuple[Any, threading.Lock]:
+        """
+        获取共享的ddddocr模型，首次使用时加载并设置字符范围
+        
+        Args:
+            ranges: ddddocr字符范围
+            
+        Returns:
+            (DdddOcr实例, 该实例的识别锁)
+        """
+        with cls._dddd_models_lock:
+            entry = cls._dddd_models.get(ranges)
+            if entry is None:
+                model = ddddocr.DdddOcr(show_ad=False)
+                model.set_ranges(ranges)
+                entry = (model, threading.Lock())
+                cls._dddd_models[ranges] = entry
+        return entry
+
+    @classmethod
+    def _get_paddle_model(cls, lang: str, use_angle_cls: bool) -> Any:
+        """
+        获取共享的PaddleOCR模型，首次使用时加载
+        
+        验证码和时间图片每次只识别一张小图，rec_batch_num设为1以减少推理时预分配的内存
+        
+        Args:
+            lang: 识别语言
+            use_angle_cls: 是否启用文字方向分类
+            
+        Returns:
+            PaddleOCR实例
+        """
+        key = (lang, use_angle_cls)
+        with cls._paddle_models_lock:
+            model = cls._paddle_models.get(key)
+            if model is None:
+                model = PaddleOCR(
+                    use_angle_cls=use_angle_cls,
+                    lang=lang,
+                    rec_batch_num=1,
+                    show_log=False,
+                    use_gpu=False
+                )
+                test_image = np.ones((30, 100, 3), dtype=np.uint8) * 255
+                model.ocr(test_image, cls=use_angle_cls)
+                cls._paddle_models[key] = model
+        return model
+
     def recognize_captcha(self, image_element: WebElement, max_attempts: int = 3) -> Optional[str]:
         """
         识别验证码图片（使用ddddocr优先，保留预处理优化）
@@ -147,6 +460,8 @@ class OCRProcessor:
         Returns:
             识别出的4位字母验证码，失败返回None
         """
+        previous_digest = None
+        
         for attempt in range(1, max_attempts + 1):
             try:
                 if self.logger:
@@ -157,12 +472,29 @@ class OCRProcessor:
                 if not image_data:
                     continue
                 
+                # 识别过程是确定的，图片与上次相同时识别结果也相同，继续重试没有意义，
+                # 返回失败由调用方刷新验证码
+                digest = _image_digest(image_data)
+                if digest == previous_digest:
+                    if self.logger:
+                        self.logger.info(f"验证码图片未变化，停止重试，尝试 {attempt}/{max_attempts}")
+                    break
+                previous_digest = digest
+                
+                # 相同图片识别过时直接使用缓存结果
+                cached_result = self._get_cached_result('captcha', digest)
+                if cached_result:
+                    if self.logger:
+                        self.logger.info(f"验证码命中识别缓存: {cached_result}")
+                    return cached_result
+                
                 # 方法1: 直接使用ddddocr识别原始图片
                 if self.ddddocr_available:
                     result1 = self._ddddocr_recognize(image_data, 'captcha')
                     if result1 and len(result1) >= 3 and len(result1) <= 6:  # 接受3-6位验证码
                         if self.logger:
                             self.logger.info(f"ddddocr直接识别成功: {result1}")
+                        self._cache_result('captcha', digest, result1)
                         return result1
                 
                 # 方法2: 使用预处理后的图片进行ddddocr识别
@@ -173,27 +505,41 @@ class OCRProcessor:
                         ("激进预处理", self._preprocess_captcha_image_method3)
                     ]
                     
-                    for method_name, preprocess_method in preprocessing_methods:
-                        try:
-                            # 预处理图片
-                            processed_image = preprocess_method(image_data)
-                            
-                            # 转换为字节数据
-                            buffer = io.BytesIO()
-                            processed_image.save(buffer, format='PNG')
-                            processed_data = buffer.getvalue()
-                            
-                            # 使用ddddocr识别
-                            result = self._ddddocr_recognize(processed_data, 'captcha')
-                            if result and len(result) >= 3 and len(result) <= 6:  # 接受3-6位验证码
-                                if self.logger:
-                                    self.logger.info(f"ddddocr {method_name} 识别成功: {result}")
-                                return result
+                    # 只解码一次，三种预处理共用同一个灰度图数组（各方法不修改输入）
+                    gray = _decode_gray(image_data)
+                    
+                    # 三种预处理同时开始，ddddocr按历史成功率从高到低逐个识别（模型不是线程安全的）
+                    executor = _get_preprocess_executor()
+                    futures = [
+                        (method_index, method_name, executor.submit(
+                            self._preprocess_captcha_to_png, preprocess_method, gray))
+                        for method_index, (method_name, preprocess_method) in enumerate(preprocessing_methods)
+                    ]
+                    futures = [futures[i] for i in self._captcha_method_order()]
+                    
+                    try:
+                        for method_index, method_name, future in futures:
+                            try:
+                                processed_data = future.result()
                                 
-                        except Exception as e:
-                            if self.logger:
-                                self.logger.warning(f"ddddocr {method_name} 识别失败: {str(e)}")
-                            continue
+                                # 使用ddddocr识别
+                                result = self._ddddocr_recognize(processed_data, 'captcha')
+                                accepted = bool(result) and 3 <= len(result) <= 6  # 接受3-6位验证码
+                                self._record_captcha_method(method_index, accepted)
+                                if accepted:
+                                    if self.logger:
+                                        self.logger.info(f"ddddocr {method_name} 识别成功: {result}")
+                                    self._cache_result('captcha', digest, result)
+                                    return result
+                                    
+                            except Exception as e:
+                                if self.logger:
+                                    self.logger.warning(f"ddddocr {method_name} 识别失败: {str(e)}")
+                                continue
+                    finally:
+                        # 已识别成功时不再需要尚未开始的预处理
+                        for _, _, future in futures:
+                            future.cancel()
                 
                 # 方法3: 如果ddddocr不可用，使用传统OCR方法作为备用
                 if not self.ddddocr_available:
@@ -202,24 +548,160 @@ class OCRProcessor:
                     if result3 and len(result3) == 4:
                         if self.logger:
                             self.logger.info(f"传统OCR识别成功: {result3}")
+                        self._cache_result('captcha', digest, result3)
                         return result3
-                
-                # 等待一段时间后重试
-                if attempt < max_attempts:
-                    time.sleep(0.5)
                     
             except Exception as e:
                 if self.logger:
                     log_exception('ocr_processor', 'recognize_captcha', e, 
                                 {'attempt': attempt, 'max_attempts': max_attempts})
                 if attempt < max_attempts:
-                    time.sleep(1)
+                    time.sleep(min(_RETRY_DELAY_STEP * attempt, _RETRY_DELAY_MAX))
                 continue
         
         if self.logger:
             self.logger.error(f"验证码识别失败，已尝试 {max_attempts} 次")
         return None
 
+    def _captcha_method_order(self) -> List[int]:
+        """
+        按历史成功率从高到低排列验证码预处理方法
+        
+        成功率按(成功次数+1)/(识别次数+2)估计，未使用过的方法按0.5计；成功率相同时保持原顺序
+        
+        Returns:
+            预处理方法的索引列表
+        """
+        with self._captcha_method_stats_lock:
+            rates = [(successes + 1) / (attempts + 2) for successes, attempts
+                     in zip(self._captcha_method_successes, self._captcha_method_attempts)]
+        return sorted(range(len(rates)), key=lambda i: -rates[i])
+
+    def _record_captcha_method(self, method_index: int, success: bool) -> None:
+        """
+        记录一次验证码预处理方法的识别结果
+        
+        Args:
+            method_index: 预处理方法索引
+            success: 识别结果是否被接受
+        """
+        with self._captcha_method_stats_lock:
+            self._captcha_method_attempts[method_index] += 1
+            if success:
+                self._captcha_method_successes[method_index] += 1
+
+    def _preprocess_captcha_to_png(self, preprocess_method, image_data: Union[bytes, np.ndarray]) -> bytes:
+        """
+        预处理验证码图片并编码为PNG数据（在预处理线程池中执行）
+        
+        PNG数据只交给ddddocr解码，不需要压缩率：使用最低压缩级别，编码速度比默认级别快数倍
+        
+        Args:
+            preprocess_method: 验证码预处理方法
+            image_data: 原始图片二进制数据或已解码的灰度图数组
+            
+        Returns:
+            预处理后图片的PNG二进制数据
+        """
+        processed_image = preprocess_method(image_data)
+        
+        # 转换为字节数据
+        if processed_image.mode == 'L':
+            success, encoded = cv2.imencode('.png', np.asarray(processed_image), [cv2.IMWRITE_PNG_COMPRESSION, 1])
+            if success:
+                return encoded.tobytes()
+        buffer = io.BytesIO()
+        processed_image.save(buffer, format='PNG', compress_level=1)
+        return buffer.getvalue()
+
+    def _get_cached_result(self, image_type: str, digest: bytes) -> Optional[str]:
+        """
+        查询识别结果缓存
+        
+        Args:
+            image_type: 图片类型 ('captcha' 或 'time')
+            digest: _image_digest计算的图片摘要
+            
+        Returns:
+            缓存的识别结果，未命中返回None
+        """
+        key = (image_type, digest)
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_result(self, image_type: str, digest: bytes, result: str) -> None:
+        """
+        缓存识别成功的结果，超出容量时淘汰最久未使用的条目
+        
+        Args:
+            image_type: 图片类型 ('captcha' 或 'time')
+            digest: _image_digest计算的图片摘要
+            result: 识别结果
+        """
+        key = (image_type, digest)
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+            self._result_cache_dirty = True
+
+    def _load_result_cache(self) -> None:
+        """
+        从持久化文件加载时间图片识别结果（文件为{图片摘要十六进制: 识别结果}的JSON）
+        """
+        try:
+            if not os.path.exists(self.result_cache_file):
+                return
+            
+            with open(self.result_cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            
+            with self._result_cache_lock:
+                for digest_hex, result in list(entries.items())[-self.result_cache_size:]:
+                    if isinstance(result, str) and _TIME_RE.match(result):
+                        self._result_cache[('time', bytes.fromhex(digest_hex))] = result
+            
+            if self.logger:
+                self.logger.info(f"加载时间识别缓存: {len(self._result_cache)} 条")
+                
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"加载时间识别缓存失败: {str(e)}")
+
+    def save_result_cache(self) -> None:
+        """
+        把时间图片识别结果保存到持久化文件
+
+        未配置ocr.result_cache_file或缓存无变化时跳过；验证码每次都不同，不保存
+        """
+        if not self.result_cache_file or not self._result_cache_dirty:
+            return
+        
+        try:
+            with self._result_cache_lock:
+                entries = {digest.hex(): result
+                           for (image_type, digest), result in self._result_cache.items()
+                           if image_type == 'time'}
+                self._result_cache_dirty = False
+            
+            directory = os.path.dirname(self.result_cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            with open(self.result_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            
+            if self.logger:
+                self.logger.info(f"时间识别缓存已保存: {len(entries)} 条")
+                
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"保存时间识别缓存失败: {str(e)}")
+
     def _ddddocr_recognize(self, image_data: bytes, image_type: str = 'captcha') -> Optional[str]:
         """
         使用ddddocr进行识别
@@ -235,19 +717,11 @@ class OCRProcessor:
             return None
             
         try:
-            # 根据图片类型设置字符范围
-            if image_type == 'captcha':
-                # 验证码使用小写英文a-z + 大写英文A-Z + 整数0-9
-                self.dddd_ocr.set_ranges(3)
-            elif image_type == 'time':
-                # 时间识别使用数字+冒号
-                self.dddd_ocr.set_ranges(5)
-            else:
-                # 默认使用小写英文a-z + 大写英文A-Z + 整数0-9
-                self.dddd_ocr.set_ranges(6)
-            
-            # 使用概率模式进行识别
-            result = self.dddd_ocr.classification(image_data, probability=True)
+            # 使用已设置好对应字符范围的模型
+            model, model_lock = self._get_dddd_model(_DDDD_RANGES.get(image_type, _DDDD_DEFAULT_RANGES))
+            with model_lock:
+                # 使用概率模式进行识别
+                result = model.classification(image_data, probability=True)
             
             if 'probability' in result and 'charsets' in result:
                 probabilities = result['probability']
@@ -283,24 +757,19 @@ class OCRProcessor:
             提取的验证码字符串
         """
         try:
-            # 找出置信度最高的字符位置
-            char_candidates = []
-            for i, prob_list in enumerate(probabilities):
-                if prob_list:
-                    max_prob = max(prob_list)
-                    max_idx = prob_list.index(max_prob)
-                    char = charsets[max_idx]
-                    if char.strip() and max_prob > 0.005:  # 非空字符且置信度足够
-                        char_candidates.append((i, char, max_prob))
+            # 每个位置置信度最高的字符
+            _, max_indices, max_probs = _position_maxima(probabilities)
+            max_probs = np.asarray(max_probs, dtype=np.float64)
+            chars = [charsets[idx] for idx in max_indices]
             
-            # 按置信度排序，取前4个
-            char_candidates.sort(key=lambda x: x[2], reverse=True)
-            top4 = char_candidates[:4]
+            # 非空字符且置信度足够的位置
+            candidates = np.array([i for i, char in enumerate(chars) if char.strip() and max_probs[i] > 0.005],
+                                  dtype=np.intp)
             
-            # 按位置排序
-            top4.sort(key=lambda x: x[0])
+            # 按置信度排序（置信度相同时保持位置顺序），取前4个后按位置排序
+            top4 = np.sort(candidates[np.argsort(-max_probs[candidates], kind='stable')[:4]])
             
-            result = ''.join([char for _, char, _ in top4])
+            result = ''.join([chars[i] for i in top4.tolist()])
             
             # 如果结果长度为4且都是字母，返回小写形式
             if len(result) == 4 and result.isalpha():
@@ -325,42 +794,37 @@ class OCRProcessor:
             提取的时间字符串
         """
         try:
-            if self.logger:
-                self.logger.info(f"开始从概率结果提取时间字符，概率位置数: {len(probabilities)}")
-                self.logger.info(f"字符集: {charsets}")
+            # 逐位置的明细只在调试级别记录，未启用时不做任何格式化
+            debug = bool(self.logger) and self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("开始从概率结果提取时间字符，概率位置数: %d，字符集: %s", len(probabilities), charsets)
+            
+            # 每个位置置信度最高的字符
+            positions, max_indices, max_probs = _position_maxima(probabilities)
             
             # 提取所有有意义的字符
             chars = []
-            for i, prob_list in enumerate(probabilities):
-                if prob_list:
-                    max_prob = max(prob_list)
-                    max_idx = prob_list.index(max_prob)
-                    char = charsets[max_idx]
-                    
-                    if self.logger:
-                        self.logger.info(f"位置{i+1}: 字符='{char}', 置信度={max_prob:.3f}")
-                    
-                    if char.strip() and max_prob > 0.01:  # 非空字符且置信度足够
-                        chars.append(char)
-                        if self.logger:
-                            self.logger.info(f"位置{i+1}: 字符'{char}'被接受（置信度: {max_prob:.3f}）")
-                    else:
-                        if self.logger:
-                            self.logger.warning(f"位置{i+1}: 字符'{char}'被拒绝（置信度: {max_prob:.3f}，阈值: 0.01）")
+            for position, max_idx, max_prob in zip(positions, max_indices, max_probs):
+                char = charsets[max_idx]
+                
+                if debug:
+                    self.logger.debug("位置%d: 字符='%s', 置信度=%.3f", position + 1, char, max_prob)
+                
+                if char.strip() and max_prob > 0.01:  # 非空字符且置信度足够
+                    chars.append(char)
             
             result = ''.join(chars)
             
-            if self.logger:
-                self.logger.info(f"提取的字符序列: '{result}'")
+            if debug:
+                self.logger.debug("时间字符位置: %d 个接受，%d 个拒绝（阈值: 0.01），提取的字符序列: '%s'",
+                                  len(chars), len(max_indices) - len(chars), result)
             
             # 直接返回提取的字符序列，不进行格式验证
             if result:
-                if self.logger:
-                    self.logger.info(f"时间字符提取成功: '{result}'")
                 return result
             else:
                 if self.logger:
-                    self.logger.warning(f"时间字符提取为空")
+                    self.logger.warning("时间字符提取为空")
             
             return None
             
@@ -371,106 +835,100 @@ class OCRProcessor:
                             {'probabilities_count': len(probabilities) if probabilities else 0})
             return None
 
-    def _preprocess_captcha_image_method1(self, image_data: bytes) -> Image.Image:
+    def _upscale(self, gray: np.ndarray, scale_factor: int, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        按整数倍放大灰度图
+        
+        Args:
+            gray: 灰度图数组
+            scale_factor: 放大倍数
+            dst: 存放结果的数组（尺寸须为放大后的尺寸），为None时新分配
+            
+        Returns:
+            放大后的灰度图数组
+        """
+        height, width = gray.shape[:2]
+        return cv2.resize(gray, (width * scale_factor, height * scale_factor), dst=dst,
+                          interpolation=self.resize_interpolation)
+
+    def _preprocess_captcha_image_method1(self, image_data: Union[bytes, np.ndarray]) -> Image.Image:
         """
         验证码预处理方法1：灰度+放大+锐化（针对lxzd类型优化）
         
+        解码到形态学处理全部在同一个OpenCV数组上完成，只在最后转换一次PIL图片
+        
         Args:
-            image_data: 图片二进制数据
+            image_data: 图片二进制数据或已解码的灰度图数组
             
         Returns:
             预处理后的PIL图片对象
         """
         try:
-            # 加载图片
-            image = Image.open(io.BytesIO(image_data))
-            
-            # 转换为灰度图
-            if image.mode != 'L':
-                image = image.convert('L')
+            # 直接解码为灰度图
+            gray = _decode_gray(image_data)
             
             # 大幅放大图片（提高到12倍）
-            scale_factor = 12
-            new_size = (image.width * scale_factor, image.height * scale_factor)
-            image = image.resize(new_size, Image.LANCZOS)
+            img_array = self._upscale(gray, 12)
             
-            # 高斯模糊去噪
-            image = image.filter(ImageFilter.GaussianBlur(radius=0.5))
+            # 高斯模糊去噪（与PIL GaussianBlur(radius=0.5)相同的sigma和边缘处理）
+            img_array = cv2.GaussianBlur(img_array, (0, 0), 0.5, borderType=cv2.BORDER_REPLICATE)
             
             # CLAHE对比度增强
-            img_array = np.array(image)
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
-            img_array = clahe.apply(img_array)
-            image = Image.fromarray(img_array)
-            
-            # 多种阈值方法，选择最佳结果
-            # OTSU阈值
-            img_array = np.array(image)
-            _, otsu_thresh = cv2.threshold(img_array, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # 自适应阈值
-            adaptive_thresh = cv2.adaptiveThreshold(img_array, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
-            
-            # 固定阈值
-            _, fixed_thresh = cv2.threshold(img_array, 127, 255, cv2.THRESH_BINARY)
-            
-            # 根据黑色像素比例选择最佳阈值方法
-            otsu_black_ratio = np.sum(otsu_thresh == 0) / otsu_thresh.size
-            adaptive_black_ratio = np.sum(adaptive_thresh == 0) / adaptive_thresh.size
-            fixed_black_ratio = np.sum(fixed_thresh == 0) / fixed_thresh.size
-            
-            # 选择黑色像素比例在0.1-0.4之间的方法
-            if 0.1 <= otsu_black_ratio <= 0.4:
-                final_thresh = otsu_thresh
-            elif 0.1 <= adaptive_black_ratio <= 0.4:
-                final_thresh = adaptive_thresh
-            elif 0.1 <= fixed_black_ratio <= 0.4:
-                final_thresh = fixed_thresh
-            else:
+            with _CLAHE_LOCK:
+                img_array = _CLAHE.apply(img_array)
+            
+            # 多种阈值方法，按OTSU、自适应、固定阈值的顺序选择
+            # 第一个黑色像素比例在0.1-0.4之间的方法，后面的方法只在需要时计算
+            thresholds = []
+            ratios = []
+            final_thresh = None
+            for threshold_method in (
+                # OTSU阈值
+                lambda: cv2.threshold(img_array, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1],
+                # 自适应阈值
+                lambda: cv2.adaptiveThreshold(img_array, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2),
+                # 固定阈值
+                lambda: cv2.threshold(img_array, 127, 255, cv2.THRESH_BINARY)[1]
+            ):
+                thresh = threshold_method()
+                black_ratio = 1.0 - cv2.countNonZero(thresh) / thresh.size
+                if 0.1 <= black_ratio <= 0.4:
+                    final_thresh = thresh
+                    break
+                thresholds.append(thresh)
+                ratios.append(black_ratio)
+            
+            if final_thresh is None:
                 # 如果都不理想，选择最接近0.25的
-                ratios = [otsu_black_ratio, adaptive_black_ratio, fixed_black_ratio]
-                thresholds = [otsu_thresh, adaptive_thresh, fixed_thresh]
                 best_idx = min(range(len(ratios)), key=lambda i: abs(ratios[i] - 0.25))
                 final_thresh = thresholds[best_idx]
             
-            image = Image.fromarray(final_thresh)
-            
             # 形态学操作优化字符形状
-            img_array = np.array(image)
-            kernel = np.ones((2,2), np.uint8)
-            
             # 闭运算：填充字符内部的小洞
-            img_array = cv2.morphologyEx(img_array, cv2.MORPH_CLOSE, kernel)
+            img_array = cv2.morphologyEx(final_thresh, cv2.MORPH_CLOSE, _MORPH_KERNEL)
             
             # 开运算：去除小噪点
-            img_array = cv2.morphologyEx(img_array, cv2.MORPH_OPEN, kernel)
+            img_array = cv2.morphologyEx(img_array, cv2.MORPH_OPEN, _MORPH_KERNEL)
             
-            image = Image.fromarray(img_array)
-            
-            return image
+            return Image.fromarray(img_array)
             
         except Exception as e:
             if self.logger:
                 self.logger.error(f"验证码预处理方法1失败: {str(e)}")
             # 返回原始图片
-            return Image.open(io.BytesIO(image_data))
+            return _open_image(image_data)
 
-    def _preprocess_captcha_image_method2(self, image_data: bytes) -> Image.Image:
+    def _preprocess_captcha_image_method2(self, image_data: Union[bytes, np.ndarray]) -> Image.Image:
         """
         验证码预处理方法2：保守预处理
         """
         try:
-            image = Image.open(io.BytesIO(image_data))
-            if image.mode != 'L':
-                image = image.convert('L')
+            gray = _decode_gray(image_data)
             
             # 适度放大
-            scale_factor = 3
-            new_size = (image.width * scale_factor, image.height * scale_factor)
-            image = image.resize(new_size, Image.LANCZOS)
+            img_array = self._upscale(gray, 3)
             
             # 简单二值化
-            img_array = np.array(image)
             _, thresh = cv2.threshold(img_array, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
             return Image.fromarray(thresh)
@@ -478,45 +936,33 @@ class OCRProcessor:
         except Exception as e:
             if self.logger:
                 self.logger.error(f"验证码预处理方法2失败: {str(e)}")
-            return Image.open(io.BytesIO(image_data))
+            return _open_image(image_data)
 
-    def _preprocess_captcha_image_method3(self, image_data: bytes) -> Image.Image:
+    def _preprocess_captcha_image_method3(self, image_data: Union[bytes, np.ndarray]) -> Image.Image:
         """
         验证码预处理方法3：激进预处理
         """
         try:
-            image = Image.open(io.BytesIO(image_data))
-            if image.mode != 'L':
-                image = image.convert('L')
+            gray = _decode_gray(image_data)
             
             # 大幅放大
-            scale_factor = 8
-            new_size = (image.width * scale_factor, image.height * scale_factor)
-            image = image.resize(new_size, Image.LANCZOS)
-            
-            # 强化对比度
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(2.0)
-            
-            # 锐化
-            image = image.filter(ImageFilter.SHARPEN)
+            img_array = self._upscale(gray, 8)
             
-            # 二值化
-            img_array = np.array(image)
-            _, thresh = cv2.threshold(img_array, 127, 255, cv2.THRESH_BINARY)
+            # 强化对比度、锐化、二值化
+            thresh = _contrast_sharpen_threshold(img_array, 2.0, 127)
             
             return Image.fromarray(thresh)
             
         except Exception as e:
             if self.logger:
                 self.logger.error(f"验证码预处理方法3失败: {str(e)}")
-            return Image.open(io.BytesIO(image_data))
+            return _open_image(image_data)
 
     def _enhanced_captcha_recognize(self, image_data: bytes) -> Optional[str]:
         """
         增强版验证码识别（传统OCR方法的备用方案）
         """
-        if not TESSERACT_AVAILABLE:
+        if not self.tesseract_available:
             return None
             
         try:
@@ -524,8 +970,7 @@ class OCRProcessor:
             processed_image = self._preprocess_captcha_image_method1(image_data)
             
             # Tesseract识别
-            config = '--psm 8 --oem 3 -c tessedit_char_whitelist=abcdefghijklmnopqrstuvwxyz'
-            result = pytesseract.image_to_string(processed_image, config=config).strip()
+            result = self._tesseract_recognize(processed_image, 'captcha')
             
             if result and len(result) >= 3:
                 return result.lower()
@@ -537,10 +982,70 @@ class OCRProcessor:
                 self.logger.warning(f"增强版验证码识别失败: {str(e)}")
             return None
 
+    def _tesseract_recognize(self, image: Union[Image.Image, np.ndarray], image_type: str) -> str:
+        """
+        使用Tesseract识别预处理后的图片
+        
+        Args:
+            image: 预处理后的图片（PIL图片或灰度图数组）
+            image_type: 图片类型 ('captcha' 或 'time')
+            
+        Returns:
+            去除首尾空白的识别文本
+        """
+        api = self._get_tesserocr_api()
+        if api is not None:
+            # 直接调用libtesseract，不为每张图片启动tesseract进程
+            api.SetVariable('tessedit_char_whitelist', _TESSERACT_WHITELISTS[image_type])
+            if isinstance(image, Image.Image) and image.mode == 'L':
+                image = np.asarray(image)
+            if isinstance(image, np.ndarray) and image.ndim == 2:
+                # 灰度图直接传入像素数据：SetImage会先把PIL图片编码为BMP（期间持有GIL），
+                # 而识别本身在tesserocr中释放GIL，其他线程的截图和预处理可以同时进行
+                gray = np.ascontiguousarray(image, dtype=np.uint8)
+                height, width = gray.shape
+                api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+            else:
+                api.SetImage(image if isinstance(image, Image.Image) else Image.fromarray(image))
+            return api.GetUTF8Text().strip()
+        
+        return pytesseract.image_to_string(image, config=_TESSERACT_CONFIGS[image_type]).strip()
+
+    def _get_tesserocr_api(self) -> Optional[Any]:
+        """
+        获取当前线程的tesserocr识别接口，首次使用时创建
+        
+        Returns:
+            PyTessBaseAPI实例；tesserocr不可用或初始化失败时返回None（改用pytesseract）
+        """
+        if not TESSEROCR_AVAILABLE:
+            return None
+        
+        local = self._tesserocr_local
+        if not hasattr(local, 'api'):
+            try:
+                import tesserocr
+                local.api = tesserocr.PyTessBaseAPI(
+                    lang=self.config.get('language', 'eng'),
+                    psm=tesserocr.PSM.SINGLE_WORD,
+                    oem=tesserocr.OEM.DEFAULT
+                )
+            except Exception as e:
+                local.api = None
+                if self.logger:
+                    self.logger.warning(f"tesserocr初始化失败，将使用pytesseract: {e}")
+        
+        if local.api is None and not TESSERACT_AVAILABLE:
+            raise RuntimeError("Tesseract不可用")
+        return local.api
+
     def _get_image_data(self, image_element: WebElement) -> Optional[bytes]:
         """
         从WebElement获取图片数据
         
+        每次调用都重新截图：重试依赖新的截图（验证码刷新、时间图片重新渲染），不缓存截图结果。
+        同一页面的多张时间图片由数据提取模块通过一次脚本调用批量读取，不经过这里逐张截图
+        
         Args:
             image_element: Selenium图片元素
             
@@ -548,13 +1053,8 @@ class OCRProcessor:
             图片二进制数据
         """
         try:
-            # 获取图片的base64数据
-            screenshot = image_element.screenshot_as_base64
-            
-            # 解码base64数据
-            image_data = base64.b64decode(screenshot)
-            
-            return image_data
+            # 直接获取PNG二进制数据（不经过base64字符串）
+            return image_element.screenshot_as_png
             
         except Exception as e:
             if self.logger:
@@ -562,68 +1062,83 @@ class OCRProcessor:
             return None
 
 
-    def recognize_time_image(self, image_element: WebElement, max_attempts: int = 3, flight_number: str = "", segment_index: int = 0, time_type: str = "time") -> Optional[str]:
+    def recognize_time_image(self, image_element: Optional[WebElement], max_attempts: int = 3, flight_number: str = "", segment_index: int = 0, time_type: str = "time", image_data: Optional[bytes] = None) -> Optional[str]:
         """
         识别时间图片（带重试机制）
         
         Args:
-            image_element: Selenium获取的时间图片元素
+            image_element: Selenium获取的时间图片元素（提供image_data时可为None）
             max_attempts: 最大重试次数
             flight_number: 航班号
             segment_index: 航段索引
             time_type: 时间类型 (departure/arrival)
+            image_data: 已获取的图片数据，提供时不再对元素截图
             
         Returns:
             HH:MM格式的时间字符串，失败返回None
         """
+        provided_data = image_data
+        previous_digest = None
+        
         for attempt in range(1, max_attempts + 1):
             try:
                 if self.logger:
-                    self.logger.info(f"时间图片识别尝试 {attempt}/{max_attempts}")
+                    self.logger.debug("时间图片识别尝试 %d/%d", attempt, max_attempts)
                 
                 # 获取图片数据
-                image_data = self._get_image_data(image_element)
+                if provided_data is None:
+                    image_data = self._get_image_data(image_element)
                 if not image_data:
                     if self.logger:
                         self.logger.error(f"获取时间图片数据失败，尝试 {attempt}/{max_attempts}")
                     continue
                 
+                # 识别结果只取决于图片内容，图片与上次相同时不再重复识别
+                digest = _image_digest(image_data)
+                if digest == previous_digest:
+                    if self.logger:
+                        self.logger.info("时间图片未变化，停止重试，尝试 %d/%d", attempt, max_attempts)
+                    break
+                previous_digest = digest
+                
                 # 保存时间图片到本地（无论识别成功与否）
                 self._save_time_image_to_file(image_data, attempt, flight_number, segment_index, time_type)
                 
                 if self.logger:
-                    self.logger.info(f"时间图片数据获取成功，大小: {len(image_data)} 字节")
+                    self.logger.debug("时间图片数据获取成功，大小: %d 字节", len(image_data))
+                
+                # 相同图片识别过时直接使用缓存结果
+                cached_result = self._get_cached_result('time', digest)
+                if cached_result:
+                    if self.logger:
+                        self.logger.info("时间图片命中识别缓存: %s", cached_result)
+                    return cached_result
                 
                 # 使用ddddocr识别时间图片
                 if self.ddddocr_available:
-                    if self.logger:
-                        self.logger.info("开始使用ddddocr识别时间图片")
-                    
                     result = self._ddddocr_recognize(image_data, 'time')
                     
                     if self.logger:
-                        self.logger.info(f"ddddocr原始识别结果: '{result}'")
+                        self.logger.debug("ddddocr原始识别结果: '%s'", result)
                     
                     if result:
                         # 清理和验证结果
                         cleaned_result = self._clean_time_result(result)
                         
-                        if self.logger:
-                            self.logger.info(f"时间结果清理: 原始='{result}' -> 清理后='{cleaned_result}'")
-                        
                         if cleaned_result:
                             if self.logger:
-                                self.logger.info(f"时间图片识别成功: {cleaned_result}")
+                                self.logger.info("时间图片识别成功: %s（原始结果: '%s'）", cleaned_result, result)
+                            self._cache_result('time', digest, cleaned_result)
                             return cleaned_result
                         else:
                             if self.logger:
-                                self.logger.warning(f"时间结果清理失败，原始结果: '{result}'")
+                                self.logger.warning("时间结果清理失败，原始结果: '%s'", result)
                     else:
                         if self.logger:
                             self.logger.warning("ddddocr识别返回空结果")
                 
                 # 如果ddddocr不可用，使用传统OCR方法
-                if not self.ddddocr_available and TESSERACT_AVAILABLE:
+                if not self.ddddocr_available and self.tesseract_available:
                     if self.logger:
                         self.logger.info("ddddocr不可用，尝试使用Tesseract识别")
                     
@@ -631,25 +1146,25 @@ class OCRProcessor:
                     processed_image = self._preprocess_time_image(image_data)
                     
                     # Tesseract识别
-                    config = '--psm 8 --oem 3 -c tessedit_char_whitelist=0123456789:'
-                    result = pytesseract.image_to_string(processed_image, config=config).strip()
+                    result = self._tesseract_recognize(processed_image, 'time')
                     
                     if self.logger:
-                        self.logger.info(f"Tesseract识别结果: '{result}'")
+                        self.logger.debug("Tesseract识别结果: '%s'", result)
                     
                     if result:
                         cleaned_result = self._clean_time_result(result)
                         if cleaned_result:
                             if self.logger:
-                                self.logger.info(f"时间图片识别成功: {cleaned_result}")
+                                self.logger.info("时间图片识别成功: %s（原始结果: '%s'）", cleaned_result, result)
+                            self._cache_result('time', digest, cleaned_result)
                             return cleaned_result
                 
                 if self.logger:
-                    self.logger.warning(f"时间图片识别失败，尝试 {attempt}/{max_attempts}")
+                    self.logger.warning("时间图片识别失败，尝试 %d/%d", attempt, max_attempts)
                 
-                # 重试前等待
-                if attempt < max_attempts:
-                    time.sleep(0.5)
+                # 图片数据由调用方提供时重试只会得到相同结果
+                if provided_data is not None:
+                    break
                     
             except Exception as e:
                 if self.logger:
@@ -657,16 +1172,18 @@ class OCRProcessor:
                                 {'attempt': attempt, 'max_attempts': max_attempts})
                 
                 if attempt < max_attempts:
-                    time.sleep(0.5)
+                    time.sleep(min(_RETRY_DELAY_STEP * attempt, _RETRY_DELAY_MAX))
         
         if self.logger:
-            self.logger.error(f"时间图片识别失败，已尝试 {max_attempts} 次")
+            self.logger.error(f"时间图片识别失败，最多尝试 {max_attempts} 次")
         return None
 
     def _save_time_image_to_file(self, image_data: bytes, attempt: int, flight_number: str = "", segment_index: int = 0, time_type: str = "time") -> None:
         """
         保存时间图片到本地文件
         
+        文件在后台线程中写入，不阻塞识别
+        
         Args:
             image_data: 图片二进制数据
             attempt: 尝试次数
@@ -674,66 +1191,72 @@ class OCRProcessor:
             segment_index: 航段索引
             time_type: 时间类型 (departure/arrival)
         """
+        if not self.save_time_images:
+            return
+        
         try:
-            import os
-            from datetime import datetime
-            
-            # 确保timeimage目录存在
-            time_dir = os.path.join("output", "timeimage")
-            if not os.path.exists(time_dir):
-                os.makedirs(time_dir)
-            
             # 生成文件名，包含航班号、航段索引、时间类型等信息
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 包含毫秒
             if flight_number and segment_index > 0:
                 filename = f"{time_type}_{flight_number}_seg{segment_index}_{timestamp}_attempt{attempt}.png"
             else:
                 filename = f"{time_type}_image_{timestamp}_attempt{attempt}.png"
-            filepath = os.path.join(time_dir, filename)
+            filepath = os.path.join(self._time_image_dir, filename)
             
             # 保存图片
+            _get_image_writer().submit(self._write_time_image, filepath, image_data)
+                
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"保存时间图片失败: {str(e)}")
+
+    def _write_time_image(self, filepath: str, image_data: bytes) -> None:
+        """
+        写入时间图片文件（在后台写入线程中执行）
+        
+        Args:
+            filepath: 文件路径
+            image_data: 图片二进制数据
+        """
+        try:
             with open(filepath, 'wb') as f:
                 f.write(image_data)
             
             if self.logger:
-                self.logger.info(f"时间图片已保存: {filepath}")
+                self.logger.debug("时间图片已保存: %s", filepath)
                 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"保存时间图片失败: {str(e)}")
 
-    def _preprocess_time_image(self, image_data: bytes) -> Image.Image:
+    def _preprocess_time_image(self, image_data: bytes) -> Union[Image.Image, np.ndarray]:
         """
         时间图片预处理
         
+        全部在OpenCV中完成，图片数据始终是同一种uint8数组，不在PIL和numpy之间来回复制
+        
         Args:
             image_data: 图片二进制数据
             
         Returns:
-            预处理后的PIL图片对象
+            预处理后的灰度图数组，预处理失败时返回原始PIL图片对象
         """
         try:
-            # 加载图片
-            image = Image.open(io.BytesIO(image_data))
+            # 直接解码为灰度图
+            gray = _decode_gray(image_data)
             
-            # 转换为灰度图
-            if image.mode != 'L':
-                image = image.convert('L')
+            resized_buffer, contrast_buffer = self._get_time_buffers(gray.shape[0] * 3, gray.shape[1] * 3)
             
             # 放大图片
-            scale_factor = 3
-            new_size = (image.width * scale_factor, image.height * scale_factor)
-            image = image.resize(new_size, Image.LANCZOS)
+            resized = self._upscale(gray, 3, dst=resized_buffer)
             
             # 增强对比度
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(2.0)
+            enhanced = cv2.LUT(resized, _contrast_lut(resized, 2.0), dst=contrast_buffer)
             
-            # 二值化
-            img_array = np.array(image)
-            _, thresh = cv2.threshold(img_array, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            # 二值化（结果返回给调用方，不使用缓冲区）
+            _, thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
-            return Image.fromarray(thresh)
+            return thresh
             
         except Exception as e:
             if self.logger:
@@ -741,6 +1264,26 @@ class OCRProcessor:
             # 返回原始图片
             return Image.open(io.BytesIO(image_data))
 
+    def _get_time_buffers(self, height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        获取当前线程的时间图片预处理缓冲区
+        
+        同一网站的时间图片尺寸基本固定，缓冲区按最近一次的尺寸保留，尺寸变化时重新分配
+        
+        Args:
+            height: 放大后的图片高度
+            width: 放大后的图片宽度
+            
+        Returns:
+            (放大结果缓冲区, 对比度增强结果缓冲区)
+        """
+        buffers = getattr(self._time_buffers, 'buffers', None)
+        if buffers is None or buffers[0].shape != (height, width):
+            buffers = (np.empty((height, width), dtype=np.uint8),
+                       np.empty((height, width), dtype=np.uint8))
+            self._time_buffers.buffers = buffers
+        return buffers
+
     def _clean_time_result(self, result: str) -> Optional[str]:
         """
         清理时间识别结果
@@ -751,8 +1294,9 @@ class OCRProcessor:
         Returns:
             清理后的时间字符串（HH:MM格式）
         """
+        # 逐步的清理过程只在调试级别记录，参数在该级别启用时才格式化
         if self.logger:
-            self.logger.info(f"开始清理时间识别结果: '{result}'")
+            self.logger.debug("开始清理时间识别结果: '%s'", result)
         
         if not result:
             if self.logger:
@@ -763,11 +1307,10 @@ class OCRProcessor:
         cleaned = result.strip()
         
         if self.logger:
-            self.logger.info(f"移除空白字符后: '{cleaned}'")
+            self.logger.debug("移除空白字符后: '%s'", cleaned)
         
         # 首先尝试匹配标准时间格式 HH:MM 或 H:MM
-        time_pattern = re.compile(r'(\d{1,2}):(\d{2})')
-        match = time_pattern.search(cleaned)
+        match = _TIME_SEARCH_RE.search(cleaned)
         
         if match:
             hour, minute = match.groups()
@@ -776,13 +1319,12 @@ class OCRProcessor:
             final_result = f"{hour}:{minute}"
             
             if self.logger:
-                self.logger.info(f"标准时间格式匹配成功: 小时='{hour}', 分钟='{minute}', 最终结果='{final_result}'")
+                self.logger.debug("标准时间格式匹配成功: 小时='%s', 分钟='%s', 最终结果='%s'", hour, minute, final_result)
             
             return final_result
         
         # 如果没有冒号，尝试匹配4位数字格式 HHMM
-        four_digit_pattern = re.compile(r'^(\d{4})$')
-        match = four_digit_pattern.search(cleaned)
+        match = _FOUR_DIGIT_TIME_RE.search(cleaned)
         
         if match:
             digits = match.group(1)
@@ -791,13 +1333,14 @@ class OCRProcessor:
             final_result = f"{hour}:{minute}"
             
             if self.logger:
-                self.logger.info(f"4位数字格式匹配成功: 原始='{digits}', 小时='{hour}', 分钟='{minute}', 最终结果='{final_result}'")
+                self.logger.debug("4位数字格式匹配成功: 原始='%s', 小时='%s', 分钟='%s', 最终结果='%s'",
+                                  digits, hour, minute, final_result)
             
             return final_result
         
         # 如果都不匹配，记录警告
         if self.logger:
-            self.logger.warning(f"时间格式匹配失败: '{cleaned}' (支持格式: HH:MM 或 HHMM)")
+            self.logger.warning("时间格式匹配失败: '%s' (支持格式: HH:MM 或 HHMM)", cleaned)
         
         return None
 
@@ -813,9 +1356,10 @@ class OCRProcessor:
             base64编码的图片字符串
         """
         try:
-            image_data = self._get_image_data(image_element)
-            if image_data:
-                return base64.b64encode(image_data).decode('utf-8')
+            # WebDriver返回的截图本身就是base64编码，直接使用，不先解码再重新编码
+            screenshot = image_element.screenshot_as_base64
+            if screenshot:
+                return screenshot
         except Exception as e:
             if self.logger:
                 log_exception('ocr_processor', 'get_image_as_base64', e)
@@ -823,6 +1367,62 @@ class OCRProcessor:
         return None
 
 
+# 全局OCR处理器实例（模型只加载一次，供各模块共享）
+_ocr_processor = None
+_ocr_processor_lock = threading.Lock()
+
+# 后台写入图片文件的线程（首次保存时创建），单线程按提交顺序写入；
+# 解释器退出前线程池会先完成已提交的写入
+_image_writer = None
+_image_writer_lock = threading.Lock()
+
+# 验证码三种预处理并行执行的线程池（OpenCV运算期间释放GIL），所有OCR处理器共用，首次使用时创建
+_preprocess_executor = None
+_preprocess_executor_lock = threading.Lock()
+
+
+def _get_image_writer() -> ThreadPoolExecutor:
+    """
+    获取后台写入图片文件的线程池
+    
+    Returns:
+        单线程线程池
+    """
+    global _image_writer
+    with _image_writer_lock:
+        if _image_writer is None:
+            _image_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ocr-image-writer')
+    return _image_writer
+
+
+def _get_preprocess_executor() -> ThreadPoolExecutor:
+    """
+    获取验证码预处理线程池
+    
+    Returns:
+        三个线程的线程池
+    """
+    global _preprocess_executor
+    with _preprocess_executor_lock:
+        if _preprocess_executor is None:
+            _preprocess_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='captcha-preprocess')
+    return _preprocess_executor
+
+
+def get_ocr_processor() -> OCRProcessor:
+    """
+    获取全局OCR处理器实例
+    
+    Returns:
+        OCR处理器实例
+    """
+    global _ocr_processor
+    with _ocr_processor_lock:
+        if _ocr_processor is None:
+            _ocr_processor = OCRProcessor()
+    return _ocr_processor
+
+
 # 便捷函数
 def recognize_captcha(image_element: WebElement, max_attempts: int = 3) -> Optional[str]:
     """
@@ -835,7 +1435,7 @@ def recognize_captcha(image_element: WebElement, max_attempts: int = 3) -> Optio
     Returns:
         识别出的验证码，失败返回None
     """
-    processor = OCRProcessor()
+    processor = get_ocr_processor()
     return processor.recognize_captcha(image_element, max_attempts)
 
 
@@ -849,7 +1449,7 @@ def get_image_as_base64(image_element: WebElement) -> Optional[str]:
     Returns:
         base64编码字符串
     """
-    processor = OCRProcessor()
+    processor = get_ocr_processor()
     return processor.get_image_as_base64(image_element)
 
 
@@ -864,5 +1464,5 @@ def recognize_time_image(image_element: WebElement, max_attempts: int = 3) -> Op
     Returns:
         HH:MM格式的时间字符串，失败返回None
     """
-    processor = OCRProcessor()
-    return processor.recognize_time_image(image_element, max_attempts)
\ No newline at end of file
+    processor = get_ocr_processor()
+    return processor.recognize_time_image(image_element, max_attempts)
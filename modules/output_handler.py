@@ -8,6 +8,7 @@
 - 多航段数据整理
 - 统计信息生成
 - 文件保存和管理
+- 流式写入（边爬取边保存）
 """
 
 import os
@@ -16,12 +17,37 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 
 from .logger import get_logger, log_exception, log_flight_process
 from .config_manager import get_config_manager
 
 
+# 提取失败时写入字段的占位值，统计字段成功率时不计为成功
+_FAILED_FIELD_VALUES = frozenset(['识别失败', '元素未找到', '提取异常', '图片保存失败', ''])
+
+
+def _segment_sort_key(item: Dict[str, Any]) -> tuple:
+    """
+    航段的输出排序键：航班号、航段序号
+    
+    Args:
+        item: 清理后的航段数据
+        
+    Returns:
+        (航班号, 航段序号)
+    """
+    return item.get('flight_number', ''), item.get('segment_index', 0)
+
+
 class OutputHandler:
     """
     输出处理器
@@ -66,6 +92,10 @@ class OutputHandler:
             'flight_status': '航班状态',
             'created_time': '数据获取时间'
         }
+        
+        # 参与字段成功率统计的字段
+        self.check_fields = ['departure_airport', 'arrival_airport', 'scheduled_departure', 
+                             'scheduled_arrival', 'actual_departure', 'actual_arrival', 'flight_status']
     
     def save_flight_data(self, flight_data: List[Dict[str, Any]], 
                         filename: Optional[str] = None) -> Dict[str, Any]:
@@ -153,7 +183,7 @@ class OutputHandler:
             processed_data.append(processed_item)
         
         # 按航班号和航段序号排序
-        processed_data.sort(key=lambda x: (x.get('flight_number', ''), x.get('segment_index', 0)))
+        processed_data.sort(key=_segment_sort_key)
         
         return processed_data
     
@@ -332,75 +362,11 @@ class OutputHandler:
             统计信息字典
         """
         try:
-            if not data:
-                return {
-                    'total_segments': 0,
-                    'valid_segments': 0,
-                    'flights_count': 0,
-                    'success_rate': 0.0,
-                    'field_statistics': {}
-                }
-            
-            total_segments = len(data)
-            valid_segments = 0
-            flights = set()
-            
-            # 字段统计
-            field_stats = {}
-            check_fields = ['departure_airport', 'arrival_airport', 'scheduled_departure', 
-                          'scheduled_arrival', 'actual_departure', 'actual_arrival', 'flight_status']
-            
-            for field in check_fields:
-                field_stats[field] = {
-                    'total': 0,
-                    'success': 0,
-                    'success_rate': 0.0
-                }
-            
-            # 遍历数据统计
+            state = self._new_statistics_state()
             for item in data:
-                # 统计航班数
-                flight_key = f"{item.get('flight_number', '')}_{item.get('departure_date', '')}"
-                flights.add(flight_key)
-                
-                # 判断是否为有效航段
-                is_valid = bool(
-                    item.get('flight_number') and 
-                    item.get('departure_airport') and 
-                    item.get('arrival_airport')
-                )
-                
-                if is_valid:
-                    valid_segments += 1
-                
-                # 统计各字段
-                for field in check_fields:
-                    field_stats[field]['total'] += 1
-                    value = item.get(field, '')
-                    
-                    if value and value not in ['识别失败', '元素未找到', '提取异常', '图片保存失败', '']:
-                        field_stats[field]['success'] += 1
-            
-            # 计算成功率
-            success_rate = (valid_segments / total_segments * 100) if total_segments > 0 else 0
-            
-            # 计算字段成功率
-            for field in field_stats:
-                total = field_stats[field]['total']
-                success = field_stats[field]['success']
-                field_stats[field]['success_rate'] = (success / total * 100) if total > 0 else 0
+                self._update_statistics(state, item)
             
-            return {
-                'total_segments': total_segments,
-                'valid_segments': valid_segments,
-                'flights_count': len(flights),
-                'success_rate': round(success_rate, 2),
-                'field_statistics': {k: {
-                    'total': v['total'],
-                    'success': v['success'],
-                    'success_rate': round(v['success_rate'], 2)
-                } for k, v in field_stats.items()}
-            }
+            return self._finalize_statistics(state)
             
         except Exception as e:
             if self.logger:
@@ -414,6 +380,79 @@ class OutputHandler:
                 'field_statistics': {}
             }
     
+    def _new_statistics_state(self) -> Dict[str, Any]:
+        """
+        创建增量统计的初始状态
+        
+        Returns:
+            统计状态字典
+        """
+        return {
+            'total_segments': 0,
+            'valid_segments': 0,
+            'flights': set(),
+            'field_success': {field: 0 for field in self.check_fields}
+        }
+    
+    def _update_statistics(self, state: Dict[str, Any], item: Dict[str, Any]) -> None:
+        """
+        把单个航段计入统计状态
+        
+        Args:
+            state: 统计状态字典
+            item: 航段数据
+        """
+        state['total_segments'] += 1
+        
+        # 统计航班数
+        state['flights'].add(f"{item.get('flight_number', '')}_{item.get('departure_date', '')}")
+        
+        # 判断是否为有效航段
+        if item.get('flight_number') and item.get('departure_airport') and item.get('arrival_airport'):
+            state['valid_segments'] += 1
+        
+        # 统计各字段（值可能是非字符串，先判空再查集合）
+        field_success = state['field_success']
+        for field in self.check_fields:
+            value = item.get(field)
+            if value and (not isinstance(value, str) or value not in _FAILED_FIELD_VALUES):
+                field_success[field] += 1
+    
+    def _finalize_statistics(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        根据统计状态生成统计信息
+        
+        Args:
+            state: 统计状态字典
+            
+        Returns:
+            统计信息字典
+        """
+        total_segments = state['total_segments']
+        if total_segments == 0:
+            return {
+                'total_segments': 0,
+                'valid_segments': 0,
+                'flights_count': 0,
+                'success_rate': 0.0,
+                'field_statistics': {}
+            }
+        
+        valid_segments = state['valid_segments']
+        success_rate = valid_segments / total_segments * 100
+        
+        return {
+            'total_segments': total_segments,
+            'valid_segments': valid_segments,
+            'flights_count': len(state['flights']),
+            'success_rate': round(success_rate, 2),
+            'field_statistics': {field: {
+                'total': total_segments,
+                'success': success,
+                'success_rate': round(success / total_segments * 100, 2)
+            } for field, success in state['field_success'].items()}
+        }
+    
     def append_to_existing_file(self, flight_data: List[Dict[str, Any]], 
                                existing_file: str) -> Dict[str, Any]:
         """
@@ -544,6 +583,202 @@ class OutputHandler:
             }
 
 
+class FlightDataWriter:
+    """
+    流式航班数据写入器
+    
+    边爬取边把航段写入Excel，内存中只保留统计计数；xlsxwriter可用时使用
+    constant_memory模式，否则使用openpyxl的只写模式
+    """
+    
+    def __init__(self, handler: Optional[OutputHandler] = None, filename: Optional[str] = None):
+        """
+        初始化写入器
+        
+        Args:
+            handler: 输出处理器（提供输出目录、列定义和统计方法）
+            filename: 输出文件名（可选）
+        """
+        self.handler = handler or OutputHandler()
+        self.logger = self.handler.logger
+        
+        if not filename:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f'flight_data_{timestamp}.xlsx'
+        
+        self.file_path = os.path.join(self.handler.output_dir, filename)
+        self.columns = list(self.handler.excel_columns.keys())
+        self.row_count = 0
+        self.closed = False
+        
+        self._statistics = self.handler._new_statistics_state()
+        self._column_widths = [len(self.handler.excel_columns[col]) for col in self.columns]
+        self._workbook = None
+        self._worksheet = None
+        self._data_format = None
+        self._result = None
+    
+    def open(self) -> bool:
+        """
+        创建输出文件并写入标题行
+        
+        Returns:
+            是否成功
+        """
+        try:
+            headers = [self.handler.excel_columns[col] for col in self.columns]
+            
+            if XLSXWRITER_AVAILABLE:
+                self._workbook = xlsxwriter.Workbook(self.file_path, {'constant_memory': True})
+                self._worksheet = self._workbook.add_worksheet("航班数据")
+                
+                header_format = self._workbook.add_format({
+                    'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+                    'align': 'center', 'valign': 'vcenter', 'border': 1
+                })
+                self._data_format = self._workbook.add_format({
+                    'align': 'left', 'valign': 'vcenter', 'border': 1
+                })
+                self._worksheet.write_row(0, 0, headers, header_format)
+            else:
+                # 只写模式下列宽必须在写入数据前设置
+                self._workbook = Workbook(write_only=True)
+                self._worksheet = self._workbook.create_sheet("航班数据")
+                for col_index, width in enumerate(self._column_widths, 1):
+                    self._worksheet.column_dimensions[get_column_letter(col_index)].width = max(width * 2, 20)
+                
+                self._worksheet.append([
+                    self._styled_cell(header, header=True) for header in headers
+                ])
+            
+            if self.logger:
+                self.logger.info(f"开始写入航班数据到文件: {self.file_path}")
+            
+            return True
+            
+        except Exception as e:
+            if self.logger:
+                log_exception('output_handler', 'FlightDataWriter.open', e, {'file_path': self.file_path})
+            return False
+    
+    def _styled_cell(self, value: Any, header: bool = False) -> WriteOnlyCell:
+        """
+        创建带样式的只写单元格（openpyxl回退路径）
+        
+        Args:
+            value: 单元格值
+            header: 是否为标题行
+            
+        Returns:
+            只写单元格
+        """
+        cell = WriteOnlyCell(self._worksheet, value=value)
+        side = Side(style='thin')
+        cell.border = Border(left=side, right=side, top=side, bottom=side)
+        
+        if header:
+            cell.font = Font(bold=True, color="FFFFFF")
+            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+        else:
+            cell.alignment = Alignment(horizontal="left", vertical="center")
+        
+        return cell
+    
+    def write_segments(self, segments: List[Dict[str, Any]]) -> int:
+        """
+        写入一个航班的航段数据
+        
+        航段按航班号和航段序号排序后写入；各航班按调用顺序（即输入文件的顺序）写入，
+        不像save_flight_data那样在所有航班之间按航班号排序
+        
+        Args:
+            segments: 航段数据列表
+            
+        Returns:
+            写入的行数
+        """
+        items = sorted((self.handler._clean_data_item(segment) for segment in segments), key=_segment_sort_key)
+        
+        for item in items:
+            values = [item.get(col, '') for col in self.columns]
+            self.row_count += 1
+            
+            if XLSXWRITER_AVAILABLE:
+                self._worksheet.write_row(self.row_count, 0, values, self._data_format)
+                
+                for col_index, value in enumerate(values):
+                    length = len(str(value))
+                    if length > self._column_widths[col_index]:
+                        self._column_widths[col_index] = length
+            else:
+                self._worksheet.append([self._styled_cell(value) for value in values])
+            
+            self.handler._update_statistics(self._statistics, item)
+        
+        return len(segments)
+    
+    def close(self) -> Dict[str, Any]:
+        """
+        完成写入并关闭文件
+        
+        没有写入任何航段时删除空文件，结果格式与OutputHandler.save_flight_data一致
+        
+        Returns:
+            保存结果字典
+        """
+        if self.closed:
+            return self._result
+        
+        self.closed = True
+        
+        try:
+            if XLSXWRITER_AVAILABLE:
+                # 自动调整列宽，最大宽度50
+                for col_index, width in enumerate(self._column_widths):
+                    self._worksheet.set_column(col_index, col_index, min(width + 2, 50))
+                self._workbook.close()
+            else:
+                self._workbook.save(self.file_path)
+            
+            if self.row_count == 0:
+                os.remove(self.file_path)
+                self._result = {
+                    'success': False,
+                    'message': '没有数据需要保存',
+                    'file_path': None,
+                    'statistics': None
+                }
+                return self._result
+            
+            statistics = self.handler._finalize_statistics(self._statistics)
+            
+            if self.logger:
+                self.logger.info(f"航班数据保存成功: {self.file_path}")
+                self.logger.info(f"统计信息: 总航段 {statistics['total_segments']}，有效航段 {statistics['valid_segments']}")
+            
+            self._result = {
+                'success': True,
+                'message': '文件创建成功',
+                'file_path': self.file_path,
+                'row_count': self.row_count,
+                'statistics': statistics
+            }
+            
+        except Exception as e:
+            if self.logger:
+                log_exception('output_handler', 'FlightDataWriter.close', e, {'file_path': self.file_path})
+            
+            self._result = {
+                'success': False,
+                'message': f'Excel文件创建失败: {str(e)}',
+                'file_path': self.file_path,
+                'statistics': None
+            }
+        
+        return self._result
+
+
 # 便捷函数
 def save_flight_data(flight_data: List[Dict[str, Any]], filename: Optional[str] = None) -> Dict[str, Any]:
     """
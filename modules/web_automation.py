@@ -8,8 +8,10 @@
 - 表单填写和提交
 - 验证码处理（带重试机制）
 - 页面等待和状态检查
+- 浏览器实例池（多浏览器并发查询）
 """
 
+import asyncio
 import time
 import json
 from typing import Dict, Any, Optional, List
@@ -28,7 +30,23 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from .logger import get_logger, log_exception, log_flight_process
 from .config_manager import get_config_manager
-from .ocr_processor import OCRProcessor
+from .ocr_processor import get_ocr_processor
+
+
+# 清空查询表单输入框的脚本：按XPath定位输入框，清空值并触发input事件
+_RESET_FORM_SCRIPT = """
+var cleared = 0;
+arguments[0].forEach(function (xpath) {
+    var input = document.evaluate(xpath, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (input) {
+        input.value = '';
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        cleared += 1;
+    }
+});
+return cleared;
+"""
 
 
 class WebAutomation:
@@ -61,7 +79,13 @@ class WebAutomation:
         
         self.driver = None
         self.wait = None
-        self.ocr_processor = OCRProcessor()
+        self._waits: Dict[int, WebDriverWait] = {}
+        self.ocr_processor = get_ocr_processor()
+        
+        # 查询页面是否已加载（已加载时后续航班只重置表单，不重新导航）
+        self.query_page_ready = False
+        # 查询表单是否处于未填写状态（可直接填写下一个航班）
+        self.query_form_clean = False
         
         # 验证码重试统计
         self.captcha_retry_count = 0
@@ -104,8 +128,13 @@ class WebAutomation:
             # 自动下载ChromeDriver
             service = Service(ChromeDriverManager().install())
             
-            # 创建WebDriver实例
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # 创建WebDriver实例；keep_alive让每条WebDriver命令复用同一个HTTP连接，
+            # 每个实例同一时间只被一个线程使用，不需要更大的连接池
+            self.driver = webdriver.Chrome(
+                service=service,
+                options=chrome_options,
+                keep_alive=self.browser_config.get('keep_alive', True)
+            )
             
             # 设置超时时间
             timeout = self.browser_config.get('timeout', 30)
@@ -134,6 +163,9 @@ class WebAutomation:
                 self.driver.quit()
                 self.driver = None
                 self.wait = None
+                self._waits = {}
+                self.query_page_ready = False
+                self.query_form_clean = False
                 
                 if self.logger:
                     self.logger.info("浏览器已关闭")
@@ -706,11 +738,44 @@ class WebAutomation:
             元素对象，超时返回None
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            return wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+            return self._get_wait(timeout).until(EC.presence_of_element_located((By.XPATH, xpath)))
         except TimeoutException:
             return None
     
+    def wait_for_results(self, timeout: float = 10) -> bool:
+        """
+        等待查询结果列表出现
+        
+        元素出现即返回，代替固定时长的等待
+        
+        Args:
+            timeout: 最长等待时间（秒）
+            
+        Returns:
+            结果列表是否已出现
+        """
+        result_list_xpath = self.xpath_config.get('result_list')
+        if not result_list_xpath:
+            return False
+        
+        return self.wait_for_element(result_list_xpath, timeout) is not None
+    
+    def _get_wait(self, timeout: int) -> WebDriverWait:
+        """
+        获取指定超时时间的WebDriverWait（按超时时间缓存复用）
+        
+        Args:
+            timeout: 超时时间（秒）
+            
+        Returns:
+            WebDriverWait实例
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout)
+            self._waits[timeout] = wait
+        return wait
+    
     def is_element_present(self, xpath: str) -> bool:
         """
         检查元素是否存在
@@ -782,6 +847,9 @@ class WebAutomation:
             bool: 是否导航成功
         """
         try:
+            self.query_page_ready = False
+            self.query_form_clean = False
+            
             if self.logger:
                 self.logger.info("开始导航到查询页面")
             
@@ -797,6 +865,9 @@ class WebAutomation:
                     self.logger.error("点击航班号按钮失败")
                 return False
             
+            self.query_page_ready = True
+            self.query_form_clean = True
+            
             if self.logger:
                 self.logger.info("查询页面导航成功")
             
@@ -807,6 +878,82 @@ class WebAutomation:
                 log_exception('web_automation', 'navigate_to_query_page', e)
             return False
 
+    def is_on_query_page(self) -> bool:
+        """
+        检查浏览器是否仍停留在航班查询页面
+        
+        Returns:
+            当前URL是否属于查询页面
+        """
+        base_url = self.website_config.get('base_url', 'https://tool.133.cn/flight/')
+        return self.get_current_url().startswith(base_url)
+    
+    def prepare_query_page(self) -> bool:
+        """
+        让浏览器停在表单为空的查询页面上
+        
+        复用已加载的查询页面，首次查询或页面已跳转时才完整导航
+        
+        Returns:
+            bool: 是否准备成功
+        """
+        try:
+            if self.query_page_ready:
+                if self.is_on_query_page():
+                    if self.reset_query_form():
+                        return True
+                elif self.logger:
+                    self.logger.info(f"页面已离开查询页: {self.get_current_url()}，重新导航")
+            
+            return self.navigate_to_query_page()
+            
+        except Exception as e:
+            self.query_page_ready = False
+            if self.logger:
+                self.logger.error(f"准备查询页面时发生异常: {str(e)}")
+            return False
+    
+    def reset_query_form(self) -> bool:
+        """
+        在当前页面上重置查询表单，代替重新加载整个查询页面
+        
+        清空航班号、出发日期和验证码输入框，并刷新验证码图片
+        
+        Returns:
+            bool: 是否重置成功（页面未加载或输入框缺失时返回False）
+        """
+        try:
+            self.query_form_clean = False
+            
+            if not self.driver or not self.query_page_ready:
+                return False
+            
+            xpaths = [
+                self.xpath_config.get(name)
+                for name in ('flight_number_input', 'departure_date_input', 'captcha_input')
+                if self.xpath_config.get(name)
+            ]
+            
+            cleared = self.driver.execute_script(_RESET_FORM_SCRIPT, xpaths)
+            if cleared != len(xpaths):
+                if self.logger:
+                    self.logger.warning(f"查询表单重置不完整: {cleared}/{len(xpaths)}")
+                return False
+            
+            # 上一次查询已使用过当前验证码
+            self._refresh_captcha()
+            self.query_form_clean = True
+            
+            if self.logger:
+                self.logger.info("查询表单已重置")
+            
+            return True
+            
+        except Exception as e:
+            if self.logger:
+                log_exception('web_automation', 'reset_query_form', e)
+            return False
+
     def fill_query_form(self, flight_number: str, departure_date: str) -> bool:
         """
         填写查询表单（组合操作）
@@ -824,6 +971,8 @@ class WebAutomation:
             bool: 是否填写成功
         """
         try:
+            self.query_form_clean = False
+            
             if self.logger:
                 self.logger.info(f"开始填写查询表单: {flight_number}, {departure_date}")
             
@@ -926,6 +1075,101 @@ class WebAutomation:
                 self.logger.error(f"保存验证码图片失败: {str(e)}")
 
 
+class DriverPool:
+    """
+    浏览器实例池
+    
+    一次性预先启动多个持久化的WebAutomation实例，供并发的航班查询任务
+    轮流借用，避免每个航班重复启动和关闭浏览器
+    """
+    
+    def __init__(self, size: int, config: Optional[Dict[str, Any]] = None):
+        """
+        初始化浏览器实例池
+        
+        Args:
+            size: 期望的浏览器实例数量
+            config: 配置字典（传给create_web_automation）
+        """
+        self.logger = get_logger()
+        self.size = max(1, int(size))
+        self.config = config
+        self.workers: List[WebAutomation] = []
+        self._queue = None
+    
+    def start(self) -> int:
+        """
+        启动池中的所有浏览器实例
+        
+        Returns:
+            成功启动的浏览器数量
+        """
+        for worker_index in range(1, self.size + 1):
+            web_automation = create_web_automation(self.config)
+            
+            if web_automation.start_browser():
+                self.workers.append(web_automation)
+            elif self.logger:
+                self.logger.warning(f"浏览器实例 {worker_index}/{self.size} 启动失败")
+        
+        if self.logger:
+            self.logger.info(f"浏览器实例池启动完成: {len(self.workers)}/{self.size}")
+        
+        return len(self.workers)
+    
+    def bind_queue(self) -> None:
+        """
+        创建空闲实例队列（必须在事件循环内调用）
+        """
+        self._queue = asyncio.Queue()
+        for web_automation in self.workers:
+            self._queue.put_nowait(web_automation)
+    
+    async def acquire(self) -> WebAutomation:
+        """
+        借出一个空闲的浏览器实例，没有空闲实例时等待
+        
+        Returns:
+            WebAutomation实例
+        """
+        return await self._queue.get()
+    
+    def release(self, web_automation: WebAutomation) -> None:
+        """
+        归还浏览器实例
+        
+        Args:
+            web_automation: 借出的WebAutomation实例
+        """
+        self._queue.put_nowait(web_automation)
+    
+    def shrink(self, size: int) -> None:
+        """
+        关闭多出的浏览器实例（必须在bind_queue之前调用）
+        
+        Args:
+            size: 保留的实例数量，至少为1
+        """
+        size = max(1, size)
+        for web_automation in self.workers[size:]:
+            web_automation.close_browser()
+        
+        if len(self.workers) > size and self.logger:
+            self.logger.info(f"浏览器实例池缩减: {len(self.workers)} -> {size}")
+        
+        self.workers = self.workers[:size]
+    
+    def close(self) -> None:
+        """
+        关闭池中的所有浏览器实例
+        """
+        for web_automation in self.workers:
+            web_automation.close_browser()
+        
+        self.workers = []
+        self._queue = None
+
+
 # 便捷函数
 def create_web_automation(config: Optional[Dict[str, Any]] = None) -> WebAutomation:
     """
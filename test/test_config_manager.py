@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试配置管理器
+目标：用户配置叠加在默认配置上，各配置分组是可以直接序列化的普通字典
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.config_manager import ConfigManager
+
+
+def _create_manager(temp_dir: str, user_config=None) -> ConfigManager:
+    """
+    在临时目录中创建配置管理器（配置校验时创建的日志、输出目录也在临时目录中）
+    """
+    config_path = os.path.join(temp_dir, 'config.json')
+    if user_config is not None:
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(user_config, f)
+
+    current_dir = os.getcwd()
+    os.chdir(temp_dir)
+    try:
+        return ConfigManager(config_path)
+    finally:
+        os.chdir(current_dir)
+
+
+def test_user_config_overrides_defaults():
+    """测试用户配置覆盖默认配置，未配置的项使用默认值"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _create_manager(temp_dir, {'browser': {'headless': True}, 'retry': {'flight_delay': 5}})
+
+        assert manager.get('browser.headless') is True
+        assert manager.get('browser.timeout') == 30
+        assert manager.get('retry.flight_delay') == 5
+        assert manager.get('retry.captcha_max_attempts') == 6
+        assert manager.get('browser.missing', 'fallback') == 'fallback'
+        assert manager.retry.flight_delay == 5
+        assert manager.get_retry_config()['result_timeout'] == 10
+    print("✓ 用户配置覆盖默认配置")
+
+
+def test_sections_are_plain_dicts():
+    """测试各配置分组是普通字典，可以直接序列化"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _create_manager(temp_dir, {'browser': {'headless': True}})
+
+        browser_config = manager.get_browser_config()
+        assert type(browser_config) is dict
+        assert json.loads(json.dumps(browser_config))['headless'] is True
+        json.dumps(manager.get_all_config())
+    print("✓ 配置分组可以序列化")
+
+
+def test_get_all_config_returns_copy():
+    """测试get_all_config返回副本，修改副本不影响配置"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _create_manager(temp_dir, {})
+
+        all_config = manager.get_all_config()
+        all_config['browser']['timeout'] = 1
+        all_config['retry'] = {}
+
+        assert manager.get('browser.timeout') == 30
+        assert manager.get('retry.flight_delay') == 2
+    print("✓ get_all_config返回副本")
+
+
+def test_set_updates_sections_without_touching_defaults():
+    """测试set更新配置和属性访问对象，默认配置保持不变"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _create_manager(temp_dir, {})
+
+        manager.set('retry.flight_delay', 7)
+        assert manager.get('retry.flight_delay') == 7
+        assert manager.get_retry_config()['flight_delay'] == 7
+        assert manager.retry.flight_delay == 7
+        assert manager._default_config['retry']['flight_delay'] == 2
+
+        # 新的配置管理器不受影响
+        other = _create_manager(temp_dir, {})
+        assert other.get('retry.flight_delay') == 2
+    print("✓ set更新配置")
+
+
+def test_save_config_writes_user_layer():
+    """测试保存时只写入用户配置层"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _create_manager(temp_dir, {'browser': {'headless': True}})
+        manager.set('retry.flight_delay', 3)
+        manager.save_config()
+
+        with open(manager.config_path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved == {'browser': {'headless': True}, 'retry': {'flight_delay': 3}}
+    print("✓ 保存用户配置层")
+
+
+def test_missing_file_is_created_with_defaults():
+    """测试配置文件不存在时写入完整的默认配置"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = _create_manager(temp_dir)
+
+        with open(manager.config_path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved == manager._get_default_config()
+        assert manager.get_all_config() == saved
+    print("✓ 新建的配置文件包含默认配置")
+
+
+if __name__ == "__main__":
+    test_user_config_overrides_defaults()
+    test_sections_are_plain_dicts()
+    test_get_all_config_returns_copy()
+    test_set_updates_sections_without_touching_defaults()
+    test_save_config_writes_user_layer()
+    test_missing_file_is_created_with_defaults()
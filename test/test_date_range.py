@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试出发日期的范围校验和快速解析
+目标：日序号区间的判断结果与按(日期 - now).days判断一致，切片解析结果与strptime一致
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import input_handler
+from modules.input_handler import InputHandler, _date_ordinal_range, _parse_compact_date
+
+# 覆盖零点、零点后1微秒、午夜前、闰日和跨年的当前时间
+NOW_VALUES = [
+    datetime(2026, 10, 16),
+    datetime(2026, 10, 16, 0, 0, 0, 1),
+    datetime(2026, 10, 16, 12, 30),
+    datetime(2026, 10, 16, 23, 59, 59, 999999),
+    datetime(2024, 2, 29),
+    datetime(2024, 2, 29, 8, 0),
+    datetime(2025, 2, 28, 18, 0),
+    datetime(2025, 3, 1),
+    datetime(2026, 12, 31, 23, 0),
+    datetime(2027, 1, 1),
+]
+
+
+def _in_range_by_days(value: datetime, now: datetime) -> bool:
+    """基线的判断方式：与当前时间相差的天数在前后365天以内"""
+    return -365 <= (value - now).days <= 365
+
+
+def test_ordinal_range_matches_days_diff():
+    """测试零点日期的日序号判断与按天数差判断一致"""
+    for now in NOW_VALUES:
+        min_ordinal, max_ordinal = _date_ordinal_range(now)
+        start = datetime(now.year, now.month, now.day) - timedelta(days=400)
+
+        for offset in range(801):
+            value = start + timedelta(days=offset)
+            expected = _in_range_by_days(value, now)
+            assert (min_ordinal <= value.toordinal() <= max_ordinal) == expected, (now, value)
+    print("✓ 日序号区间与天数差判断一致")
+
+
+def test_ordinal_range_bounds():
+    """测试区间两端正好是允许的最早和最晚日期"""
+    for now in NOW_VALUES:
+        min_ordinal, max_ordinal = _date_ordinal_range(now)
+        assert _in_range_by_days(datetime.fromordinal(min_ordinal), now)
+        assert not _in_range_by_days(datetime.fromordinal(min_ordinal - 1), now)
+        assert _in_range_by_days(datetime.fromordinal(max_ordinal), now)
+        assert not _in_range_by_days(datetime.fromordinal(max_ordinal + 1), now)
+    print("✓ 日序号区间两端正确")
+
+
+def test_parse_compact_date_matches_strptime():
+    """测试切片解析与strptime的结果一致"""
+    samples = [
+        '2026-10-20', '2026/10/20', '20261020', '2024-02-29', '20240229',
+        '2025-02-29', '2026-13-01', '2026-00-10', '20261032', '2026-10/20',
+        '2026-1-05', '2026/1/5', '26-10-20', '2026.10.20', '2026-10-2a',
+        '２０２６１０２０', '2026-10-20 ', '0000-01-01', '99991231', '',
+    ]
+    formats = {10: ['%Y-%m-%d', '%Y/%m/%d'], 8: ['%Y%m%d']}
+
+    for sample in samples:
+        expected = None
+        is_zero_padded = sample.isascii() and sample.replace('-', '').replace('/', '').isdigit()
+        for date_format in formats.get(len(sample), []) if is_zero_padded else []:
+            try:
+                expected = datetime.strptime(sample, date_format)
+                break
+            except ValueError:
+                continue
+        assert _parse_compact_date(sample) == expected, sample
+    print("✓ 切片解析与strptime一致")
+
+
+def test_batch_validate_matches_row_validation():
+    """测试批量校验通过的行与逐行校验的结果一致（使用同一个日期范围）"""
+    if not input_handler.PANDAS_AVAILABLE:
+        print("pandas未安装，跳过")
+        return
+
+    now = datetime(2026, 10, 16, 12, 30)
+    date_range = _date_ordinal_range(now)
+    start = datetime(2025, 10, 1)
+
+    flight_numbers = []
+    departure_dates = []
+    for offset in range(800):
+        value = start + timedelta(days=offset)
+        flight_numbers.append('mu5100' if offset % 2 else 'CA1234')
+        departure_dates.append(value.strftime(['%Y-%m-%d', '%Y/%m/%d', '%Y%m%d', '%m/%d/%Y'][offset % 4]))
+
+    handler = InputHandler()
+    batch_results = handler._batch_validate(flight_numbers, departure_dates, date_range)
+
+    for row_index, (flight_number, departure_date, result) in enumerate(
+            zip(flight_numbers, departure_dates, batch_results)):
+        try:
+            expected = handler._clean_and_validate_date(departure_date, row_index, date_range)
+        except ValueError:
+            expected = None
+        if result is not None:
+            assert result == (flight_number.upper(), expected), (departure_date, result, expected)
+        else:
+            assert expected is None, departure_date
+    print("✓ 批量校验与逐行校验一致")
+
+
+if __name__ == "__main__":
+    test_ordinal_range_matches_days_diff()
+    test_ordinal_range_bounds()
+    test_parse_compact_date_matches_strptime()
+    test_batch_validate_matches_row_validation()
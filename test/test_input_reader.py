@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试输入Excel的读取路径
+目标：calamine读取结果、直接解析xlsx的读取结果都与openpyxl（data_only）一致
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, datetime, time, timedelta
+
+import openpyxl
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import input_handler
+from modules.input_handler import InputHandler
+
+
+def _future_date(days: int) -> datetime:
+    """
+    取今天之后若干天的零点时刻，保证落在允许的日期范围内
+    """
+    today = date.today() + timedelta(days=days)
+    return datetime(today.year, today.month, today.day)
+
+
+def _create_workbook(file_path: str) -> None:
+    """
+    生成覆盖各种单元格类型的测试工作簿
+    """
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = '航班'
+    worksheet.append(['航班号', '出发日期'])
+    worksheet.append(['MU5100', int(_future_date(3).strftime('%Y%m%d'))])
+    worksheet.append(['CA1234', _future_date(4)])
+    worksheet.append([None, None])
+    worksheet.append(['CZ3456', _future_date(5).strftime('%Y-%m-%d')])
+    worksheet.append(['G54381', _future_date(6).strftime('%Y/%m/%d')])
+    worksheet.append([1234, 1.5])
+    workbook.save(file_path)
+
+
+def _create_typed_workbook(file_path: str, epoch=None) -> None:
+    """
+    用openpyxl生成包含字符串、数字、日期、布尔值和空行的工作簿
+    
+    Args:
+        file_path: 保存路径
+        epoch: 日期基准，传入CALENDAR_MAC_1904时生成1904日期系统的工作簿
+    """
+    workbook = openpyxl.Workbook()
+    if epoch is not None:
+        workbook.epoch = epoch
+    worksheet = workbook.active
+    worksheet.title = '航班'
+    worksheet.append(['航班号', '出发日期', '备注'])
+    worksheet.append(['MU5100', 20261020, '只读取A、B两列'])
+    worksheet.append(['CA1234', datetime(2026, 10, 21)])
+    worksheet.append([None, None])
+    worksheet.append(['CZ3456', 1.5])
+    worksheet.append([True, False])
+    worksheet['A8'] = '跳过第7行'
+    worksheet['B8'] = date(2026, 10, 22)
+    worksheet['B9'] = datetime(2026, 10, 23, 12, 30)
+    worksheet['A10'] = datetime(1900, 2, 1)
+    worksheet['B10'] = time(8, 45)
+    worksheet.append(['MU5100', ''])
+    worksheet['C12'] = '最后一行只有C列'
+    workbook.save(file_path)
+
+
+def _create_xlsxwriter_workbook(file_path: str, options=None) -> None:
+    """
+    用xlsxwriter生成工作簿（自定义日期格式、公式缓存值，constant_memory模式下为行内字符串）
+    
+    Args:
+        file_path: 保存路径
+        options: xlsxwriter.Workbook的选项
+    """
+    workbook = xlsxwriter.Workbook(file_path, options or {})
+    worksheet = workbook.add_worksheet('Flights')
+    date_format = workbook.add_format({'num_format': 'yyyy"年"m"月"d"日"'})
+    number_format = workbook.add_format({'num_format': '0.00'})
+    worksheet.write_row(0, 0, ['航班号', '出发日期'])
+    worksheet.write_string(1, 0, 'MU5100')
+    worksheet.write_datetime(1, 1, datetime(2026, 10, 20), date_format)
+    worksheet.write_number(3, 0, 3)
+    worksheet.write_number(3, 1, 2.25, number_format)
+    worksheet.write_boolean(4, 0, True)
+    worksheet.write_formula(5, 0, '=1+1', None, 2)
+    worksheet.write_formula(5, 1, '="CA"&"1234"', None, 'CA1234')
+    worksheet.write_string(6, 2, '最后一行只有C列')
+    workbook.close()
+
+
+def _openpyxl_rows(file_path: str):
+    """
+    按基线方式用openpyxl读取A、B两列
+    """
+    workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+    try:
+        return workbook.active.title, [
+            tuple(row) for row in workbook.active.iter_rows(min_col=1, max_col=2, values_only=True)
+        ]
+    finally:
+        workbook.close()
+
+
+def _normalize_dates(rows):
+    """
+    calamine把日期单元格返回为date，openpyxl返回零点的datetime，比较前统一为date
+    """
+    return [
+        tuple(value.date() if isinstance(value, datetime) else value for value in row)
+        for row in rows
+    ]
+
+
+def test_calamine_matches_openpyxl():
+    """测试calamine读取的行数据与openpyxl一致"""
+    if not input_handler.CALAMINE_AVAILABLE:
+        print("python-calamine未安装，跳过")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, 'flights.xlsx')
+        _create_workbook(file_path)
+
+        handler = InputHandler()
+        sheet_name, rows = handler._load_sheet(file_path)
+        expected_name, expected_rows = _openpyxl_rows(file_path)
+
+        assert sheet_name == expected_name
+        assert _normalize_dates(rows) == _normalize_dates(expected_rows)
+        # 数字单元格保持int，不能变成"20261020.0"这样的字符串
+        assert isinstance(rows[1][1], int)
+        assert isinstance(rows[6][0], int)
+    print("✓ calamine与openpyxl读取结果一致")
+
+
+def test_xlsx_parser_matches_openpyxl():
+    """测试直接解析xlsx的结果与openpyxl一致（共享字符串、整数、小数、日期、布尔值、空行）"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for epoch in (None, CALENDAR_MAC_1904):
+            file_path = os.path.join(temp_dir, f'flights_{epoch is not None}.xlsx')
+            _create_typed_workbook(file_path, epoch)
+
+            handler = InputHandler()
+            sheet_name, rows = handler._load_xlsx_sheet(file_path)
+            expected_name, expected_rows = _openpyxl_rows(file_path)
+
+            assert sheet_name == expected_name
+            assert rows == expected_rows, (epoch, rows, expected_rows)
+            assert rows[2][1] == datetime(2026, 10, 21)
+            assert isinstance(rows[1][1], int)
+            assert rows[5] == (True, False)
+    print("✓ 直接解析xlsx与openpyxl读取结果一致")
+
+
+def test_xlsx_parser_matches_openpyxl_xlsxwriter():
+    """测试解析xlsxwriter生成的工作簿（自定义日期格式、公式缓存值、行内字符串）"""
+    if not XLSXWRITER_AVAILABLE:
+        print("xlsxwriter未安装，跳过")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for options in ({}, {'constant_memory': True}):
+            file_path = os.path.join(temp_dir, f'flights_{len(options)}.xlsx')
+            _create_xlsxwriter_workbook(file_path, options)
+
+            handler = InputHandler()
+            result = handler._load_xlsx_sheet(file_path)
+            expected = _openpyxl_rows(file_path)
+
+            assert result == expected, (options, result, expected)
+            assert result[1][1] == ('MU5100', datetime(2026, 10, 20))
+    print("✓ 直接解析xlsxwriter生成的工作簿与openpyxl一致")
+
+
+def test_numeric_compact_date_accepted():
+    """测试数字形式的YYYYMMDD日期在calamine路径下仍能通过校验"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, 'flights.xlsx')
+        _create_workbook(file_path)
+
+        handler = InputHandler()
+        flights = {item['flight_number']: item['departure_date']
+                   for item in handler.read_flight_data(file_path)}
+
+        assert flights['MU5100'] == _future_date(3).strftime('%Y-%m-%d')
+        assert flights['CA1234'] == _future_date(4).strftime('%Y-%m-%d')
+        assert flights['CZ3456'] == _future_date(5).strftime('%Y-%m-%d')
+        assert flights['G54381'] == _future_date(6).strftime('%Y-%m-%d')
+    print("✓ 数字日期20261020这类写法解析正确")
+
+
+if __name__ == "__main__":
+    test_calamine_matches_openpyxl()
+    test_xlsx_parser_matches_openpyxl()
+    test_xlsx_parser_matches_openpyxl_xlsxwriter()
+    test_numeric_compact_date_accepted()
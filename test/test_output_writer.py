@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试流式输出写入器
+目标：航段写入顺序和统计信息与一次性保存（save_flight_data）一致
+"""
+
+import os
+import sys
+import tempfile
+
+import openpyxl
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import output_handler
+from modules.output_handler import OutputHandler, FlightDataWriter
+
+
+def _segment(flight_number: str, segment_index, departure_airport='PEK', arrival_airport='SHA',
+             actual_departure='08:30', actual_arrival='识别失败'):
+    """构造航段数据"""
+    return {
+        'flight_number': flight_number,
+        'departure_date': '2026-10-20',
+        'segment_index': segment_index,
+        'departure_airport': departure_airport,
+        'arrival_airport': arrival_airport,
+        'scheduled_departure': '08:00',
+        'scheduled_arrival': '10:00',
+        'actual_departure': actual_departure,
+        'actual_arrival': actual_arrival,
+        'flight_status': None,
+        'created_time': '2026-10-16 12:00:00',
+    }
+
+
+# 按输入顺序完成的两个航班，航段顺序被打乱
+FLIGHTS = [
+    [_segment('MU5100', 2, arrival_airport=''), _segment('MU5100', '1')],
+    [_segment('CA1234', 1, actual_departure=''), _segment('CA1234', 3), _segment('CA1234', 2)],
+]
+
+
+def _write_and_read(temp_dir: str):
+    """用流式写入器写出所有航班，返回写入结果和读回的(航班号, 航段序号)列表"""
+    handler = OutputHandler({'output': {'directory': temp_dir}})
+    writer = FlightDataWriter(handler, 'flights.xlsx')
+    assert writer.open()
+    for segments in FLIGHTS:
+        writer.write_segments(segments)
+    result = writer.close()
+    assert result['success'], result['message']
+
+    workbook = openpyxl.load_workbook(result['file_path'], read_only=True)
+    try:
+        rows = [(row[0], row[2]) for row in workbook.active.iter_rows(min_row=2, values_only=True)]
+    finally:
+        workbook.close()
+    return handler, result, rows
+
+
+def _check_writer():
+    """检查当前写入路径的行顺序和统计信息"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        handler, result, rows = _write_and_read(temp_dir)
+
+        # 航班之间保持输入顺序，航班内按航段序号排序
+        assert rows == [('MU5100', 1), ('MU5100', 2), ('CA1234', 1), ('CA1234', 2), ('CA1234', 3)]
+        assert result['row_count'] == 5
+
+        # 增量统计与一次性统计结果一致
+        all_segments = [segment for segments in FLIGHTS for segment in segments]
+        expected = handler._generate_statistics(handler._preprocess_data(all_segments))
+        assert result['statistics'] == expected
+
+        statistics = result['statistics']
+        assert statistics['total_segments'] == 5
+        assert statistics['valid_segments'] == 4
+        assert statistics['flights_count'] == 2
+        assert statistics['success_rate'] == 80.0
+        assert statistics['field_statistics']['actual_departure']['success'] == 4
+        assert statistics['field_statistics']['actual_arrival']['success'] == 0
+        assert statistics['field_statistics']['flight_status']['success'] == 0
+
+
+def test_writer_xlsxwriter():
+    """测试xlsxwriter写入路径"""
+    if not output_handler.XLSXWRITER_AVAILABLE:
+        print("xlsxwriter未安装，跳过")
+        return
+    _check_writer()
+    print("✓ xlsxwriter写入顺序和统计正确")
+
+
+def test_writer_openpyxl():
+    """测试openpyxl只写模式的回退路径"""
+    available = output_handler.XLSXWRITER_AVAILABLE
+    output_handler.XLSXWRITER_AVAILABLE = False
+    try:
+        _check_writer()
+    finally:
+        output_handler.XLSXWRITER_AVAILABLE = available
+    print("✓ openpyxl写入顺序和统计正确")
+
+
+def test_empty_writer_removes_file():
+    """测试没有写入航段时删除空文件"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        handler = OutputHandler({'output': {'directory': temp_dir}})
+        writer = FlightDataWriter(handler, 'empty.xlsx')
+        assert writer.open()
+        result = writer.close()
+
+        assert not result['success']
+        assert not os.path.exists(writer.file_path)
+    print("✓ 空文件已删除")
+
+
+if __name__ == "__main__":
+    test_writer_xlsxwriter()
+    test_writer_openpyxl()
+    test_empty_writer_removes_file()
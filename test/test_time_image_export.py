@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试批量读取的时间图片与元素截图一致
+目标：canvas导出的图片经过合成后，交给OCR的像素与output/timeimage下的元素截图相同
+"""
+
+import glob
+import io
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.data_extractor import _flatten_png, _BULK_SCRAPE_SCRIPT
+from modules.ocr_processor import _decode_gray
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_IMAGES = sorted(glob.glob(os.path.join(PROJECT_ROOT, 'output', 'timeimage', '*.png')))
+
+
+def _to_png(image: Image.Image) -> bytes:
+    """把PIL图片编码为PNG数据"""
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _canvas_exports(screenshot: Image.Image):
+    """
+    模拟canvas导出的两种PNG：
+    白色背景上绘制的不透明图片，以及背景透明、透明像素颜色为黑色的图片
+    """
+    pixels = np.asarray(screenshot.convert('RGB'))
+    opaque = np.dstack([pixels, np.full(pixels.shape[:2], 255, dtype=np.uint8)])
+
+    transparent = opaque.copy()
+    background = (pixels == 255).all(axis=2)
+    transparent[background] = 0
+
+    return _to_png(Image.fromarray(opaque, 'RGBA')), _to_png(Image.fromarray(transparent, 'RGBA'))
+
+
+def test_canvas_export_matches_screenshot():
+    """测试合成后的canvas导出与元素截图的像素和OCR灰度输入一致"""
+    assert SAMPLE_IMAGES, "缺少output/timeimage下的时间图片样本"
+
+    for sample_path in SAMPLE_IMAGES:
+        with open(sample_path, 'rb') as f:
+            screenshot_data = f.read()
+        screenshot = Image.open(io.BytesIO(screenshot_data))
+        expected_rgb = np.asarray(screenshot.convert('RGB'))
+        expected_gray = np.asarray(screenshot.convert('L'))
+
+        for canvas_data in _canvas_exports(screenshot):
+            flattened = Image.open(io.BytesIO(_flatten_png(canvas_data)))
+
+            # ddddocr接收的是RGB图片，转灰度的方式与截图相同
+            assert flattened.mode == 'RGB', sample_path
+            assert flattened.size == screenshot.size, sample_path
+            assert np.array_equal(np.asarray(flattened), expected_rgb), sample_path
+            assert np.array_equal(np.asarray(flattened.convert('L')), expected_gray), sample_path
+
+            # Tesseract/PaddleOCR预处理使用的灰度图同样一致
+            assert np.array_equal(_decode_gray(_flatten_png(canvas_data)),
+                                  _decode_gray(screenshot_data)), sample_path
+    print(f"✓ {len(SAMPLE_IMAGES)} 张样本的canvas导出与截图一致")
+
+
+def test_rgb_screenshot_unchanged():
+    """测试没有透明通道的图片原样返回"""
+    for sample_path in SAMPLE_IMAGES:
+        with open(sample_path, 'rb') as f:
+            screenshot_data = f.read()
+        assert _flatten_png(screenshot_data) == screenshot_data
+    print("✓ RGB图片原样返回")
+
+
+def test_script_draws_rendered_size_on_white():
+    """测试批量读取脚本按显示尺寸在白色背景上绘制"""
+    assert 'getBoundingClientRect' in _BULK_SCRAPE_SCRIPT
+    assert 'devicePixelRatio' in _BULK_SCRAPE_SCRIPT
+    assert "fillStyle = '#ffffff'" in _BULK_SCRAPE_SCRIPT
+    assert 'drawImage(node, 0, 0, width, height)' in _BULK_SCRAPE_SCRIPT
+    print("✓ 批量读取脚本按显示尺寸绘制")
+
+
+if __name__ == "__main__":
+    test_canvas_export_matches_screenshot()
+    test_rgb_screenshot_unchanged()
+    test_script_draws_rendered_size_on_white()